@@ -603,6 +603,8 @@ nan_policy_stack = []
 dynamic_backend_stack = []
 warn_to_regex = {"all": "!.*", "ivy_only": "^(?!.*ivy).*$", "none": ".*"}
 cython_wrappers_stack = []
+fused_dispatch_stack = []
+instrumentation_stack = []
 
 # local
 import threading
@@ -810,6 +812,8 @@ try:
     from .compiler.compiler import source_to_source, transpile, trace_graph, unify
 except:  # noqa: E722
     pass  # Added for the finally statement
+from .compiler.replay import trace_replay
+
 try:
     from .compiler.replace_with import replace_with, transform_function
 except:  # noqa: E722
@@ -975,6 +979,8 @@ globals_vars = GlobalsDict(
         "nan_policy_stack": nan_policy_stack,
         "dynamic_backend_stack": dynamic_backend_stack,
         "cython_wrappers_stack": cython_wrappers_stack,
+        "fused_dispatch_stack": fused_dispatch_stack,
+        "instrumentation_stack": instrumentation_stack,
     }
 )
 
@@ -1212,6 +1218,129 @@ def set_cython_wrappers_mode(flag: bool = True) -> None:
     ivy.__setattr__("cython_wrappers_mode", flag, True)
 
 
+# Fused dispatch
+
+ivy.fused_dispatch_mode = fused_dispatch_stack[-1] if fused_dispatch_stack else False
+
+
+@handle_exceptions
+def set_fused_dispatch_mode(flag: bool = True) -> None:
+    """Set the mode of whether wrapped functions should take the fused fast
+    path when all inputs are plain arrays, instead of running the full chain of
+    function wrappers.
+
+    Parameter
+    ---------
+    flag
+        boolean whether to use the fused fast path for wrapped functions
+
+    Examples
+    --------
+    >>> ivy.set_fused_dispatch_mode(True)
+    >>> ivy.fused_dispatch_mode
+    True
+
+    >>> ivy.set_fused_dispatch_mode(False)
+    >>> ivy.fused_dispatch_mode
+    False
+    """
+    global fused_dispatch_stack
+    if flag not in [True, False]:
+        raise ValueError("fused_dispatch_mode must be a boolean value (True or False)")
+    fused_dispatch_stack.append(flag)
+    ivy.__setattr__("fused_dispatch_mode", flag, True)
+
+
+@handle_exceptions
+def unset_fused_dispatch_mode() -> None:
+    """Reset the mode of whether wrapped functions should take the fused
+    fast path to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_fused_dispatch_mode(True)
+    >>> ivy.fused_dispatch_mode
+    True
+
+    >>> ivy.unset_fused_dispatch_mode()
+    >>> ivy.fused_dispatch_mode
+    False
+    """
+    global fused_dispatch_stack
+    if fused_dispatch_stack:
+        fused_dispatch_stack.pop(-1)
+        flag = fused_dispatch_stack[-1] if fused_dispatch_stack else False
+        ivy.__setattr__("fused_dispatch_mode", flag, True)
+
+
+# Instrumentation
+
+ivy.instrumentation_mode = instrumentation_stack[-1] if instrumentation_stack else False
+
+
+def _reinstall_backend_functions():
+    # (un)install the instrumentation hooks of the functions of the current backend
+    if ivy.backend_stack:
+        with ivy.locks["backend_setter"]:
+            ivy.utils.backend.handler._set_backend_namespace(ivy.backend_stack[-1])
+
+
+@handle_exceptions
+def set_instrumentation_mode(flag: bool = True) -> None:
+    """Set the mode of whether the calls of the functions of the backend
+    should be recorded in `ivy.utils.instrumentation`, with their wall time,
+    the time spent in the backend implementation, the shapes and dtypes of the
+    inputs and the size of the outputs.
+
+    The functions are only wrapped with the instrumentation hooks while the
+    mode is set, so it costs nothing otherwise.
+
+    Parameter
+    ---------
+    flag
+        boolean whether to record the calls of the functions
+
+    Examples
+    --------
+    >>> ivy.set_instrumentation_mode(True)
+    >>> ivy.instrumentation_mode
+    True
+
+    >>> ivy.set_instrumentation_mode(False)
+    >>> ivy.instrumentation_mode
+    False
+    """
+    global instrumentation_stack
+    if flag not in [True, False]:
+        raise ValueError("instrumentation_mode must be a boolean value (True or False)")
+    instrumentation_stack.append(flag)
+    ivy.__setattr__("instrumentation_mode", flag, True)
+    _reinstall_backend_functions()
+
+
+@handle_exceptions
+def unset_instrumentation_mode() -> None:
+    """Reset the mode of whether the calls of the functions of the backend
+    should be recorded to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_instrumentation_mode(True)
+    >>> ivy.instrumentation_mode
+    True
+
+    >>> ivy.unset_instrumentation_mode()
+    >>> ivy.instrumentation_mode
+    False
+    """
+    global instrumentation_stack
+    if instrumentation_stack:
+        instrumentation_stack.pop(-1)
+        flag = instrumentation_stack[-1] if instrumentation_stack else False
+        ivy.__setattr__("instrumentation_mode", flag, True)
+        _reinstall_backend_functions()
+
+
 # Context Managers
 
 
@@ -1485,6 +1614,8 @@ GLOBAL_PROPS = [
     "default_complex_dtype",
     "default_uint_dtype",
     "cython_wrappers_mode",
+    "fused_dispatch_mode",
+    "instrumentation_mode",
 ]
 
 
@@ -1540,7 +1671,7 @@ class LoggingMode:
 class IvyWithGlobalProps(sys.modules[__name__].__class__):
     def __setattr__(self, name, value, internal=False):
         previous_frame = inspect.currentframe().f_back
-        filename = inspect.getframeinfo(previous_frame)[0]
+        filename = previous_frame.f_code.co_filename
         internal = internal and _is_from_internal(filename)
         if not internal and name in GLOBAL_PROPS:
             raise ivy.utils.exceptions.IvyException(
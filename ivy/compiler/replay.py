@@ -0,0 +1,350 @@
+"""Trace-once, replay-many execution of eager ivy functions.
+
+`trace_replay` records the calls of the backend implementations made by a
+function for the shapes and dtypes of its array inputs, and replays them
+directly against the native backend on the next calls with the same signature,
+skipping ivy's function wrappers and the python logic of the function in
+between. Unlike `ivy.trace_graph`, it is pure python and doesn't need the
+compiler binaries.
+
+Only the array inputs vary between replays, everything else the function
+depends on is frozen at trace time: the values of its other arguments (which
+are part of the signature), the arrays it closes over and its control flow,
+which hence mustn't depend on the values of the arrays.
+"""
+
+import contextlib
+import functools
+from types import FunctionType
+from typing import Callable, Mapping, Optional, Sequence
+
+import ivy
+from ivy import func_wrapper
+from ivy.utils.backend import handler
+
+
+class _Ref:
+    """Reference to the native array in slot `slot` of a tape, passed on as
+    an `ivy.Array` if `as_ivy`."""
+
+    __slots__ = ("slot", "as_ivy")
+
+    def __init__(self, slot, as_ivy=False):
+        self.slot = slot
+        self.as_ivy = as_ivy
+
+
+def _is_array(x):
+    return isinstance(x, (ivy.Array, ivy.NativeArray))
+
+
+def _native(x):
+    return x.data if isinstance(x, ivy.Array) else x
+
+
+def _flatten(nest, leaves):
+    """Append the leaves of `nest`, nested in lists, tuples and dicts, to
+    `leaves`."""
+    if isinstance(nest, (list, tuple)):
+        for x in nest:
+            _flatten(x, leaves)
+    elif isinstance(nest, dict):
+        for x in nest.values():
+            _flatten(x, leaves)
+    else:
+        leaves.append(nest)
+    return leaves
+
+
+def _map_leaves(fn, nest):
+    if isinstance(nest, (list, tuple)):
+        ret = [_map_leaves(fn, x) for x in nest]
+        if isinstance(nest, list):
+            return ret
+        # namedtuples take their fields as separate arguments
+        return type(nest)(*ret) if hasattr(nest, "_fields") else type(nest)(ret)
+    if isinstance(nest, dict):
+        return {k: _map_leaves(fn, x) for k, x in nest.items()}
+    return fn(nest)
+
+
+def _signature(args, kwargs):
+    """Return the leaves of the inputs and the key of their signature, made of
+    the types, shapes and dtypes of the arrays, which of them are the same
+    array, and the values of the other leaves."""
+    leaves = _flatten(args, [])
+    n_args = len(leaves)
+    _flatten(kwargs, leaves)
+    first_seen = {}
+    key = [ivy.current_backend_str(), n_args, tuple(kwargs)]
+    for i, x in enumerate(leaves):
+        if _is_array(x):
+            native = _native(x)
+            first = first_seen.setdefault(id(native), i)
+            key.append((type(x), tuple(native.shape), native.dtype, first))
+            continue
+        try:
+            hash(x)
+        except TypeError:
+            x = id(x)
+        key.append((type(x), x))
+    return leaves, tuple(key)
+
+
+class _Op:
+    """A recorded call of a backend implementation."""
+
+    __slots__ = ("fn", "args", "kwargs", "arg_refs", "nested", "out", "in_place")
+
+    def __init__(self, fn, args, kwargs, out, in_place):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        # slot of the returned native array, or slot (or None for the leaves which
+        # aren't arrays) of each leaf of the returned nest
+        self.out = out
+        # whether the call updates some arrays in place, in which case it is
+        # replayed even if none of the outputs are used
+        self.in_place = in_place
+        refs = [x for x in _flatten((args, kwargs), []) if isinstance(x, _Ref)]
+        top_level = [
+            (i, x.slot)
+            for i, x in enumerate(args)
+            if isinstance(x, _Ref) and not x.as_ivy
+        ]
+        # the arguments only need to be walked when some references aren't
+        # plain positional arguments
+        self.nested = len(top_level) != len(refs)
+        self.arg_refs = top_level
+
+    def slots(self):
+        leaves = _flatten((self.args, self.kwargs), [])
+        return {x.slot for x in leaves if isinstance(x, _Ref)}
+
+    def out_slots(self):
+        if isinstance(self.out, int):
+            return {self.out}
+        return {slot for slot in self.out if slot is not None}
+
+
+class _Tape:
+    """The calls of the backend implementations made by a function for one
+    signature of its inputs."""
+
+    def __init__(self, leaves):
+        self.ops = []
+        self.n_slots = 0
+        self.output = None
+        # slots of the native arrays seen while tracing, by id
+        self._slots = {}
+        # all the arrays seen while tracing, kept alive so their ids are unique
+        self._alive = []
+        self._depth = 0
+        self.input_slots = []
+        for i, x in enumerate(leaves):
+            if _is_array(x):
+                native = _native(x)
+                if id(native) not in self._slots:
+                    self.input_slots.append((i, self._new_slot(native)))
+
+    def _new_slot(self, native):
+        slot = self.n_slots
+        self.n_slots += 1
+        self._slots[id(native)] = slot
+        self._alive.append(native)
+        return slot
+
+    def _to_template(self, x):
+        if _is_array(x):
+            slot = self._slots.get(id(_native(x)))
+            if slot is not None:
+                return _Ref(slot, as_ivy=isinstance(x, ivy.Array))
+        return x
+
+    def record(self, name, fn, args, kwargs):
+        """Call `fn`, the backend implementation of `name`, and record the
+        call unless it is made from within another recorded call."""
+        leaves = _flatten((args, kwargs), [])
+        # functions taking callables, such as `handle_soft_device_variable`, call
+        # back into other ivy functions, the calls of which are recorded instead
+        if self._depth or any(isinstance(x, FunctionType) for x in leaves):
+            return fn(*args, **kwargs)
+        self._depth += 1
+        try:
+            ret = fn(*args, **kwargs)
+        finally:
+            self._depth -= 1
+        input_ids = {id(_native(x)) for x in leaves if _is_array(x)}
+        in_place = name.startswith("inplace_") or _is_array(kwargs.get("out"))
+        if isinstance(ret, ivy.NativeArray) and id(ret) in input_ids and not in_place:
+            # the call returns its input as is, e.g. `to_device` to the device the
+            # input is already on, so it doesn't need to be replayed
+            return ret
+        template_args = _map_leaves(self._to_template, list(args))
+        template_kwargs = _map_leaves(self._to_template, kwargs)
+        if isinstance(ret, ivy.NativeArray):
+            out = self._new_slot(ret)
+        else:
+            out = [
+                self._new_slot(_native(x)) if _is_array(x) else None
+                for x in _flatten(ret, [])
+            ]
+        self.ops.append(_Op(fn, template_args, template_kwargs, out, in_place))
+        return ret
+
+    def finish(self, ret):
+        """Set the output of the tape from the return `ret` of the traced
+        function, and drop the calls it doesn't depend on."""
+        self.output = _map_leaves(self._to_template, ret)
+        needed = {x.slot for x in _flatten(self.output, []) if isinstance(x, _Ref)}
+        ops = []
+        for op in reversed(self.ops):
+            if op.in_place or op.out_slots() & needed:
+                needed |= op.slots()
+                ops.append(op)
+        self.ops = ops[::-1]
+        self._slots = self._alive = None
+
+    def replay(self, leaves):
+        values = [None] * self.n_slots
+        for i, slot in self.input_slots:
+            values[slot] = _native(leaves[i])
+
+        def fill(x):
+            if isinstance(x, _Ref):
+                native = values[x.slot]
+                return ivy.Array(native) if x.as_ivy else native
+            return x
+
+        for op in self.ops:
+            if op.nested:
+                ret = op.fn(*_map_leaves(fill, op.args), **_map_leaves(fill, op.kwargs))
+            else:
+                args = op.args.copy()
+                for i, slot in op.arg_refs:
+                    args[i] = values[slot]
+                ret = op.fn(*args, **op.kwargs)
+            out = op.out
+            if isinstance(out, int):
+                values[out] = ret
+            else:
+                for slot, x in zip(out, _flatten(ret, [])):
+                    if slot is not None:
+                        values[slot] = _native(x)
+        return _map_leaves(fill, self.output)
+
+
+@contextlib.contextmanager
+def _recording(tape, backend):
+    """Pass the calls of the backend implementations to `tape` while in the
+    context."""
+    # the wrapped functions of the ivy namespace always pass the calls of their
+    # backend implementation to the tracer, those called directly from the backend
+    # module, e.g. by compositional functions, are hooked in the module itself
+    patched = {
+        k: v
+        for k, v in backend.__dict__.items()
+        if isinstance(v, FunctionType)
+        and k in handler.ivy_original_dict
+        and v.__module__.startswith(backend.__name__)
+    }
+    func_wrapper._native_call_tracer = tape.record
+    try:
+        for k, v in patched.items():
+            backend.__dict__[k] = func_wrapper._trace_native_call(k, v)
+        yield
+    finally:
+        backend.__dict__.update(patched)
+        func_wrapper._native_call_tracer = None
+
+
+class ReplayGraph:
+    """A function which is traced once per signature of its inputs, and then
+    replayed against the native backend.
+
+    Created with `ivy.trace_replay`.
+    """
+
+    def __init__(self, fn: Callable):
+        functools.update_wrapper(self, fn)
+        self._fn = fn
+        self._tapes = {}
+
+    def __call__(self, *args, **kwargs):
+        # the calls made while replaying wouldn't be seen by an enclosing trace
+        if func_wrapper._native_call_tracer is not None:
+            return self._fn(*args, **kwargs)
+        leaves, key = _signature(args, kwargs)
+        tape = self._tapes.get(key)
+        if tape is not None:
+            return tape.replay(leaves)
+        tape = _Tape(leaves)
+        with _recording(tape, ivy.current_backend(*leaves)):
+            ret = self._fn(*args, **kwargs)
+        tape.finish(ret)
+        self._tapes[key] = tape
+        return ret
+
+    @property
+    def num_traces(self) -> int:
+        """Number of signatures of the inputs the function has been traced
+        for."""
+        return len(self._tapes)
+
+    def num_ops(self, *args, **kwargs) -> Optional[int]:
+        """Number of backend calls replayed for the signature of the given
+        inputs, or None if the function hasn't been traced for it."""
+        tape = self._tapes.get(_signature(args, kwargs)[1])
+        return None if tape is None else len(tape.ops)
+
+    def clear(self) -> None:
+        """Discard the traces of all signatures."""
+        self._tapes.clear()
+
+
+def trace_replay(
+    fn: Callable,
+    /,
+    *,
+    args: Optional[Sequence] = None,
+    kwargs: Optional[Mapping] = None,
+) -> ReplayGraph:
+    """Trace the calls of the backend implementations made by `fn`, and
+    replay them directly against the native backend on the next calls with
+    inputs of the same shapes and dtypes.
+
+    `fn` is traced again for every new signature of its inputs, made of the
+    shapes and dtypes of the arrays and the values of the other arguments. The
+    arrays `fn` closes over and its python control flow are frozen at trace
+    time, so the control flow mustn't depend on the values of the arrays.
+
+    Parameters
+    ----------
+    fn
+        function to trace, which takes and returns (nests of) arrays.
+    args
+        positional arguments to trace `fn` with eagerly.
+    kwargs
+        keyword arguments to trace `fn` with eagerly.
+
+    Returns
+    -------
+    ret
+        the traced function.
+
+    Examples
+    --------
+    >>> ivy.set_backend("torch")
+    >>> def fn(x, y):
+    ...     return ivy.sum(ivy.sin(x) * y, axis=0) + 1
+    >>> x, y = ivy.array([[1., 2.], [3., 4.]]), ivy.array([1., -1.])
+    >>> graph = ivy.trace_replay(fn, args=(x, y))
+    >>> graph.num_ops(x, y)
+    4
+    >>> graph(x * 2, y)
+    ivy.array([1.6298819 , 0.76744425])
+    """
+    graph = ReplayGraph(fn)
+    if args is not None or kwargs is not None:
+        graph(*ivy.default(args, ()), **ivy.default(kwargs, {}))
+    return graph
@@ -10,6 +10,8 @@ import ivy
 
 
 class _ArrayWithActivations(abc.ABC):
+    __slots__ = ()
+
     def relu(
         self: ivy.Array,
         /,
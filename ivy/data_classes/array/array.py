@@ -6,6 +6,7 @@ from typing import Optional
 
 # local
 import ivy
+from ivy.utils.backend.handler import _register_dynamic_backend_array
 from .conversions import args_to_native, to_ivy
 from .activations import _ArrayWithActivations
 from .creation import _ArrayWithCreation
@@ -92,60 +93,47 @@ class Array(
     _ArrayWithStatisticalExperimental,
     _ArrayWithUtilityExperimental,
 ):
+    # the core attributes live in slots, so wrapping a native array is just a few
+    # attribute stores, __dict__ is kept for any other attributes set on arrays
+    __slots__ = (
+        "_data",
+        "_size",
+        "_strides",
+        "_itemsize",
+        "_dtype",
+        "_device",
+        "_dev_str",
+        "_pre_repr",
+        "_post_repr",
+        "_backend",
+        "_dynamic_backend",
+        "weak_type",
+        "_base",
+        "_view_refs",
+        "_manipulation_stack",
+        "_torch_base",
+        "_torch_view_refs",
+        "_torch_manipulation",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(self, data, dynamic_backend=None):
-        _ArrayWithActivations.__init__(self)
-        _ArrayWithCreation.__init__(self)
-        _ArrayWithDataTypes.__init__(self)
-        _ArrayWithDevice.__init__(self)
-        _ArrayWithElementwise.__init__(self)
-        _ArrayWithGeneral.__init__(self)
-        _ArrayWithGradients.__init__(self)
-        _ArrayWithImage.__init__(self)
-        _ArrayWithLayers.__init__(self)
-        _ArrayWithLinearAlgebra.__init__(self)
-        _ArrayWithLosses.__init__(self)
-        _ArrayWithManipulation.__init__(self)
-        _ArrayWithNorms.__init__(self)
-        _ArrayWithRandom.__init__(self)
-        _ArrayWithSearching.__init__(self)
-        _ArrayWithSet.__init__(self)
-        _ArrayWithSorting.__init__(self)
-        _ArrayWithStatistical.__init__(self)
-        _ArrayWithUtility.__init__(self)
-        _ArrayWithActivationsExperimental.__init__(self),
-        _ArrayWithConversionsExperimental.__init__(self),
-        _ArrayWithCreationExperimental.__init__(self),
-        _ArrayWithData_typeExperimental.__init__(self),
-        _ArrayWithDeviceExperimental.__init__(self),
-        _ArrayWithElementWiseExperimental.__init__(self),
-        _ArrayWithGeneralExperimental.__init__(self),
-        _ArrayWithGradientsExperimental.__init__(self),
-        _ArrayWithImageExperimental.__init__(self),
-        _ArrayWithLayersExperimental.__init__(self),
-        _ArrayWithLinearAlgebraExperimental.__init__(self),
-        _ArrayWithLossesExperimental.__init__(self),
-        _ArrayWithManipulationExperimental.__init__(self),
-        _ArrayWithNormsExperimental.__init__(self),
-        _ArrayWithRandomExperimental.__init__(self),
-        _ArrayWithSearchingExperimental.__init__(self),
-        _ArrayWithSetExperimental.__init__(self),
-        _ArrayWithSortingExperimental.__init__(self),
-        _ArrayWithStatisticalExperimental.__init__(self),
-        _ArrayWithUtilityExperimental.__init__(self),
+        self._dynamic_backend = False
         self._init(data, dynamic_backend)
         self._view_attributes(data)
 
     def _init(self, data, dynamic_backend=None):
-        if ivy.is_ivy_array(data):
-            self._data = data.data
+        # the common case of wrapping a native array of the current backend
+        # is checked first, without going through the wrapped ivy functions
+        if isinstance(data, ivy.NativeArray):
+            self._data = data
+        elif isinstance(data, ivy.Array):
+            self._data = data._data
         elif ivy.is_native_array(data):
             self._data = data
-        elif isinstance(data, np.ndarray):
-            self._data = ivy.asarray(data)._data
-        elif isinstance(data, (list, tuple)):
+        elif isinstance(data, (np.ndarray, list, tuple)):
             self._data = ivy.asarray(data)._data
-        elif ivy.is_ivy_sparse_array(data):
-            self._data = data._data
         elif ivy.is_native_sparse_array(data):
             self._data = data._data
         else:
@@ -161,10 +149,11 @@ class Array(
         self._pre_repr = None
         self._post_repr = None
         self._backend = ivy.current_backend(self._data).backend
-        if dynamic_backend is not None:
-            self._dynamic_backend = dynamic_backend
-        else:
-            self._dynamic_backend = ivy.dynamic_backend
+        if dynamic_backend is None:
+            dynamic_backend = ivy.dynamic_backend
+        if dynamic_backend and not self._dynamic_backend:
+            _register_dynamic_backend_array(self)
+        self._dynamic_backend = dynamic_backend
         self.weak_type = False  # to handle 0-D jax front weak typed arrays
 
     def _view_attributes(self, data):
@@ -209,6 +198,8 @@ class Array(
         else:
             self._backend = _get_backend_for_arg(self.data.__class__.__module__).backend
 
+        if value and not self._dynamic_backend:
+            _register_dynamic_backend_array(self)
         self._dynamic_backend = value
 
     @property
@@ -414,9 +405,6 @@ class Array(
     def __dir__(self):
         return self._data.__dir__()
 
-    def __getattribute__(self, item):
-        return super().__getattribute__(item)
-
     def __getattr__(self, item):
         try:
             attr = self._data.__getattribute__(item)
@@ -459,7 +447,11 @@ class Array(
         ivy_array = ivy.array(state["data"])
         ivy.previous_backend()
 
-        self.__dict__ = ivy_array.__dict__
+        for attr in Array.__slots__[:-2]:
+            setattr(self, attr, getattr(ivy_array, attr))
+        self.__dict__.update(ivy_array.__dict__)
+        if self._dynamic_backend:
+            _register_dynamic_backend_array(self)
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
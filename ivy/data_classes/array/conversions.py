@@ -120,7 +120,9 @@ def _to_native(x: Any, inplace: bool = False, to_ignore: tuple = ()) -> Any:
 
 
 def _to_ivy(x: Any) -> Any:
-    if isinstance(x, ivy.Array):
+    if isinstance(x, ivy.NativeArray):
+        return ivy.Array(x)
+    elif isinstance(x, ivy.Array):
         return x
     elif isinstance(x, ivy.NativeShape):
         return ivy.Shape(x)
@@ -162,7 +164,8 @@ def to_ivy(
     ret
         the input in its native framework form in the case of ivy.Array or instances.
     """
-    if nested:
+    # a single native array, the common return of an op, needs no traversal
+    if nested and not isinstance(x, ivy.NativeArray):
         return ivy.nested_map(_to_ivy, x, include_derived, shallow=False)
     return _to_ivy(x)
 
@@ -8,6 +8,8 @@ import ivy
 
 # noinspection PyUnresolvedReferences
 class _ArrayWithElementwise(abc.ABC):
+    __slots__ = ()
+
     def abs(
         self: Union[float, ivy.Array, ivy.NativeArray],
         /,
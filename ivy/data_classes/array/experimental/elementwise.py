@@ -8,6 +8,8 @@ import ivy
 
 
 class _ArrayWithElementWiseExperimental(abc.ABC):
+    __slots__ = ()
+
     def amax(
         self: ivy.Array,
         /,
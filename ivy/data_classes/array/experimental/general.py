@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithGeneralExperimental(abc.ABC):
+    __slots__ = ()
+
     def reduce(
         self: ivy.Array,
         init_value: Union[int, float],
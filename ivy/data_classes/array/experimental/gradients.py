@@ -3,4 +3,4 @@ import abc
 
 
 class _ArrayWithGradientsExperimental(abc.ABC):
-    pass
+    __slots__ = ()
@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithLossesExperimental(abc.ABC):
+    __slots__ = ()
+
     def l1_loss(
         self: Union[ivy.Array, ivy.NativeArray],
         target: Union[ivy.Array, ivy.NativeArray],
@@ -19,6 +19,8 @@ from ivy import handle_view
 
 
 class _ArrayWithManipulationExperimental(abc.ABC):
+    __slots__ = ()
+
     @handle_view
     def moveaxis(
         self: ivy.Array,
@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithNormsExperimental(abc.ABC):
+    __slots__ = ()
+
     def l1_normalize(
         self: ivy.Array,
         axis: Optional[Union[int, Tuple[int, ...]]] = None,
@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithUtilityExperimental(abc.ABC):
+    __slots__ = ()
+
     def optional_get_element(
         self: Optional[ivy.Array] = None,
         /,
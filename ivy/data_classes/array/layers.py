@@ -12,6 +12,8 @@ import ivy
 
 
 class _ArrayWithLayers(abc.ABC):
+    __slots__ = ()
+
     def linear(
         self: ivy.Array,
         weight: Union[ivy.Array, ivy.NativeArray],
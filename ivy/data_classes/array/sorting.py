@@ -8,6 +8,8 @@ import ivy
 
 
 class _ArrayWithSorting(abc.ABC):
+    __slots__ = ()
+
     def argsort(
         self: ivy.Array,
         /,
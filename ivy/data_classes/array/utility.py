@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithUtility(abc.ABC):
+    __slots__ = ()
+
     def all(
         self: ivy.Array,
         /,
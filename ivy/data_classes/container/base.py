@@ -32,6 +32,59 @@ import ivy
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
+def _h5_leaf_option(option, key):
+    if isinstance(option, dict):
+        return option.get(key)
+    return option
+
+
+class _LazyH5Dataset:
+    """Proxy to an h5py dataset, which is only read from disk when indexed or
+    materialized."""
+
+    def __init__(self, dataset, slice_obj=slice(None), ivyh=None):
+        self._dataset = dataset
+        self._slice_obj = slice_obj
+        self._ivyh = ivy.default(ivyh, ivy)
+
+    @property
+    def shape(self):
+        shape = self._dataset.shape
+        if self._slice_obj == slice(None):
+            return tuple(shape)
+        return (len(range(*self._slice_obj.indices(shape[0]))),) + tuple(shape[1:])
+
+    @property
+    def dtype(self):
+        return str(self._dataset.dtype)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, query):
+        if self._slice_obj == slice(None):
+            return self._ivyh.asarray(self._dataset[query])
+        return self._ivyh.asarray(self._dataset[self._slice_obj][query])
+
+    def __repr__(self):
+        return (
+            f"<lazy h5py dataset {self._dataset.name!r}, shape {self.shape}, "
+            f"dtype {self.dtype}>"
+        )
+
+    def materialize(self):
+        return self._ivyh.asarray(self._dataset[self._slice_obj])
+
+
+def _materialized_leaf(cont, key, value):
+    """Return the leaf `value` of `cont` at `key`, read from disk and stored
+    in `cont` in place of the proxy if it's a lazy h5py dataset."""
+    if isinstance(value, _LazyH5Dataset):
+        value = value.materialize()
+        dict.__setitem__(cont, key, value)
+    return value
+
+
 def _is_jsonable(x):
     try:
         json.dumps(x)
@@ -47,6 +100,102 @@ def _repr(x):
         return str(x)
 
 
+def _flat_structure(cont, key_chain, key_chains):
+    """Return the structure of `cont`, as its keys, the structure of the
+    sub-container at each key (None for the leaves) and whether the keys are
+    sorted, and append the key chains of its leaves to `key_chains`."""
+    subs = []
+    for key, value in cont.items():
+        this_key_chain = key if key_chain == "" else f"{str(key_chain)}/{str(key)}"
+        if isinstance(value, ivy.Container):
+            subs.append(_flat_structure(value, this_key_chain, key_chains))
+        else:
+            subs.append(None)
+            key_chains.append(this_key_chain)
+    keys = tuple(cont.keys())
+    try:
+        keys_sorted = list(keys) == sorted(keys)
+    except TypeError:
+        keys_sorted = False
+    return keys, tuple(subs), keys_sorted
+
+
+def _flat_leaves(cont, structure, leaves, nodes):
+    """Append the leaves and the sub-containers of `cont` to `leaves` and
+    `nodes` in depth first order, and return whether `cont` has the structure
+    `structure`."""
+    keys, subs, _ = structure
+    if tuple(cont.keys()) != keys:
+        return False
+    nodes.append(cont)
+    for (key, value), sub in zip(cont.items(), subs):
+        if sub is None:
+            if isinstance(value, ivy.Container):
+                return False
+            leaves.append(_materialized_leaf(cont, key, value))
+        elif not isinstance(value, ivy.Container) or not _flat_leaves(
+            value, sub, leaves, nodes
+        ):
+            return False
+    return True
+
+
+def _flat_rebuild(structure, leaves, nodes, config=None, prune_empty=False):
+    """Build a container with the structure `structure` from its leaves, with
+    the config of the corresponding sub-container in `nodes` unless `config` is
+    given."""
+    leaves = iter(leaves)
+    nodes = iter(nodes)
+    dict_types = tuple([dict] + ivy.container_types())
+    # an empty container built with each config, the attributes of which are
+    # copied into the new sub-containers rather than running the constructor for
+    # each of them, by the identities of the values of the config, which is
+    # usually shared by all the sub-containers
+    templates = {}
+
+    def _container(keys_sorted, values, config):
+        config_id = tuple((k, id(v)) for k, v in config.items())
+        template = templates.get(config_id)
+        if template is None:
+            template = templates[config_id] = ivy.Container(**config)
+        if (
+            template._rebuild_child_containers
+            or template._types_to_iteratively_nest
+            or (template._alphabetical_keys and not keys_sorted)
+            or any(
+                isinstance(x, dict_types) and not isinstance(x, ivy.Container)
+                for x in values.values()
+            )
+        ):
+            # the constructor would rebuild, nest or reorder some of the values
+            return ivy.Container(values, **config)
+        ret = dict.__new__(type(template))
+        # each container owns its config and queue dicts, as when it's constructed
+        ret.__dict__.update(
+            {
+                k: v.copy() if isinstance(v, dict) else v
+                for k, v in template.__dict__.items()
+            }
+        )
+        dict.update(ret, values)
+        return ret
+
+    def _build(structure):
+        keys, subs, keys_sorted = structure
+        node_config = next(nodes).cont_config if config is None else config
+        ret = {}
+        for key, sub in zip(keys, subs):
+            if sub is None:
+                ret[key] = next(leaves)
+                continue
+            value = _build(sub)
+            if value or not prune_empty:
+                ret[key] = value
+        return _container(keys_sorted, ret, node_config)
+
+    return _build(structure)
+
+
 # noinspection PyMissingConstructor
 
 
@@ -688,6 +837,12 @@ class ContainerBase(dict, abc.ABC):
         -------
             Container
         """
+        if key_chain == "" and not prune_unapplied:
+            ret = ivy.Container._cont_flat_multi_map(
+                func, containers, key_chains, to_apply, config, map_nests
+            )
+            if ret is not None:
+                return ret
         # retrieve all keys and the first container if it exists
         keys = set([])
         container0 = None
@@ -775,6 +930,56 @@ class ContainerBase(dict, abc.ABC):
             # noinspection PyProtectedMember
         return ivy.Container(return_dict, **config)
 
+    @staticmethod
+    def _cont_flat_multi_map(func, containers, key_chains, to_apply, config, map_nests):
+        """Map `func` over the leaves of containers which all have the same
+        structure as a loop over their flat lists of leaves, or return None if
+        the containers don't have the same structure."""
+        container0 = None
+        for cont in containers:
+            # sequences among the inputs are indexed by the keys of the containers
+            if isinstance(cont, (list, tuple)):
+                return None
+            if container0 is None and isinstance(cont, ivy.Container):
+                container0 = cont
+        if container0 is None:
+            return None
+        leaves0, nodes, structure, all_key_chains = container0._cont_flat_view()
+        columns = []
+        for cont in containers:
+            if cont is container0:
+                columns.append(leaves0)
+            elif isinstance(cont, ivy.Container):
+                leaves = []
+                if not _flat_leaves(cont, structure, leaves, []):
+                    return None
+                columns.append(leaves)
+            else:
+                columns.append([cont] * len(leaves0))
+        rows = list(zip(*columns))
+        if map_nests and any(isinstance(x, (list, tuple)) for row in rows for x in row):
+            return None
+        if key_chains is None:
+            leaves = [func(list(row), kc) for row, kc in zip(rows, all_key_chains)]
+        else:
+            leaves = [
+                (
+                    func(list(row), kc)
+                    if any(kc.startswith(k) for k in key_chains) == bool(to_apply)
+                    else row[0]
+                )
+                for row, kc in zip(rows, all_key_chains)
+            ]
+        # as in the recursive mapping, the empty sub-containers are dropped when
+        # all the inputs are containers, and kept when mapped with other values
+        return _flat_rebuild(
+            structure,
+            leaves,
+            nodes,
+            ivy.default(config, container0.cont_config),
+            prune_empty=all(isinstance(cont, ivy.Container) for cont in containers),
+        )
+
     @staticmethod
     def cont_common_key_chains(containers):
         """Return the key-chains common across all containers.
@@ -1125,11 +1330,18 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
     ):
         """Load container object from disk, as an h5py file, at the specified
         hdf5 filepath.
 
+        Each dataset is read into a numpy array which is handed directly to the
+        backend, without copying where the backend allows it.
+
         Parameters
         ----------
         h5_obj_or_filepath
@@ -1142,6 +1354,13 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to defer reading the datasets from disk. If ``True``, the leaves
+            of the returned container are proxies to the h5py datasets, which are only
+            read when the leaf is first accessed by key, mapped over or iterated over,
+            and of which only the requested rows are read when the container is
+            sliced. The h5 file is kept
+            open for as long as the proxies are in use. Default is ``False``.
 
         Returns
         -------
@@ -1163,16 +1382,22 @@ class ContainerBase(dict, abc.ABC):
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value,
+                    slice_obj,
+                    alphabetical_keys=alphabetical_keys,
+                    ivyh=ivyh,
+                    lazy=lazy,
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
-                )
+                container_dict[key] = _LazyH5Dataset(value, slice_obj, ivyh)
+                if not lazy:
+                    container_dict[key] = container_dict[key].materialize()
             else:
                 raise ivy.utils.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
+        if isinstance(h5_obj_or_filepath, str) and not lazy:
+            h5_obj.close()
         return ivy.Container(container_dict, ivyh=ivyh)
 
     @staticmethod
@@ -1981,24 +2206,52 @@ class ContainerBase(dict, abc.ABC):
             raise ValueError("Unsupported format")
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=None,
+        compression=None,
+        compression_opts=None,
+        resize=False,
     ):
         """Save container object to disk, as an h5py file, at the specified
         filepath.
 
+        Each leaf is written to its dataset as a single contiguous slab, rather
+        than row by row.
+
         Parameters
         ----------
         h5_obj_or_filepath
             Filepath for where to save the container to disk, or h5 object.
         starting_index
             Batch index for which to start writing to file, if it already exists
-            (Default value = 0)
+            (Default value = 0). If ``None``, each leaf is appended to the end of its
+            existing dataset, after the rows written so far, and the datasets are
+            resized to fit, which allows for streaming batches to disk.
         mode
             H5 read/write mode for writing to disk, ['r', 'r+', 'w', 'w-', 'a'],
             default is 'a'.
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            Chunk shape for newly created datasets, or ``True`` for h5py's automatic
+            chunking. Can also be a dict or container with the same structure as
+            this container, to set the chunk shape per leaf. (Default value = None)
+        compression
+            Compression filter for newly created datasets, such as ``"gzip"`` or
+            ``"lzf"``. Can also be set per leaf with a dict or container.
+            (Default value = None)
+        compression_opts
+            Options for the compression filter, such as the gzip level. Can also be
+            set per leaf with a dict or container. (Default value = None)
+        resize
+            Whether to grow the existing datasets along the batch axis if the
+            container does not fit, rather than only writing the rows which fit.
+            (Default value = False)
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -2018,29 +2271,57 @@ class ContainerBase(dict, abc.ABC):
                 else:
                     h5_group = h5_obj[key]
                 value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+                    h5_group,
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    _h5_leaf_option(chunks, key),
+                    _h5_leaf_option(compression, key),
+                    _h5_leaf_option(compression_opts, key),
+                    resize,
                 )
+                continue
+            value_as_np = self._cont_ivy.to_numpy(value)
+            value_shape = value_as_np.shape
+            this_batch_size = value_shape[0]
+            if starting_index is None:
+                # the datasets may have been created with more rows than written,
+                # so the end of the written rows is tracked in an attribute
+                start = 0
+                if key in h5_obj.keys():
+                    dataset = h5_obj[key]
+                    start = int(dataset.attrs.get("num_rows", dataset.shape[0]))
+                grow = True
             else:
-                value_as_np = self._cont_ivy.to_numpy(value)
-                value_shape = value_as_np.shape
-                this_batch_size = value_shape[0]
-                max_bs = (
-                    max_batch_size
-                    if max_batch_size
-                    else starting_index + this_batch_size
+                start = starting_index
+                grow = resize
+            max_bs = max_batch_size if max_batch_size else start + this_batch_size
+            if key not in h5_obj.keys():
+                dataset_shape = [max_bs] + list(value_shape[1:])
+                maxshape = [None for _ in dataset_shape]
+                h5_obj.create_dataset(
+                    key,
+                    dataset_shape,
+                    dtype=value_as_np.dtype,
+                    maxshape=maxshape,
+                    chunks=_h5_leaf_option(chunks, key),
+                    compression=_h5_leaf_option(compression, key),
+                    compression_opts=_h5_leaf_option(compression_opts, key),
                 )
-                if key not in h5_obj.keys():
-                    dataset_shape = [max_bs] + list(value_shape[1:])
-                    maxshape = [None for _ in dataset_shape]
-                    h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
-                    )
-                space_left = max_bs - starting_index
-                amount_to_write = min(this_batch_size, space_left)
-                for i in range(amount_to_write):
-                    h5_obj[key][starting_index + i : starting_index + i + 1] = (
-                        value_as_np[i : i + 1]
-                    )
+            dataset = h5_obj[key]
+            if grow:
+                amount_to_write = this_batch_size
+                if dataset.shape[0] < start + amount_to_write:
+                    dataset.resize(start + amount_to_write, axis=0)
+            else:
+                amount_to_write = min(this_batch_size, max_bs - start)
+            if amount_to_write > 0:
+                dataset[start : start + amount_to_write] = value_as_np[:amount_to_write]
+                dataset.attrs["num_rows"] = max(
+                    int(dataset.attrs.get("num_rows", 0)), start + amount_to_write
+                )
+        if isinstance(h5_obj_or_filepath, str):
+            h5_obj.close()
 
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """Save container object to disk, as an pickled file, at the specified
@@ -2155,7 +2436,7 @@ class ContainerBase(dict, abc.ABC):
             if isinstance(value, ivy.Container) and (not include_empty or value):
                 yield from value.cont_to_iterator(kc, leaf_keys_only, include_empty)
             else:
-                yield kc, value
+                yield kc, _materialized_leaf(self, key, value)
 
     def cont_to_iterator_values(self, include_empty=False):
         """
@@ -2170,12 +2451,12 @@ class ContainerBase(dict, abc.ABC):
             Iterator for the container values.
 
         """
-        for value in self.values():
+        for key, value in self.items():
             if isinstance(value, ivy.Container) and (not include_empty or value):
                 # noinspection PyCompatibility
                 yield from value.cont_to_iterator_values(include_empty)
             else:
-                yield value
+                yield _materialized_leaf(self, key, value)
 
     def cont_to_iterator_keys(
         self, key_chain="", leaf_keys_only=False, include_empty=False
@@ -3137,6 +3418,24 @@ class ContainerBase(dict, abc.ABC):
     def __deepcopy__(self, memo):
         return self.cont_deep_copy()
 
+    def _cont_flat_view(self):
+        """Return the leaves and the sub-containers of the container in depth
+        first order, its structure and the key chains of its leaves.
+
+        The structure is cached on the container and reused by the next maps
+        over it, as long as the container still has it, which is checked while
+        gathering the leaves.
+        """
+        cached = self.__dict__.get("_flat_structure")
+        leaves, nodes = [], []
+        if cached is None or not _flat_leaves(self, cached[0], leaves, nodes):
+            key_chains = []
+            cached = (_flat_structure(self, "", key_chains), key_chains)
+            self._flat_structure = cached
+            leaves, nodes = [], []
+            _flat_leaves(self, cached[0], leaves, nodes)
+        return leaves, nodes, cached[0], cached[1]
+
     def cont_map(
         self,
         func,
@@ -3174,6 +3473,23 @@ class ContainerBase(dict, abc.ABC):
         -------
             New container following the function mapped to each sub-array.
         """
+        if key_chain == "" and not inplace and not prune_unapplied:
+            leaves, nodes, structure, all_key_chains = self._cont_flat_view()
+            if not map_sequences or not any(
+                isinstance(x, (list, tuple)) for x in leaves
+            ):
+                if key_chains is None:
+                    leaves = [func(x, kc) for x, kc in zip(leaves, all_key_chains)]
+                else:
+                    leaves = [
+                        func(x, kc) if (kc in key_chains) == bool(to_apply) else x
+                        for x, kc in zip(leaves, all_key_chains)
+                    ]
+                ret = _flat_rebuild(structure, leaves, nodes)
+                # the mapped container has the same structure, cached for the maps
+                # over it
+                ret._flat_structure = (structure, all_key_chains)
+                return ret
         return_dict = self if inplace else {}
         for key, value in self.items():
             this_key_chain = key if key_chain == "" else f"{str(key_chain)}/{str(key)}"
@@ -3207,6 +3523,7 @@ class ContainerBase(dict, abc.ABC):
                             continue
                         return_dict[key] = value
                         continue
+                value = _materialized_leaf(self, key, value)
                 return_dict[key] = func(value, this_key_chain)
         if inplace:
             return self
@@ -3929,7 +4246,7 @@ class ContainerBase(dict, abc.ABC):
     # noinspection PyProtectedMember
     def __getattr__(self, item, *args, **kwargs):
         try:
-            ret = dict.__getitem__(self, item)
+            ret = _materialized_leaf(self, item, dict.__getitem__(self, item))
         except KeyError:
             # noinspection PyUnresolvedReferences
             ret = ivy.Container()
@@ -4014,8 +4331,7 @@ class ContainerBase(dict, abc.ABC):
             if "/" in query or "." in query:
                 ret = self.cont_at_key_chain(query)
                 return ret
-            ret = dict.__getitem__(self, query)
-            return ret
+            return _materialized_leaf(self, query, dict.__getitem__(self, query))
         elif ivy.exists(self._queues):
             ret = self._get_queue_item(query)
             return ret
@@ -1,6 +1,7 @@
 # global
 import abc
-from typing import List, Tuple
+import itertools
+from typing import Callable, List, Tuple
 
 # local
 import ivy
@@ -9,25 +10,100 @@ import ivy
 class NestedArrayBase(abc.ABC):
     """Base class for nested array objects."""
 
-    def __init__(self, data, nested_rank, inner_shape, dtype, device, internal=False):
+    def __init__(
+        self,
+        data,
+        nested_rank,
+        inner_shape,
+        dtype,
+        device,
+        internal=False,
+        row_splits=None,
+    ):
         if not internal:
             raise RuntimeError(
                 "NestedArray is an abstract class "
                 "and should not be instantiated directly."
                 "Please use one of the factory methods instead"
             )
-        self._data = data
+        # the rows are packed into the values of the outermost ragged dimension,
+        # which are themselves a nested array if there are more ragged dimensions,
+        # and the offsets of the rows in these values
+        if row_splits is None and nested_rank > 0:
+            data, row_splits = self._pack(data, nested_rank, inner_shape, dtype, device)
+        self._values = data
+        self._row_splits = row_splits
         self._nested_rank = nested_rank
         self._inner_shape = inner_shape
-        self._shape = [len(self._data)] + [None] * self._nested_rank + self._inner_shape
+        self._shape = [self.nrows] + [None] * self._nested_rank + self._inner_shape
         self._dtype = dtype
         self._device = device
         self._pre_repr = "ivy.NestedArray"
+        self._row_splits_list = None
+        self._data = None
+
+    @classmethod
+    def _pack(cls, rows, nested_rank, inner_shape, dtype, device):
+        """Pack the rows of a nested list of arrays into flat values and row
+        splits."""
+        if nested_rank > 1:
+            row_lengths = [len(row) for row in rows]
+            values = cls(
+                [item for row in rows for item in row],
+                nested_rank - 1,
+                inner_shape,
+                dtype,
+                device,
+                internal=True,
+            )
+        else:
+            row_lengths = [row.shape[0] for row in rows]
+            values = (
+                ivy.concat(rows, axis=0)
+                if rows
+                else ivy.zeros([0] + list(inner_shape), dtype=dtype, device=device)
+            )
+        row_splits = ivy.array(
+            [0] + list(itertools.accumulate(row_lengths)),
+            dtype=ivy.int64,
+            device=device,
+        )
+        return values, row_splits
+
+    @classmethod
+    def _from_values(cls, values, row_splits):
+        """Create a nested array whose outermost ragged dimension partitions
+        ``values`` into the rows delimited by ``row_splits``."""
+        if isinstance(values, NestedArrayBase):
+            nested_rank = values.nested_rank + 1
+        else:
+            nested_rank = 1
+        return cls(
+            values,
+            nested_rank,
+            list(values.shape[nested_rank:]),
+            values.dtype,
+            values.device,
+            internal=True,
+            row_splits=row_splits,
+        )
 
     @classmethod
     def nested_array(
         cls, data, nested_rank=None, inner_shape=None, dtype=None, device=None
     ):
+        if isinstance(data, cls):
+            if (nested_rank is None or nested_rank == data.nested_rank) and (
+                inner_shape is None or list(inner_shape) == data.inner_shape
+            ):
+                return data
+            nested_rank = nested_rank if nested_rank is not None else data.nested_rank
+            inner_shape = (
+                list(inner_shape) if inner_shape is not None else data.inner_shape
+            )
+            dtype = dtype if dtype is not None else data.dtype
+            device = device if device is not None else data.device
+            data = data.data
         dtype = ivy.default_dtype(dtype=dtype, item=data)
         device = ivy.default_device(device, item=data)
 
@@ -46,7 +122,7 @@ class NestedArrayBase(abc.ABC):
             elif (
                 isinstance(x, (list, tuple))
                 and len(x) != 0
-                and isinstance(x[0], (list, tuple))
+                and (isinstance(x[0], (list, tuple)) or ivy.is_array(x[0]))
             ):
                 depth_ret = None
                 for i, item in enumerate(x):
@@ -89,12 +165,6 @@ class NestedArrayBase(abc.ABC):
             inner_shape = (
                 list(inner_shape) if inner_shape is not None else default_inner_shape
             )
-        elif isinstance(data, cls):
-            data = data._data
-            nested_rank = nested_rank if nested_rank is not None else data.nested_rank
-            inner_shape = (
-                list(inner_shape) if list(inner_shape) is not None else data.inner_shape
-            )
         else:
             raise TypeError(f"Input data must be pylist or tuple, got: {type(data)}")
 
@@ -102,6 +172,18 @@ class NestedArrayBase(abc.ABC):
 
     @staticmethod
     def ragged_multi_map_in_function(fn, *args, **kwargs):
+        return NestedArrayBase._multi_map_in_function(fn, args, kwargs)
+
+    @staticmethod
+    def _elementwise_multi_map_in_function(fn, *args, **kwargs):
+        """Map the elementwise function ``fn`` over the nested arrays, with a
+        single call on their flat values when they're partitioned alike."""
+        return NestedArrayBase._multi_map_in_function(
+            fn, args, kwargs, elementwise=True
+        )
+
+    @staticmethod
+    def _multi_map_in_function(fn, args, kwargs, elementwise=False):
         arg_nest_idxs = ivy.nested_argwhere(
             args, ivy.is_ivy_nested_array, to_ignore=ivy.NestedArray
         )
@@ -131,6 +213,15 @@ class NestedArrayBase(abc.ABC):
             raise ValueError(
                 f"No RaggedArrays found in args or kwargs of function {fn}"
             )
+        if elementwise and all(
+            nests[0]._same_row_partition(nest) for nest in nests[1:]
+        ):
+            # the function is applied to all the rows at once through the flat
+            # values, which line up as the nested arrays are partitioned alike.
+            # Other functions, such as cumsum or flip, must see each row alone
+            return nests[0]._with_flat_values(
+                map_fn([nest.flat_values for nest in nests])
+            )
         ret = ivy.NestedArray.ragged_multi_map(map_fn, nests)
         return ret
 
@@ -209,7 +300,7 @@ class NestedArrayBase(abc.ABC):
         return z
 
     def ragged_map(self, fn):
-        arg = ivy.copy_nest(self._data)
+        arg = ivy.copy_nest(self.data)
         ivy.nested_map(lambda x: fn(x), arg, shallow=True)
         # infer dtype, shape, and device from the first array in the ret data
         arr0_id = ivy.nested_argwhere(arg, ivy.is_ivy_array, stop_after_n_found=1)[0]
@@ -220,17 +311,231 @@ class NestedArrayBase(abc.ABC):
         )
         return ragged_ret
 
+    def map_values(self, fn: Callable):
+        """Apply ``fn`` to the flat values of all rows at once, with a single
+        call rather than one per row.
+
+        ``fn`` must treat each element along the leading axis of the flat
+        values independently and preserve that axis, as elementwise functions
+        do.
+        """
+        return self._with_flat_values(fn(self.flat_values))
+
     def unbind(self):
-        return tuple(ivy.copy_nest(self._data))
+        return tuple(ivy.copy_nest(self.data))
+
+    def row_lengths(self) -> ivy.Array:
+        """Length of each row of the outermost ragged dimension."""
+        return self._row_splits[1:] - self._row_splits[:-1]
+
+    def to_padded(self, padding_value=0) -> ivy.Array:
+        """Convert to a dense array, padding the rows of each ragged dimension
+        with ``padding_value`` up to the length of the longest one.
+
+        Parameters
+        ----------
+        padding_value
+            Value to fill the padding with.
+
+        Returns
+        -------
+        ret
+            Array of shape (nrows, max_row_length, ..., *inner_shape).
+        """
+        if self._nested_rank > 1:
+            values = self._values.to_padded(padding_value)
+        else:
+            values = self._values
+        return self._pad_rows(values, padding_value)
+
+    def padding_mask(self) -> ivy.Array:
+        """Boolean mask of the elements of `to_padded` which aren't padding, of
+        shape (nrows, max_row_length, ...) without the inner shape."""
+        if self._nested_rank > 1:
+            values = self._values.padding_mask()
+        else:
+            values = ivy.ones(
+                (self._values.shape[0],), dtype=ivy.bool, device=self._device
+            )
+        return self._pad_rows(values, False)
+
+    # Reductions #
+    # ---------- #
+
+    # These reduce each row of the innermost ragged dimension, returning an array
+    # of shape (nrows, *inner_shape) for nested arrays with a single ragged
+    # dimension and a nested array with one less ragged dimension otherwise.
+
+    def row_sum(self):
+        """Sum of each row of the innermost ragged dimension."""
+        return self._reduce_rows(ivy.sum, 0)
+
+    def row_mean(self):
+        """Mean of each row of the innermost ragged dimension, nan for empty
+        rows."""
+        if self._nested_rank > 1:
+            return self._from_values(self._values.row_mean(), self._row_splits)
+        lengths = ivy.reshape(self.row_lengths(), [-1] + [1] * len(self._inner_shape))
+        return ivy.divide(self.row_sum(), lengths)
+
+    def row_max(self):
+        """Maximum of each row of the innermost ragged dimension, the minimum
+        value of the dtype for empty rows."""
+        return self._reduce_rows(ivy.max, self._dtype_bounds()[0])
+
+    def row_min(self):
+        """Minimum of each row of the innermost ragged dimension, the maximum
+        value of the dtype for empty rows."""
+        return self._reduce_rows(ivy.min, self._dtype_bounds()[1])
+
+    # Helpers #
+    # ------- #
+
+    def _reduce_rows(self, fn, padding_value):
+        if self._nested_rank > 1:
+            return self._from_values(
+                self._values._reduce_rows(fn, padding_value), self._row_splits
+            )
+        # padding with the identity of the reduction, the rows are all reduced
+        # by a single call
+        return fn(self._pad_rows(self._values, padding_value), axis=1)
+
+    def _dtype_bounds(self):
+        if ivy.is_float_dtype(self._dtype):
+            return -float("inf"), float("inf")
+        if ivy.is_bool_dtype(self._dtype):
+            return False, True
+        info = ivy.iinfo(self._dtype)
+        return info.min, info.max
+
+    def _pad_rows(self, values, padding_value):
+        """Gather ``values`` partitioned by the outermost row splits into an
+        array of shape (nrows, max_row_length, *values.shape[1:])."""
+        lengths = self.row_lengths()
+        max_length = int(ivy.max(lengths)) if self.nrows else 0
+        inner_shape = list(values.shape[1:])
+        if max_length == 0:
+            return ivy.full(
+                [self.nrows, 0] + inner_shape,
+                padding_value,
+                dtype=values.dtype,
+                device=self._device,
+            )
+        positions = ivy.arange(max_length, dtype=ivy.int64, device=self._device)
+        mask = positions < ivy.expand_dims(lengths, axis=-1)
+        # padding positions are clipped to a valid index and masked out after
+        idx = ivy.minimum(
+            ivy.expand_dims(self._row_splits[:-1], axis=-1) + positions,
+            values.shape[0] - 1,
+        )
+        padded = ivy.reshape(
+            ivy.gather(values, ivy.reshape(idx, (-1,)), axis=0),
+            [self.nrows, max_length] + inner_shape,
+        )
+        mask = ivy.reshape(mask, [self.nrows, max_length] + [1] * len(inner_shape))
+        return ivy.where(
+            mask,
+            padded,
+            ivy.full((), padding_value, dtype=values.dtype, device=self._device),
+        )
+
+    def _splits(self):
+        if self._row_splits_list is None:
+            self._row_splits_list = ivy.to_list(self._row_splits)
+        return self._row_splits_list
+
+    def _row(self, i):
+        splits = self._splits()
+        return self._values[splits[i] : splits[i + 1]]
+
+    def _slice_rows(self, start, stop):
+        """Nested array of the rows from ``start`` to ``stop``, sharing the
+        values of self."""
+        splits = self._splits()
+        return self._from_values(
+            self._values[splits[start] : splits[stop]],
+            self._row_splits[start : stop + 1] - splits[start],
+        )
+
+    def _same_row_partition(self, other):
+        if not isinstance(other, NestedArrayBase):
+            return False
+        if self._nested_rank != other.nested_rank:
+            return False
+        if self._nested_rank == 0:
+            return True
+        if self._row_splits is not other.row_splits and (
+            self._row_splits.shape != other.row_splits.shape
+            or not bool(ivy.array_equal(self._row_splits, other.row_splits))
+        ):
+            return False
+        if self._nested_rank > 1:
+            return self._values._same_row_partition(other.values)
+        return True
+
+    def _with_flat_values(self, flat_values):
+        """Nested array partitioned as self, with the given flat values."""
+        if self._nested_rank == 0:
+            return self.__class__(
+                flat_values,
+                0,
+                list(flat_values.shape[1:]),
+                flat_values.dtype,
+                flat_values.device,
+                internal=True,
+            )
+        if self._nested_rank > 1:
+            values = self._values._with_flat_values(flat_values)
+        else:
+            values = flat_values
+        return self._from_values(values, self._row_splits)
 
     # Properties #
     # ---------- #
 
     @property
-    def data(self) -> ivy.NativeArray:
-        """The native array being wrapped in self."""
+    def data(self):
+        """The rows of self, as a (nested) list of ivy arrays."""
+        if self._data is None:
+            if self._nested_rank == 0:
+                self._data = self._values
+            elif self._nested_rank == 1:
+                self._data = [self._row(i) for i in range(self.nrows)]
+            else:
+                self._data = [
+                    self._slice_rows(i, i + 1).values.data for i in range(self.nrows)
+                ]
         return self._data
 
+    @property
+    def values(self):
+        """Values of the rows of the outermost ragged dimension, concatenated.
+
+        A nested array with one less ragged dimension if there are several.
+        """
+        return self._values
+
+    @property
+    def flat_values(self) -> ivy.Array:
+        """Values of all the rows concatenated, as a dense array of shape
+        (n_values, *inner_shape)."""
+        if self._nested_rank > 1:
+            return self._values.flat_values
+        return self._values
+
+    @property
+    def row_splits(self) -> ivy.Array:
+        """Offsets of the rows of the outermost ragged dimension in `values`,
+        of length nrows + 1."""
+        return self._row_splits
+
+    @property
+    def nrows(self) -> int:
+        """Number of rows."""
+        if self._row_splits is None:
+            return len(self._values)
+        return self._row_splits.shape[0] - 1
+
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements."""
@@ -265,15 +570,66 @@ class NestedArrayBase(abc.ABC):
     # ----------#
 
     def __repr__(self):
-        rep = self._data.__repr__().replace("[ivy.array", "[")
+        rep = self.data.__repr__().replace("[ivy.array", "[")
         rep = rep.replace("ivy.array", "\n\t").replace("(", "").replace(")", "")
         ret = self._pre_repr + "(\n\t" + rep + "\n)"
         return ret
 
     def __getitem__(self, query):
-        ret = self._data[query]
+        if self._nested_rank > 0:
+            if isinstance(query, int):
+                if query < 0:
+                    query += self.nrows
+                if self._nested_rank == 1:
+                    return self._row(query)
+                return self._slice_rows(query, query + 1).values
+            if isinstance(query, slice) and query.step in (None, 1):
+                return self._slice_rows(*query.indices(self.nrows)[:2])
+        ret = self.data[query]
         if isinstance(ret, list):
             return self.__class__.nested_array(
                 ret, self._nested_rank - 1, dtype=self._dtype, device=self._device
             )
         return ret
+
+    def __len__(self):
+        return self.nrows
+
+    def __neg__(self):
+        return self.map_values(ivy.negative)
+
+    def __add__(self, other):
+        return ivy.NestedArray._elementwise_multi_map_in_function(ivy.add, self, other)
+
+    def __radd__(self, other):
+        return ivy.NestedArray._elementwise_multi_map_in_function(ivy.add, other, self)
+
+    def __sub__(self, other):
+        return ivy.NestedArray._elementwise_multi_map_in_function(
+            ivy.subtract, self, other
+        )
+
+    def __rsub__(self, other):
+        return ivy.NestedArray._elementwise_multi_map_in_function(
+            ivy.subtract, other, self
+        )
+
+    def __mul__(self, other):
+        return ivy.NestedArray._elementwise_multi_map_in_function(
+            ivy.multiply, self, other
+        )
+
+    def __rmul__(self, other):
+        return ivy.NestedArray._elementwise_multi_map_in_function(
+            ivy.multiply, other, self
+        )
+
+    def __truediv__(self, other):
+        return ivy.NestedArray._elementwise_multi_map_in_function(
+            ivy.divide, self, other
+        )
+
+    def __rtruediv__(self, other):
+        return ivy.NestedArray._elementwise_multi_map_in_function(
+            ivy.divide, other, self
+        )
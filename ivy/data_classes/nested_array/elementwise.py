@@ -9,12 +9,23 @@ from .base import NestedArrayBase
 class NestedArrayElementwise(NestedArrayBase):
     @staticmethod
     def static_add(
-        x1: Union[NestedArrayBase, ivy.Array, ivy.NestedArray],
-        x2: Union[NestedArrayBase, ivy.Array, ivy.NestedArray],
+        x1: Union[NestedArrayBase, ivy.Array],
+        x2: Union[NestedArrayBase, ivy.Array],
         /,
         *,
         alpha: Optional[Union[int, float]] = None,
         out: Optional[ivy.Array] = None,
     ) -> NestedArrayBase:
-        pass
-        # return self._elementwise_op(other, ivy.add)
+        return ivy.NestedArray._elementwise_multi_map_in_function(
+            ivy.add, x1, x2, alpha=alpha
+        )
+
+    def add(
+        self: NestedArrayBase,
+        x2: Union[NestedArrayBase, ivy.Array],
+        /,
+        *,
+        alpha: Optional[Union[int, float]] = None,
+        out: Optional[ivy.Array] = None,
+    ) -> NestedArrayBase:
+        return self.static_add(self, x2, alpha=alpha, out=out)
@@ -1,24 +1,34 @@
 # local
+import ivy
 from .base import NestedArrayBase
+from .elementwise import NestedArrayElementwise
 
 
-class NestedArray(NestedArrayBase):
-    def __init__(self, data, nested_rank, inner_shape, dtype, device, internal=False):
+class NestedArray(NestedArrayElementwise, NestedArrayBase):
+    def __init__(
+        self,
+        data,
+        nested_rank,
+        inner_shape,
+        dtype,
+        device,
+        internal=False,
+        row_splits=None,
+    ):
         NestedArrayBase.__init__(
-            self, data, nested_rank, inner_shape, dtype, device, internal
+            self, data, nested_rank, inner_shape, dtype, device, internal, row_splits
         )
 
     @classmethod
     def from_row_lengths(cls, values, row_lengths):
-        ivy_arrays = []
-        for i in range(len(row_lengths)):
-            ivy_arrays.append(values[: row_lengths[i]])
-            values = values[row_lengths[i] :]
-        return cls.nested_array(ivy_arrays)
+        values = values if isinstance(values, NestedArrayBase) else ivy.array(values)
+        row_lengths = ivy.astype(ivy.array(row_lengths), ivy.int64)
+        row_splits = ivy.concat(
+            [ivy.zeros((1,), dtype=ivy.int64), ivy.cumsum(row_lengths)]
+        )
+        return cls._from_values(values, row_splits)
 
     @classmethod
     def from_row_splits(cls, values, row_splits):
-        row_lengths = []
-        for i in range(1, len(row_splits)):
-            row_lengths.append(row_splits[i] - row_splits[i - 1])
-        return cls.from_row_lengths(values, row_lengths)
+        values = values if isinstance(values, NestedArrayBase) else ivy.array(values)
+        return cls._from_values(values, ivy.astype(ivy.array(row_splits), ivy.int64))
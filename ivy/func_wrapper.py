@@ -2,6 +2,7 @@ import contextlib
 import ivy
 import functools
 import logging
+import time
 import weakref
 import warnings
 import copy as python_copy
@@ -1026,6 +1027,257 @@ def download_cython_wrapper_wrapper(fn: Callable) -> Callable:
     return _download_cython_wrapper_wrapper
 
 
+# Fused Dispatch #
+# ---------------#
+
+# wrappers whose behaviour is reproduced by the fused fast path for the common
+# case of plain ivy.Array and python scalar inputs
+_FUSABLE_DECORATORS = {
+    "handle_exceptions",
+    "handle_backend_invalid",
+    "handle_nestable",
+    "handle_ragged",
+    "handle_nans",
+    "handle_array_like_without_promotion",
+    "handle_out_argument",
+    "inputs_to_native_arrays",
+    "outputs_to_ivy_arrays",
+    "handle_array_function",
+    "handle_device",
+}
+
+_PLAIN_TYPES = {int, float, bool, complex, str, type(None)}
+
+
+def _is_plain(x, x_type):
+    return x_type in _PLAIN_TYPES or isinstance(
+        x, (ivy.Dtype, ivy.Device, ivy.NativeDtype, ivy.NativeDevice)
+    )
+
+
+def _array_like_positions(fn: Callable) -> tuple:
+    # same check as in `handle_array_like_without_promotion`, but done once
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return ()
+    positions = []
+    for i, (parameter, param) in enumerate(type_hints.items()):
+        if param.kind not in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            break
+        annotation_str = str(param.annotation)
+        if (
+            ("rray" in annotation_str or "Tensor" in annotation_str)
+            and parameter != "out"
+            and all(
+                sq not in annotation_str
+                for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+            )
+        ):
+            positions.append(i)
+    return tuple(positions)
+
+
+def fuse_wrappers(fn: Callable, wrapped: Callable) -> Callable:
+    """Add a fused fast path on top of the wrapper chain `wrapped` of `fn`.
+
+    When `ivy.fused_dispatch_mode` is set and all the inputs are either plain
+    `ivy.Array` instances of the current backend, native arrays or python
+    scalars (no containers, nested arrays, frontend arrays or `out` argument),
+    the fused wrapper does a single pass over the arguments and calls `fn`
+    directly on the native arrays, which is what the full chain of wrappers
+    would end up doing. In all other cases the call falls back to `wrapped`.
+
+    Parameters
+    ----------
+    fn
+        the unwrapped backend implementation.
+    wrapped
+        `fn` wrapped with all of its wrappers.
+
+    Returns
+    -------
+    ret
+        the fused wrapper, or `wrapped` if its wrappers can't be fused.
+    """
+    decorators = {attr for attr in FN_DECORATORS if hasattr(wrapped, attr)}
+    if (
+        not decorators
+        or not decorators.issubset(_FUSABLE_DECORATORS)
+        or any(hasattr(fn, attr) for attr in FN_DECORATORS)
+    ):
+        return wrapped
+    to_native = "inputs_to_native_arrays" in decorators
+    to_ivy = "outputs_to_ivy_arrays" in decorators
+    handles_out = "handle_out_argument" in decorators
+    handles_device = "handle_device" in decorators
+    handles_nans = "handle_nans" in decorators
+    array_positions = (
+        _array_like_positions(fn)
+        if "handle_array_like_without_promotion" in decorators
+        else ()
+    )
+
+    def _call(args, kwargs, dst_dev, array_mode):
+        if handles_device:
+            with ivy.DefaultDevice(ivy.default_device(dst_dev)):
+                ret = ivy.handle_soft_device_variable(*args, fn=fn, **kwargs)
+        else:
+            ret = fn(*args, **kwargs)
+        if to_ivy and array_mode:
+            if isinstance(ret, ivy.NativeArray):
+                return ivy.Array(ret)
+            return ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
+        return ret
+
+    _call.__name__ = fn.__name__
+    if "handle_exceptions" in decorators:
+        _call = ivy.handle_exceptions(_call)
+
+    @functools.wraps(wrapped)
+    def _fused_dispatch(*args, **kwargs):
+        if (
+            not ivy.fused_dispatch_mode
+            or (handles_nans and ivy.nan_policy != "nothing")
+            or (handles_out and kwargs.get("out") is not None)
+        ):
+            return wrapped(*args, **kwargs)
+        # single pass over the inputs, bailing out on anything non-trivial
+        backend = ivy.backend
+        array_mode = ivy.array_mode
+        convert = to_native and array_mode
+        # in soft device mode the inputs aren't required to share a device
+        check_devices = handles_device and not ivy.soft_device_mode
+        devices = set()
+        new_args = list(args)
+        for i, arg in enumerate(args):
+            arg_type = type(arg)
+            if arg_type is ivy.Array:
+                if arg._backend != backend:
+                    return wrapped(*args, **kwargs)
+                if check_devices:
+                    devices.add(arg.device)
+                if convert:
+                    new_args[i] = arg._data
+            elif isinstance(arg, ivy.NativeArray):
+                if check_devices:
+                    devices.add(ivy.dev(arg))
+            elif i in array_positions or not _is_plain(arg, arg_type):
+                return wrapped(*args, **kwargs)
+        new_kwargs = dict(kwargs)
+        for key, arg in kwargs.items():
+            arg_type = type(arg)
+            if arg_type is ivy.Array:
+                if arg._backend != backend:
+                    return wrapped(*args, **kwargs)
+                if check_devices:
+                    devices.add(arg.device)
+                if convert:
+                    new_kwargs[key] = arg._data
+            elif isinstance(arg, ivy.NativeArray):
+                if check_devices:
+                    devices.add(ivy.dev(arg))
+            elif not _is_plain(arg, arg_type):
+                return wrapped(*args, **kwargs)
+        dst_dev = None
+        if handles_device:
+            if kwargs.get("device") is not None or len(devices) > 1:
+                return wrapped(*args, **kwargs)
+            dst_dev = next(iter(devices)) if devices else None
+        if handles_out:
+            new_kwargs["out"] = None
+        return _call(new_args, new_kwargs, dst_dev, array_mode)
+
+    _fused_dispatch.fused_dispatch = True
+    return _fused_dispatch
+
+
+def instrument_function(name: str, fn: Callable, compositional: bool) -> Callable:
+    """Record the calls of `fn`, the wrapped function `name`, in
+    `ivy.utils.instrumentation`.
+
+    Only installed by `_wrap_function` while `ivy.instrumentation_mode` is set.
+
+    Parameters
+    ----------
+    name
+        the name of the function.
+    fn
+        the function with all of its wrappers.
+    compositional
+        whether the function is compositional, in which case its time isn't
+        split into the time spent in the backend and in the wrappers.
+
+    Returns
+    -------
+    ret
+        the instrumented function.
+    """
+    instrumentation = ivy.utils.instrumentation
+    perf_counter_ns = time.perf_counter_ns
+
+    @functools.wraps(fn)
+    def _instrumented(*args, **kwargs):
+        call_stack = instrumentation._call_stack()
+        call_stack.append([name, 0])
+        start = perf_counter_ns()
+        try:
+            ret = fn(*args, **kwargs)
+        finally:
+            native_time = call_stack.pop()[1]
+        end = perf_counter_ns()
+        instrumentation.record_call(
+            name,
+            start,
+            end,
+            None if compositional else native_time,
+            args,
+            kwargs,
+            ret,
+        )
+        return ret
+
+    _instrumented.instrumented = True
+    return _instrumented
+
+
+def _time_native_call(name: str, fn: Callable) -> Callable:
+    """Record the time spent in `fn`, the backend implementation of the
+    function `name`, for `instrument_function`."""
+    instrumentation = ivy.utils.instrumentation
+    perf_counter_ns = time.perf_counter_ns
+
+    @functools.wraps(fn)
+    def _native_call(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            instrumentation.record_native_call(name, start, perf_counter_ns())
+
+    return _native_call
+
+
+# callback of the tracer of `ivy.compiler.replay`, which the calls of the backend
+# implementations are passed to while it is set
+_native_call_tracer = None
+
+
+def _trace_native_call(name: str, fn: Callable) -> Callable:
+    """Pass the calls of `fn`, the backend implementation of the function
+    `name`, to `_native_call_tracer` while it is set."""
+
+    @functools.wraps(fn)
+    def _traced(*args, **kwargs):
+        tracer = _native_call_tracer
+        if tracer is None:
+            return fn(*args, **kwargs)
+        return tracer(name, fn, args, kwargs)
+
+    _traced.native_call_traced = True
+    return _traced
+
+
 # Functions #
 
 
@@ -1098,6 +1350,12 @@ def _wrap_function(
             and hasattr(to_wrap, "partial_mixed_handler")
         )
         add_wrappers, skip_wrappers = [], []
+        if not compositional and not hasattr(to_wrap, "native_call_traced"):
+            to_wrap = _trace_native_call(key, to_wrap)
+        instrument = ivy.instrumentation_mode and not hasattr(to_wrap, "instrumented")
+        if instrument and not mixed_fn and not compositional:
+            to_wrap = _time_native_call(key, to_wrap)
+        unwrapped = to_wrap
         if mixed_fn:
             backend_wrappers = getattr(original, "mixed_backend_wrappers")
             add_wrappers = backend_wrappers.get("to_add")
@@ -1125,31 +1383,62 @@ def _wrap_function(
                 if hasattr(to_wrap.compos, attr):
                     to_wrap.compos = to_wrap.compos.__wrapped__
             to_wrap.compos.__dict__["array_spec"] = array_spec
+        elif not mixed_fn and not compositional and to_wrap is not unwrapped:
+            to_wrap = fuse_wrappers(unwrapped, to_wrap)
+        if instrument:
+            to_wrap = instrument_function(
+                key, to_wrap, compositional=compositional or mixed_fn
+            )
     return to_wrap
 
 
+# per (backend, backend version) table of the dtypes which can't be used with each
+# function wrapped by `casting_modes_ops`, filled by `_casting_modes_intersect`
+_casting_modes_tables = {}
+
+
+def _casting_modes_intersect(fn):
+    """Return the dtypes unsupported by `fn` with the current backend and
+    device, other than the backend's invalid dtypes.
+
+    These only depend on the function, the backend, its version and the device,
+    so they're computed from the function's dtype attributes on its first call
+    with each combination, and looked up after that.
+    """
+    table = _casting_modes_tables.setdefault(
+        (ivy.backend, ivy.backend_version.get("version")), {}
+    )
+    try:
+        intersect = table[fn]
+    except KeyError:
+        # we first check if it has unsupported/supported dtypes uniquely added to it
+        intersect = frozenset(ivy.function_unsupported_dtypes(fn)).difference(
+            ivy.invalid_dtypes
+        )
+        # otherwise they may be specified per device, looked up for each device
+        table[fn] = intersect = intersect or {}
+    if isinstance(intersect, dict):
+        device = ivy.default_device().split(":")[0]
+        try:
+            return intersect[device]
+        except KeyError:
+            intersect[device] = frozenset(
+                ivy.function_unsupported_devices_and_dtypes(fn).get(device, {None})
+            ).difference(ivy.invalid_dtypes)
+            return intersect[device]
+    return intersect
+
+
 def casting_modes_ops(fn, ret_dtype_target=None):
+    # Extract argument names
+    arg_names = list(inspect.signature(fn).parameters) if ret_dtype_target else None
+
     @functools.wraps(fn)
     def method(*args, **kwargs):
-        # Get the function signature
-        signature = inspect.signature(fn)
-        # Extract argument names
-        arg_names = [param.name for param in signature.parameters.values()]
-        # we first check if it has unsupported/supported dtypes uniquely added to it
-        intersect = set(ivy.function_unsupported_dtypes(fn)).difference(
-            set(ivy.invalid_dtypes)
-        )
+        intersect = _casting_modes_intersect(fn)
         if not intersect:
-            # doesn't have unsupported dtypes specified
-            # so check if it's one of the device_and_dtype one
-            intersect = set(
-                ivy.function_unsupported_devices_and_dtypes(fn).get(
-                    ivy.default_device().split(":")[0], {None}
-                )
-            ).difference(set(ivy.invalid_dtypes))
-            if not intersect:
-                # no unsupported dtype specified
-                return fn(*args, **kwargs)
+            # no unsupported dtype specified
+            return fn(*args, **kwargs)
 
         # specifies which dtype to cast the output to
         to_cast = None
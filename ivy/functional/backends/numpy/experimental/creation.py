@@ -101,12 +101,7 @@ def unsorted_segment_min(
         raise TypeError("Unsupported data type")
 
     res = np.full((num_segments,) + data.shape[1:], init_val, dtype=data.dtype)
-
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if np.any(mask_index):
-            res[i] = np.min(data[mask_index], axis=0)
-
+    np.minimum.at(res, segment_ids, data)
     return res
 
 
@@ -148,12 +143,7 @@ def unsorted_segment_sum(
     )
 
     res = np.zeros((num_segments,) + data.shape[1:], dtype=data.dtype)
-
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if np.any(mask_index):
-            res[i] = np.sum(data[mask_index], axis=0)
-
+    np.add.at(res, segment_ids, data)
     return res
 
 
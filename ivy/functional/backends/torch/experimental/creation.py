@@ -144,12 +144,8 @@ def unsorted_segment_min(
     res = torch.full(
         (num_segments,) + data.shape[1:], init_val, dtype=data.dtype, device=data.device
     )
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if torch.any(mask_index):
-            res[i] = torch.min(data[mask_index], 0)[0]
-
-    return res
+    index = segment_ids.to(torch.int64).reshape((-1,) + (1,) * (data.dim() - 1))
+    return res.scatter_reduce_(0, index.expand(data.shape), data, reduce="amin")
 
 
 @with_unsupported_dtypes({"2.2 and below": ("float16",)}, backend_version)
@@ -187,13 +183,7 @@ def unsorted_segment_sum(
     res = torch.zeros(
         (num_segments,) + data.shape[1:], dtype=data.dtype, device=data.device
     )
-
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if torch.any(mask_index):
-            res[i] = torch.sum(data[mask_index], dim=0)
-
-    return res
+    return res.index_add_(0, segment_ids.to(torch.int64), data)
 
 
 def trilu(
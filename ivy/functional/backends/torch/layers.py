@@ -910,16 +910,30 @@ def lstm(
     if initial_states[1].dim() == 2:
         initial_states[1] = ivy.expand_dims(initial_states[1])
 
-    ret = torch.lstm(
-        input,
-        initial_states,
-        all_weights,
-        has_ih_bias,
-        num_layers,
-        dropout,
-        train,
-        bidirectional,
-        batch_first,
-    )
+    if batch_sizes is not None:
+        # packed sequences, which torch runs over as they are
+        ret = torch.lstm(
+            input,
+            torch.as_tensor(batch_sizes, dtype=torch.int64, device="cpu"),
+            initial_states,
+            all_weights,
+            has_ih_bias,
+            num_layers,
+            dropout,
+            train,
+            bidirectional,
+        )
+    else:
+        ret = torch.lstm(
+            input,
+            initial_states,
+            all_weights,
+            has_ih_bias,
+            num_layers,
+            dropout,
+            train,
+            bidirectional,
+            batch_first,
+        )
 
     return ret[0][:, -1], ret[0], (ret[1], ret[2])
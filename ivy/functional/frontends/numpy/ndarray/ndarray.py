@@ -451,6 +451,8 @@ class ndarray:
         return np_frontend.subtract(self, value)
 
     def __mul__(self, value, /):
+        if _defers_to(value):
+            return NotImplemented
         return np_frontend.multiply(self, value)
 
     def __rmul__(self, value, /):
@@ -478,6 +480,8 @@ class ndarray:
         return np_frontend.logical_xor(self, value)
 
     def __matmul__(self, value, /):
+        if _defers_to(value):
+            return NotImplemented
         return np_frontend.matmul(self, value)
 
     def __copy__(
@@ -673,6 +677,12 @@ class ndarray:
 # --------------- #
 
 
+def _defers_to(value):
+    # as in numpy, the operators defer to the reflected operators of the objects
+    # opting out of ufuncs, such as the scipy sparse matrices
+    return getattr(type(value), "__array_ufunc__", False) is None
+
+
 # tobytes helper function
 def _to_bytes_helper(array, order="C"):
     def _integers_bytes_repr(item_val, /, *, dtype=None):
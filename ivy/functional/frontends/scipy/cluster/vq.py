@@ -0,0 +1,309 @@
+# global
+import warnings
+
+# local
+import ivy
+from ivy.functional.frontends.numpy.func_wrapper import to_ivy_arrays_and_back
+
+
+# maximum size in bytes of the intermediate arrays of a block of observations,
+# which are assigned to their nearest code one block after the other so that the
+# distances between all the observations and codes are never held at once
+_MAX_BLOCK_BYTES = 2**26
+
+
+class ClusterError(Exception):
+    pass
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _asarray(x, check_finite):
+    x = ivy.asarray(x)
+    if not ivy.is_float_dtype(x):
+        x = x.astype("float64")
+    if check_finite and not ivy.all(ivy.isfinite(x)):
+        raise ValueError("array must not contain infs or NaNs")
+    return x
+
+
+def _as_2d(data, code_book):
+    dtype = ivy.promote_types(data.dtype, code_book.dtype)
+    data = ivy.astype(data, dtype, copy=False)
+    code_book = ivy.astype(code_book, dtype, copy=False)
+    if data.ndim == 1:
+        return ivy.expand_dims(data, axis=1), ivy.reshape(code_book, (-1, 1))
+    if data.ndim != 2:
+        raise ValueError("Observation and code_book should have the same rank")
+    if code_book.ndim != 2 or data.shape[1] != code_book.shape[1]:
+        raise ValueError("Observation and code_book should have the same rank")
+    return data, code_book
+
+
+def _vq_blocks(data, code_book, distances=True):
+    """Yield the blocks of rows of `data`, with the index of the nearest code
+    of each row and, if `distances`, the euclidean distance to it."""
+    num_codes = code_book.shape[0]
+    itemsize = ivy.dtype_bits(data.dtype) // 8
+    rows = max(1, _MAX_BLOCK_BYTES // (3 * num_codes * itemsize))
+    code_norms = ivy.sum(code_book * code_book, axis=1)
+    for i in range(0, data.shape[0], rows):
+        block = data[i : i + rows]
+        # |x - c|^2 = |x|^2 - 2 x.c + |c|^2, where |x|^2 is the same for all codes
+        dist = code_norms - 2 * ivy.matmul(block, code_book, transpose_b=True)
+        code = ivy.argmin(dist, axis=1)
+        if not distances:
+            yield block, code, None
+            continue
+        # the distances to the nearest codes are computed from the differences
+        # rather than from the matmul, which loses precision when they are small
+        diff = block - ivy.gather(code_book, code, axis=0)
+        yield block, code, ivy.sqrt(ivy.sum(diff * diff, axis=1))
+
+
+def _vq(data, code_book):
+    codes, dists = [], []
+    for _, code, dist in _vq_blocks(data, code_book):
+        codes.append(code)
+        dists.append(dist)
+    if len(codes) == 1:
+        return codes[0], dists[0]
+    return ivy.concat(codes), ivy.concat(dists)
+
+
+def _codes(data, code_book):
+    codes = [code for _, code, _ in _vq_blocks(data, code_book, distances=False)]
+    return codes[0] if len(codes) == 1 else ivy.concat(codes)
+
+
+def _segment_sums(data, code, num_codes):
+    """Return the sums and the numbers of the rows of `data` assigned to each
+    code."""
+    # the segment sums are computed as a matmul with the one-hot encoding of the
+    # codes, the size of which is that of the distances to the codes, rather than
+    # by scattering each row, which is much slower on cpu
+    one_hot = ivy.one_hot(code, num_codes, dtype=data.dtype)
+    return ivy.matmul(one_hot, data, transpose_a=True), ivy.sum(one_hot, axis=0)
+
+
+def _update_cluster_means(data, code_book, distances=True):
+    """Assign the rows of `data` to their nearest code, block by block, and
+    return the means of the rows assigned to each code, whether each code has
+    any rows assigned, the codes of the rows and, if `distances`, their
+    distances to them."""
+    num_codes = code_book.shape[0]
+    sums = counts = None
+    codes, dists = [], []
+    for block, code, dist in _vq_blocks(data, code_book, distances):
+        block_sums, block_counts = _segment_sums(block, code, num_codes)
+        if sums is None:
+            sums, counts = block_sums, block_counts
+        else:
+            sums, counts = sums + block_sums, counts + block_counts
+        codes.append(code)
+        dists.append(dist)
+    has_members = counts > 0
+    means = sums / ivy.expand_dims(ivy.maximum(counts, 1), axis=1)
+    code = codes[0] if len(codes) == 1 else ivy.concat(codes)
+    if not distances:
+        dist = None
+    elif len(dists) == 1:
+        dist = dists[0]
+    else:
+        dist = ivy.concat(dists)
+    return means, has_members, code, dist
+
+
+def _kmeans(data, guess, thresh):
+    code_book = guess
+    distortion = diff = ivy.inf
+    while diff > thresh:
+        means, has_members, _, dist = _update_cluster_means(data, code_book)
+        prev_distortion, distortion = distortion, float(ivy.mean(dist))
+        # the codes without any observations are dropped
+        code_book = means[has_members]
+        diff = abs(prev_distortion - distortion)
+    return code_book, distortion
+
+
+def _kpoints(data, k):
+    """Pick `k` distinct rows of `data` at random."""
+    idx = ivy.argsort(ivy.random_uniform(shape=(data.shape[0],)))[:k]
+    return ivy.gather(data, idx, axis=0)
+
+
+def _krandinit(data, k):
+    """Draw `k` points from a gaussian with the mean and covariance of
+    `data`."""
+    mu = ivy.mean(data, axis=0)
+    num_rows = data.shape[0]
+    if data.shape[1] > num_rows:
+        # the covariance is rank deficient, so the points are drawn in the span
+        # of the rows of the data
+        _, s, vh = ivy.svd(data - mu, full_matrices=False)
+        x = ivy.random_normal(shape=(k, s.shape[0]), dtype=data.dtype)
+        s_vh = ivy.expand_dims(s, axis=1) * vh / (num_rows - 1) ** 0.5
+        return ivy.matmul(x, s_vh) + mu
+    centered = data - mu
+    cov = ivy.matmul(centered, centered, transpose_a=True) / (num_rows - 1)
+    x = ivy.random_normal(shape=(k, data.shape[1]), dtype=data.dtype)
+    return ivy.matmul(x, ivy.cholesky(cov), transpose_b=True) + mu
+
+
+def _kpp(data, k):
+    """Pick `k` rows of `data` with the k-means++ initialisation, each with a
+    probability proportional to its squared distance to the nearest row
+    already picked."""
+    num_rows = data.shape[0]
+    init = [data[int(ivy.randint(0, num_rows, shape=()))]]
+    # squared distances of the rows to their nearest pick, updated with the
+    # distances to each new pick rather than recomputed to all the picks
+    min_dists = None
+    for _ in range(1, k):
+        diff = data - init[-1]
+        dists = ivy.sum(diff * diff, axis=1)
+        min_dists = dists if min_dists is None else ivy.minimum(min_dists, dists)
+        cum_probs = ivy.cumsum(min_dists / ivy.sum(min_dists))
+        r = ivy.random_uniform(shape=(1,), dtype=cum_probs.dtype)
+        idx = min(int(ivy.searchsorted(cum_probs, r)[0]), num_rows - 1)
+        init.append(data[idx])
+    return ivy.stack(init)
+
+
+_valid_init_meth = {"random": _krandinit, "points": _kpoints, "++": _kpp}
+
+
+def _minibatch_kmeans(data, code_book, iter, batch_size):
+    """Update `code_book` with `iter` steps of mini-batch k-means, each on
+    `batch_size` rows of `data` drawn at random, with a learning rate of one
+    over the number of rows assigned to each code so far."""
+    num_codes = code_book.shape[0]
+    counts = ivy.zeros((num_codes,), dtype=code_book.dtype)
+    for _ in range(iter):
+        idx = ivy.randint(0, data.shape[0], shape=(batch_size,))
+        batch = ivy.gather(data, idx, axis=0)
+        code = _codes(batch, code_book)
+        batch_sums, batch_counts = _segment_sums(batch, code, num_codes)
+        counts = counts + batch_counts
+        step = (batch_sums - ivy.expand_dims(batch_counts, axis=1) * code_book) / (
+            ivy.expand_dims(ivy.maximum(counts, 1), axis=1)
+        )
+        code_book = code_book + step
+    return code_book
+
+
+# --- Main --- #
+# ------------ #
+
+
+@to_ivy_arrays_and_back
+def kmeans(obs, k_or_guess, iter=20, thresh=1e-05, check_finite=True, *, seed=None):
+    obs = _asarray(obs, check_finite)
+    if iter < 1:
+        raise ValueError(f"iter must be at least 1, got {iter}")
+    if seed is not None:
+        ivy.seed(seed_value=seed)
+    guess = ivy.asarray(k_or_guess)
+    if guess.size != 1:
+        if guess.size < 1:
+            raise ValueError(f"Asked for 0 clusters. Initial book was {guess}")
+        data, guess = _as_2d(obs, _asarray(guess, check_finite))
+        code_book, best_distortion = _kmeans(data, guess, thresh)
+    else:
+        k = int(k_or_guess)
+        if k != k_or_guess:
+            raise ValueError("If k_or_guess is a scalar, it must be an integer.")
+        if k < 1:
+            raise ValueError(f"Asked for {k} clusters.")
+        data = ivy.expand_dims(obs, axis=1) if obs.ndim == 1 else obs
+        best_distortion = ivy.inf
+        for _ in range(iter):
+            book, distortion = _kmeans(data, _kpoints(data, k), thresh)
+            if distortion < best_distortion:
+                code_book, best_distortion = book, distortion
+    if obs.ndim == 1:
+        code_book = ivy.reshape(code_book, (-1,))
+    return code_book, ivy.asarray(best_distortion, dtype=code_book.dtype)
+
+
+# `batch_size`, which isn't part of the scipy api, runs mini-batch k-means on
+# random batches of that many observations instead of on all of them
+@to_ivy_arrays_and_back
+def kmeans2(
+    data,
+    k,
+    iter=10,
+    thresh=1e-05,
+    minit="random",
+    missing="warn",
+    check_finite=True,
+    *,
+    seed=None,
+    batch_size=None,
+):
+    if missing not in ("warn", "raise"):
+        raise ValueError(f"Unknown missing method {missing!r}")
+    data = _asarray(data, check_finite)
+    if data.ndim > 2:
+        raise ValueError("Input of rank > 2 is not supported.")
+    if seed is not None:
+        ivy.seed(seed_value=seed)
+    code_book = ivy.asarray(k)
+    if data.size < 1 or code_book.size < 1:
+        raise ValueError("Empty input is not supported.")
+    data_2d = ivy.expand_dims(data, axis=1) if data.ndim == 1 else data
+    if minit == "matrix" or code_book.size > 1:
+        if data.ndim != code_book.ndim:
+            raise ValueError("k array doesn't match data rank")
+        if data.ndim > 1 and code_book.shape[1] != data.shape[1]:
+            raise ValueError("k array doesn't match data dimension")
+        data_2d, code_book = _as_2d(data, _asarray(code_book, check_finite))
+    else:
+        num_codes = int(k)
+        if num_codes < 1:
+            raise ValueError(
+                f"Cannot ask kmeans2 for {num_codes} clusters (k was {k})"
+            )
+        if num_codes != k:
+            warnings.warn("k was not an integer, was converted.", stacklevel=2)
+        if minit not in _valid_init_meth:
+            raise ValueError(f"Unknown init method {minit!r}")
+        code_book = _valid_init_meth[minit](data_2d, num_codes)
+
+    if batch_size is not None:
+        code_book = _minibatch_kmeans(data_2d, code_book, iter, batch_size)
+        label = _codes(data_2d, code_book)
+    else:
+        for _ in range(iter):
+            means, has_members, label, _ = _update_cluster_means(
+                data_2d, code_book, distances=False
+            )
+            if not ivy.all(has_members):
+                if missing == "raise":
+                    raise ClusterError(
+                        "One of the clusters is empty. Re-run kmeans with a"
+                        " different initialization."
+                    )
+                warnings.warn(
+                    "One of the clusters is empty. Re-run kmeans with a different"
+                    " initialization.",
+                    stacklevel=2,
+                )
+                # the empty clusters keep their previous positions
+                means = ivy.where(
+                    ivy.expand_dims(has_members, axis=1), means, code_book
+                )
+            code_book = means
+    if data.ndim == 1:
+        code_book = ivy.reshape(code_book, (-1,))
+    return code_book, label.astype("int32")
+
+
+@to_ivy_arrays_and_back
+def vq(obs, code_book, check_finite=True):
+    obs = _asarray(obs, check_finite)
+    data, code_book = _as_2d(obs, _asarray(code_book, check_finite))
+    code, dist = _vq(data, code_book)
+    return code.astype("int32"), dist
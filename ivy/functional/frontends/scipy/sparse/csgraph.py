@@ -0,0 +1,232 @@
+# global
+import ivy
+from ivy.functional.frontends.numpy.func_wrapper import to_ivy_arrays_and_back
+from .sparse import _spmatrix
+
+
+# maximum size in bytes of the candidate distances of a block of sources, which
+# `shortest_path` computes one block after the other
+_MAX_BLOCK_BYTES = 2**26
+
+
+class NegativeCycleError(Exception):
+    pass
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _edges(csgraph):
+    """Return the number of nodes of the graph and the source, target and
+    weight of each of its edges, the stored entries of a sparse matrix or the
+    nonzero elements of a dense one."""
+    if isinstance(csgraph, _spmatrix):
+        sources, targets, weights = csgraph._ivy_array._coordinates()
+    else:
+        csgraph = ivy.asarray(csgraph)
+        sources, targets = ivy.nonzero(csgraph)
+        weights = ivy.gather_nd(csgraph, ivy.stack((sources, targets), axis=-1))
+    if csgraph.shape[0] != csgraph.shape[1]:
+        raise ValueError("compressed-sparse graph must be shape (N, N)")
+    return csgraph.shape[0], sources, targets, weights
+
+
+def _min_label_propagation(labels, sources, targets, num_nodes):
+    """Propagate the smallest label along the edges until it reaches all the
+    nodes reachable from each node, or until no label changes."""
+    while True:
+        incoming = ivy.unsorted_segment_min(
+            ivy.gather(labels, sources), targets, num_nodes
+        )
+        new_labels = ivy.minimum(labels, incoming)
+        if ivy.array_equal(new_labels, labels):
+            return labels
+        labels = new_labels
+
+
+def _weak_components(num_nodes, sources, targets):
+    """Return the smallest node of the component of each node, the edges
+    being undirected."""
+    labels = ivy.arange(num_nodes, dtype="int64")
+    if sources.shape[0] == 0:
+        return labels
+    sources, targets = ivy.concat((sources, targets)), ivy.concat((targets, sources))
+    while True:
+        incoming = ivy.unsorted_segment_min(
+            ivy.gather(labels, sources), targets, num_nodes
+        )
+        new_labels = ivy.minimum(labels, incoming)
+        # each label is a node of the same component, the label of which is at
+        # most as small, so the labels jump to the labels of their labels
+        new_labels = ivy.gather(new_labels, new_labels)
+        if ivy.array_equal(new_labels, labels):
+            return labels
+        labels = new_labels
+
+
+def _strong_components(num_nodes, sources, targets):
+    """Return the smallest node of the strongly connected component of each
+    node.
+
+    The nodes are coloured with the smallest node which reaches them, and
+    the nodes of each colour reaching the node of that colour back form its
+    component, which is removed from the graph before colouring the
+    remaining nodes again.
+    """
+    nodes = ivy.arange(num_nodes, dtype="int64")
+    labels = ivy.full((num_nodes,), -1, dtype="int64")
+    remaining = ivy.ones((num_nodes,), dtype="bool")
+    while ivy.any(remaining):
+        edges = ivy.logical_and(
+            ivy.gather(remaining, sources), ivy.gather(remaining, targets)
+        )
+        sources, targets = sources[edges], targets[edges]
+        # the removed nodes keep their own colour, as no edge is left into them
+        colours = nodes
+        if sources.shape[0]:
+            colours = _min_label_propagation(colours, sources, targets, num_nodes)
+        # the nodes reaching back their colour, through nodes of the same colour
+        reached = ivy.logical_and(remaining, ivy.equal(colours, nodes))
+        same_colour = ivy.equal(
+            ivy.gather(colours, sources), ivy.gather(colours, targets)
+        )
+        back_sources = sources[same_colour]
+        back_targets = targets[same_colour]
+        while back_sources.shape[0]:
+            reaching = ivy.astype(ivy.gather(reached, back_targets), "int64")
+            new_reached = ivy.logical_or(
+                reached,
+                ivy.unsorted_segment_sum(reaching, back_sources, num_nodes) > 0,
+            )
+            if ivy.array_equal(new_reached, reached):
+                break
+            reached = new_reached
+        labels = ivy.where(reached, colours, labels)
+        remaining = ivy.logical_and(remaining, ivy.logical_not(reached))
+    return labels
+
+
+def _bellman_ford(num_nodes, sources, targets, weights, start, predecessors):
+    """Return the distances, and the predecessors if `predecessors`, of the
+    shortest paths from each of the nodes `start` to all the nodes.
+
+    All the edges are relaxed at once for all the starting nodes, as the
+    minimum of the candidate distances through the edges into each node.
+    """
+    max_value = ivy.finfo(weights.dtype).max
+    # distances of all the nodes, one column per starting node
+    dist = ivy.where(
+        ivy.equal(ivy.expand_dims(ivy.arange(num_nodes), axis=1), start),
+        ivy.zeros((), dtype=weights.dtype),
+        ivy.full((), ivy.inf, dtype=weights.dtype),
+    )
+    if not sources.shape[0]:
+        # without any edge, only the starting nodes themselves are reached
+        if not predecessors:
+            return dist, None
+        return dist, ivy.full(dist.shape, -9999, dtype="int64")
+    weights = ivy.expand_dims(weights, axis=1)
+    for _ in range(num_nodes):
+        candidates = ivy.gather(dist, sources, axis=0) + weights
+        incoming = ivy.unsorted_segment_min(candidates, targets, num_nodes)
+        # the nodes without any edge into them are left at the maximum value
+        incoming = ivy.where(incoming >= max_value, ivy.inf, incoming)
+        new_dist = ivy.minimum(dist, incoming)
+        if ivy.array_equal(new_dist, dist):
+            break
+        dist = new_dist
+    else:
+        if num_nodes and ivy.any(ivy.less(weights, 0)):
+            raise NegativeCycleError("Negative cycle detected on node")
+    if not predecessors:
+        return dist, None
+    # the predecessor of each node is the smallest node with an edge into it on a
+    # shortest path
+    candidates = ivy.gather(dist, sources, axis=0) + weights
+    tight = ivy.logical_and(
+        ivy.equal(candidates, ivy.gather(dist, targets, axis=0)),
+        ivy.not_equal(ivy.expand_dims(targets, axis=1), start),
+    )
+    tight = ivy.logical_and(tight, ivy.isfinite(candidates))
+    pred = ivy.unsorted_segment_min(
+        ivy.where(tight, ivy.expand_dims(sources, axis=1), num_nodes),
+        targets,
+        num_nodes,
+    )
+    pred = ivy.where(pred >= num_nodes, -9999, pred)
+    return dist, pred
+
+
+# --- Main --- #
+# ------------ #
+
+
+@to_ivy_arrays_and_back
+def connected_components(csgraph, directed=True, connection="weak", return_labels=True):
+    if connection.lower() not in ("weak", "strong"):
+        raise ValueError("connection must be 'weak' or 'strong'")
+    num_nodes, sources, targets, _ = _edges(csgraph)
+    if directed and connection.lower() == "strong":
+        labels = _strong_components(num_nodes, sources, targets)
+    else:
+        labels = _weak_components(num_nodes, sources, targets)
+    # the components are numbered in the order of their smallest node
+    roots, labels = ivy.unique_inverse(labels)
+    n_components = roots.shape[0]
+    if return_labels:
+        return n_components, ivy.astype(labels, "int32")
+    return n_components
+
+
+@to_ivy_arrays_and_back
+def shortest_path(
+    csgraph,
+    method="auto",
+    directed=True,
+    return_predecessors=False,
+    unweighted=False,
+    overwrite=False,
+    indices=None,
+):
+    # all the methods compute the same distances, with a Bellman-Ford relaxation
+    # of all the edges at once, which handles negative weights and is made of
+    # segment ops over the edges only
+    if method not in ("auto", "FW", "D", "BF", "J"):
+        raise ValueError(f"unrecognized method '{method}'")
+    num_nodes, sources, targets, weights = _edges(csgraph)
+    weights = ivy.astype(weights, "float64")
+    if unweighted:
+        weights = ivy.ones_like(weights)
+    if not directed:
+        sources, targets = (
+            ivy.concat((sources, targets)),
+            ivy.concat((targets, sources)),
+        )
+        weights = ivy.concat((weights, weights))
+    if indices is None:
+        start = ivy.arange(num_nodes, dtype="int64")
+    else:
+        start = ivy.astype(ivy.reshape(ivy.asarray(indices), (-1,)), "int64")
+    block = max(1, _MAX_BLOCK_BYTES // (8 * max(1, sources.shape[0])))
+    dists, preds = [], []
+    # at least one block, for the empty distances of a graph without nodes
+    for i in range(0, max(1, start.shape[0]), block):
+        dist, pred = _bellman_ford(
+            num_nodes,
+            sources,
+            targets,
+            weights,
+            start[i : i + block],
+            return_predecessors,
+        )
+        dists.append(ivy.matrix_transpose(dist))
+        if return_predecessors:
+            preds.append(ivy.matrix_transpose(pred))
+    dist = dists[0] if len(dists) == 1 else ivy.concat(dists)
+    if return_predecessors:
+        pred = ivy.astype(preds[0] if len(preds) == 1 else ivy.concat(preds), "int32")
+    if indices is not None and ivy.asarray(indices).ndim == 0:
+        dist = dist[0]
+        pred = pred[0] if return_predecessors else None
+    return (dist, pred) if return_predecessors else dist
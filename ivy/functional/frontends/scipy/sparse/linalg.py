@@ -0,0 +1,162 @@
+# global
+import warnings
+
+# local
+import ivy
+from ivy.functional.frontends.numpy.func_wrapper import to_ivy_arrays_and_back
+from .sparse import _spmatrix
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _matvec(A):
+    """Return the product with `A`, a sparse matrix, a linear operator with a
+    `matvec` method or a dense matrix, as a function of a vector."""
+    if isinstance(A, _spmatrix):
+        # the sparse array is multiplied directly, never densified
+        return A._ivy_array.matmul
+    if hasattr(A, "matvec"):
+
+        def matvec(x):
+            ret = A.matvec(x)
+            return ivy.asarray(getattr(ret, "ivy_array", ret))
+
+        return matvec
+    A = ivy.asarray(A)
+    return lambda x: ivy.matmul(A, x)
+
+
+def _identity(x):
+    return x
+
+
+def _init(A, b, x0, rtol, atol, maxiter, M):
+    """Return the matvec functions of `A` and `M`, the initial guess, the
+    absolute tolerance on the norm of the residual and the maximum number of
+    iterations of an iterative solver."""
+    b = ivy.asarray(b)
+    if not ivy.is_float_dtype(b):
+        b = ivy.astype(b, "float64")
+    matvec = _matvec(A)
+    psolve = _identity if M is None else _matvec(M)
+    x = ivy.zeros_like(b) if x0 is None else ivy.astype(ivy.asarray(x0), b.dtype)
+    tol = max(rtol * float(ivy.vector_norm(b)), atol)
+    maxiter = 10 * b.shape[0] if maxiter is None else maxiter
+    return b, matvec, psolve, x, tol, maxiter
+
+
+def _dot(x, y):
+    return float(ivy.vecdot(x, y))
+
+
+def _bicgstab(A, b, x0, rtol, atol, maxiter, M, callback):
+    b, matvec, psolve, x, tol, maxiter = _init(A, b, x0, rtol, atol, maxiter, M)
+    r = b - matvec(x) if x0 is not None else b
+    if float(ivy.vector_norm(r)) <= tol:
+        return x, 0
+    r_hat = r
+    rho = alpha = omega = 1.0
+    v = p = ivy.zeros_like(b)
+    for _ in range(maxiter):
+        rho_new = _dot(r_hat, r)
+        if rho_new == 0:
+            # rho breakdown
+            return x, -10
+        beta = (rho_new / rho) * (alpha / omega)
+        rho = rho_new
+        p = r + beta * (p - omega * v)
+        p_hat = psolve(p)
+        v = matvec(p_hat)
+        r_hat_v = _dot(r_hat, v)
+        if r_hat_v == 0:
+            # dot product breakdown, e.g. for singular matrices
+            return x, -11
+        alpha = rho / r_hat_v
+        s = r - alpha * v
+        if float(ivy.vector_norm(s)) <= tol:
+            x = x + alpha * p_hat
+            if callback is not None:
+                callback(x)
+            return x, 0
+        s_hat = psolve(s)
+        t = matvec(s_hat)
+        t_t = _dot(t, t)
+        if t_t == 0:
+            # omega breakdown
+            return x, -11
+        omega = _dot(t, s) / t_t
+        x = x + alpha * p_hat + omega * s_hat
+        r = s - omega * t
+        if callback is not None:
+            callback(x)
+        if float(ivy.vector_norm(r)) <= tol:
+            return x, 0
+        if omega == 0:
+            return x, -11
+    return x, maxiter
+
+
+# --- Main --- #
+# ------------ #
+
+
+@to_ivy_arrays_and_back
+def bicgstab(
+    A, b, x0=None, *, rtol=1e-05, atol=0.0, maxiter=None, M=None, callback=None
+):
+    return _bicgstab(A, b, x0, rtol, atol, maxiter, M, callback)
+
+
+@to_ivy_arrays_and_back
+def cg(A, b, x0=None, *, rtol=1e-05, atol=0.0, maxiter=None, M=None, callback=None):
+    b, matvec, psolve, x, tol, maxiter = _init(A, b, x0, rtol, atol, maxiter, M)
+    r = b - matvec(x) if x0 is not None else b
+    if float(ivy.vector_norm(r)) <= tol:
+        return x, 0
+    z = psolve(r)
+    p = z
+    rz = _dot(r, z)
+    for _ in range(maxiter):
+        Ap = matvec(p)
+        p_Ap = _dot(p, Ap)
+        if p_Ap == 0:
+            # dot product breakdown, e.g. for singular matrices
+            return x, -11
+        alpha = rz / p_Ap
+        x = x + alpha * p
+        r = r - alpha * Ap
+        if callback is not None:
+            callback(x)
+        if float(ivy.vector_norm(r)) <= tol:
+            return x, 0
+        z = psolve(r)
+        rz_new = _dot(r, z)
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+    return x, maxiter
+
+
+# the systems are solved iteratively, with BiCGSTAB to a tolerance close to the
+# precision of the dtype, rather than by factorising the matrix, so that it's
+# never densified. Like scipy for singular matrices, it warns and returns NaNs
+# when BiCGSTAB breaks down or doesn't converge
+@to_ivy_arrays_and_back
+def spsolve(A, b, permc_spec=None, use_umfpack=True):
+    b = ivy.asarray(b)
+    if not ivy.is_float_dtype(b):
+        b = ivy.astype(b, "float64")
+    rtol = float(ivy.finfo(b.dtype).eps) ** 0.75
+    columns = [b] if b.ndim == 1 else ivy.unstack(b, axis=1)
+    ret = []
+    for column in columns:
+        x, info = _bicgstab(A, column, None, rtol, 0.0, None, None, None)
+        if info != 0:
+            warnings.warn(
+                "BiCGSTAB did not converge, the matrix may be singular",
+                stacklevel=2,
+            )
+            x = ivy.full_like(column, ivy.nan)
+        ret.append(x)
+    return ret[0] if b.ndim == 1 else ivy.stack(ret, axis=1)
@@ -0,0 +1,404 @@
+# global
+import ivy
+from ivy.functional.frontends.numpy.func_wrapper import to_ivy_arrays_and_back
+import ivy.functional.frontends.numpy as np_frontend
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _asarray(x):
+    return ivy.asarray(getattr(x, "ivy_array", x))
+
+
+def _coo_from_dense(x):
+    x = _asarray(x)
+    if x.ndim != 2:
+        raise TypeError("expected dimension <= 2 array or matrix")
+    rows, cols = ivy.nonzero(x)
+    values = ivy.gather_nd(x, ivy.stack((rows, cols), axis=-1))
+    return ivy.SparseArray(
+        coo_indices=ivy.stack((rows, cols)),
+        values=values,
+        dense_shape=x.shape,
+        format="coo",
+    )
+
+
+def _sparse_array(arg1, shape, format):
+    """Return the `ivy.SparseArray` in the format `format` of the arguments
+    of a sparse matrix constructor."""
+    if isinstance(arg1, _spmatrix):
+        x = arg1._ivy_array
+    elif ivy.is_ivy_sparse_array(arg1):
+        x = arg1
+    elif isinstance(arg1, tuple) and len(arg1) == 2 and isinstance(arg1[1], tuple):
+        # (data, (row, col))
+        data, (row, col) = arg1
+        row = ivy.astype(_asarray(row), "int64")
+        col = ivy.astype(_asarray(col), "int64")
+        if shape is None:
+            shape = (int(ivy.max(row)) + 1, int(ivy.max(col)) + 1)
+        x = ivy.SparseArray(
+            coo_indices=ivy.stack((row, col)),
+            values=_asarray(data),
+            dense_shape=shape,
+            format="coo",
+        )
+    elif isinstance(arg1, tuple) and len(arg1) == 3:
+        # (data, indices, indptr)
+        if format == "coo":
+            raise TypeError("invalid input format")
+        data, indices, indptr = (_asarray(x) for x in arg1)
+        if shape is None:
+            shape = (indptr.shape[0] - 1, int(ivy.max(indices)) + 1)
+            shape = shape if format == "csr" else shape[::-1]
+        if format == "csr":
+            x = ivy.SparseArray(
+                crow_indices=indptr,
+                col_indices=indices,
+                values=data,
+                dense_shape=shape,
+                format="csr",
+            )
+        else:
+            x = ivy.SparseArray(
+                ccol_indices=indptr,
+                row_indices=indices,
+                values=data,
+                dense_shape=shape,
+                format="csc",
+            )
+    elif isinstance(arg1, tuple) and all(isinstance(i, int) for i in arg1):
+        # the shape of an empty matrix
+        x = ivy.SparseArray(
+            coo_indices=ivy.zeros((2, 0), dtype="int64"),
+            values=ivy.zeros((0,)),
+            dense_shape=arg1,
+            format="coo",
+        )
+    else:
+        x = _coo_from_dense(arg1)
+    if shape is not None and tuple(x.dense_shape) != tuple(shape):
+        raise ValueError(f"inconsistent shapes {tuple(x.dense_shape)} and {shape}")
+    return getattr(x, f"to_{format}")()
+
+
+def _wrap(x):
+    return {"csr": csr_matrix, "csc": csc_matrix, "coo": coo_matrix}[x.format](x)
+
+
+def _sum_duplicates(rows, cols, values, shape):
+    """Return the CSR array of the entries, those with the same coordinates
+    summed."""
+    keys, inverse = ivy.unique_inverse(rows * shape[1] + cols)
+    values = ivy.unsorted_segment_sum(values, inverse, keys.shape[0])
+    return ivy.SparseArray(
+        coo_indices=ivy.stack((keys // shape[1], keys % shape[1])),
+        values=values,
+        dense_shape=shape,
+        format="coo",
+    ).to_csr()
+
+
+def _sparse_matmul(a, b):
+    """Return the product of the CSR arrays `a` and `b`, each entry of `a`
+    being multiplied with all the entries of the matching row of `b`."""
+    a_rows = ivy.repeat(
+        ivy.arange(a.dense_shape[0], dtype="int64"), ivy.diff(a.crow_indices)
+    )
+    lengths = ivy.gather(ivy.diff(b.crow_indices), a.col_indices)
+    num_products = int(ivy.sum(lengths))
+    if num_products == 0:
+        return ivy.SparseArray(
+            crow_indices=ivy.zeros((a.dense_shape[0] + 1,), dtype="int64"),
+            col_indices=ivy.zeros((0,), dtype="int64"),
+            values=ivy.zeros((0,), dtype=ivy.promote_types(a.dtype, b.dtype)),
+            dense_shape=(a.dense_shape[0], b.dense_shape[1]),
+            format="csr",
+        )
+    # position in `b` of the entry of each product, the entries of the row of `b`
+    # matching an entry of `a` being consecutive
+    offsets = ivy.cumsum(lengths, exclusive=True)
+    starts = ivy.gather(b.crow_indices, a.col_indices) - offsets
+    positions = ivy.repeat(starts, lengths) + ivy.arange(num_products, dtype="int64")
+    return _sum_duplicates(
+        ivy.repeat(a_rows, lengths),
+        ivy.gather(b.col_indices, positions),
+        ivy.repeat(a.values, lengths) * ivy.gather(b.values, positions),
+        (a.dense_shape[0], b.dense_shape[1]),
+    )
+
+
+def _take_rows(x, rows):
+    """Return the rows `rows` of the CSR array `x`, gathering only their
+    entries."""
+    num_rows = rows.shape[0]
+    lengths = ivy.gather(ivy.diff(x.crow_indices), rows)
+    crow_indices = ivy.concat((
+        ivy.zeros((1,), dtype="int64"),
+        ivy.cumsum(lengths, dtype="int64"),
+    ))
+    nnz = int(crow_indices[-1])
+    starts = ivy.gather(x.crow_indices, rows) - crow_indices[:-1]
+    positions = ivy.repeat(starts, lengths) + ivy.arange(nnz, dtype="int64")
+    return ivy.SparseArray(
+        crow_indices=crow_indices,
+        col_indices=ivy.gather(x.col_indices, positions),
+        values=ivy.gather(x.values, positions),
+        dense_shape=(num_rows, x.dense_shape[1]),
+        format="csr",
+    )
+
+
+# --- Main --- #
+# ------------ #
+
+
+class _spmatrix:
+    """A sparse matrix backed by an `ivy.SparseArray`, on which all the
+    operations work on the stored entries only, without densifying it."""
+
+    format = None
+    ndim = 2
+    # numpy arrays defer their operators to the reflected ones of sparse matrices
+    __array_priority__ = 10.1
+    __array_ufunc__ = None
+
+    def __init__(self, arg1, shape=None, dtype=None, copy=False):
+        # the sparse array isn't exposed as `ivy_array`, which the frontend
+        # wrappers would take for a dense array
+        self._ivy_array = _sparse_array(arg1, shape, self.format)
+        if dtype is not None:
+            self._ivy_array = self._ivy_array._with_values(
+                ivy.astype(self._ivy_array.values, ivy.as_ivy_dtype(dtype))
+            )
+        elif copy:
+            self._ivy_array = self._ivy_array._with_values(
+                ivy.copy_array(self._ivy_array.values)
+            )
+
+    def __repr__(self):
+        num_rows, num_cols = self.shape
+        dtype = self._ivy_array.values.dtype
+        return (
+            f"<{num_rows}x{num_cols} sparse matrix of type '{dtype}' with"
+            f" {self.nnz} stored elements in {self.format.upper()} format>"
+        )
+
+    # Properties #
+    # ---------- #
+
+    @property
+    def shape(self):
+        return tuple(int(i) for i in self._ivy_array.dense_shape)
+
+    @property
+    def nnz(self):
+        return self._ivy_array.values.shape[0]
+
+    @property
+    def dtype(self):
+        return np_frontend.dtype(self._ivy_array.values.dtype)
+
+    @property
+    @to_ivy_arrays_and_back
+    def data(self):
+        return self._ivy_array.values
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    # Instance Methods #
+    # ---------------- #
+
+    def tocsr(self, copy=False):
+        return csr_matrix(self._ivy_array.to_csr(), copy=copy)
+
+    def tocsc(self, copy=False):
+        return csc_matrix(self._ivy_array.to_csc(), copy=copy)
+
+    def tocoo(self, copy=False):
+        return coo_matrix(self._ivy_array.to_coo(), copy=copy)
+
+    @to_ivy_arrays_and_back
+    def toarray(self, order=None, out=None):
+        return self._ivy_array.to_dense_array()
+
+    def transpose(self, axes=None, copy=False):
+        if axes is not None:
+            raise ValueError(
+                "Sparse matrices do not support an 'axes' parameter because swapping"
+                " dimensions is the only logical permutation."
+            )
+        return _wrap(self._ivy_array.T)
+
+    def astype(self, dtype, casting="unsafe", copy=True):
+        return _wrap(
+            self._ivy_array._with_values(
+                ivy.astype(self._ivy_array.values, ivy.as_ivy_dtype(dtype))
+            )
+        )
+
+    def copy(self):
+        values = ivy.copy_array(self._ivy_array.values)
+        return _wrap(self._ivy_array._with_values(values))
+
+    def dot(self, other):
+        return self @ other
+
+    @to_ivy_arrays_and_back
+    def _matmul_dense(self, other):
+        return self._ivy_array.matmul(other)
+
+    def __matmul__(self, other):
+        if isinstance(other, _spmatrix):
+            if self.shape[1] != other.shape[0]:
+                raise ValueError("dimension mismatch")
+            ret = csr_matrix(
+                _sparse_matmul(self._ivy_array.to_csr(), other._ivy_array.to_csr())
+            )
+            # as scipy, the product is in the format of self, COO being CSR
+            return ret.tocsc() if self.format == "csc" else ret
+        return self._matmul_dense(other)
+
+    @to_ivy_arrays_and_back
+    def __rmatmul__(self, other):
+        # x @ A is (A.T @ x.T).T, the transpose of a CSR (CSC) array being the CSC
+        # (CSR) array with the same indices
+        other = ivy.asarray(other)
+        if other.ndim == 1:
+            return self._ivy_array.T.matmul(other)
+        return ivy.matrix_transpose(
+            self._ivy_array.T.matmul(ivy.matrix_transpose(other))
+        )
+
+    def __mul__(self, other):
+        if ivy.isscalar(other):
+            return _wrap(self._ivy_array * other)
+        # the * of sparse matrices is the matrix product
+        return self @ other
+
+    def __rmul__(self, other):
+        if ivy.isscalar(other):
+            return _wrap(other * self._ivy_array)
+        return self.__rmatmul__(other)
+
+    def __truediv__(self, other):
+        if not ivy.isscalar(other):
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                "only division by a scalar is supported"
+            )
+        return _wrap(self._ivy_array / other)
+
+    def __neg__(self):
+        return _wrap(-self._ivy_array)
+
+    def __abs__(self):
+        return _wrap(abs(self._ivy_array))
+
+    @to_ivy_arrays_and_back
+    def sum(self, axis=None, dtype=None, out=None):
+        ret = self._ivy_array.sum(axis)
+        if dtype is not None:
+            ret = ivy.astype(ret, ivy.as_ivy_dtype(dtype))
+        # as scipy, which returns np.matrix, the row and column sums are 2D
+        if axis in (1, -1):
+            return ivy.expand_dims(ret, axis=1)
+        return ret if axis is None else ivy.expand_dims(ret, axis=0)
+
+    @to_ivy_arrays_and_back
+    def mean(self, axis=None, dtype=None, out=None):
+        ret = self._ivy_array.mean(axis)
+        if axis in (1, -1):
+            return ivy.expand_dims(ret, axis=1)
+        return ret if axis is None else ivy.expand_dims(ret, axis=0)
+
+    def getrow(self, i):
+        return self.tocsr()[i]
+
+    def __getitem__(self, key):
+        # only rows are selected, by an index, a slice or an array of indices
+        if isinstance(key, tuple):
+            if len(key) == 2 and key[1] == slice(None):
+                key = key[0]
+            else:
+                raise ivy.utils.exceptions.IvyNotImplementedException(
+                    "only the rows of sparse matrices can be indexed"
+                )
+        num_rows = self.shape[0]
+        if isinstance(key, int):
+            if not -num_rows <= key < num_rows:
+                raise IndexError(f"row index ({key}) out of range")
+            rows = ivy.array([key % num_rows], dtype="int64")
+        elif isinstance(key, slice):
+            rows = ivy.arange(*key.indices(num_rows), dtype="int64")
+        else:
+            rows = ivy.astype(_asarray(key), "int64") % num_rows
+        return csr_matrix(_take_rows(self._ivy_array.to_csr(), rows))
+
+
+class csr_matrix(_spmatrix):
+    format = "csr"
+
+    @property
+    @to_ivy_arrays_and_back
+    def indices(self):
+        return self._ivy_array.col_indices
+
+    @property
+    @to_ivy_arrays_and_back
+    def indptr(self):
+        return self._ivy_array.crow_indices
+
+
+class csc_matrix(_spmatrix):
+    format = "csc"
+
+    @property
+    @to_ivy_arrays_and_back
+    def indices(self):
+        return self._ivy_array.row_indices
+
+    @property
+    @to_ivy_arrays_and_back
+    def indptr(self):
+        return self._ivy_array.ccol_indices
+
+
+class coo_matrix(_spmatrix):
+    format = "coo"
+
+    @property
+    @to_ivy_arrays_and_back
+    def row(self):
+        return self._ivy_array.coo_indices[0]
+
+    @property
+    @to_ivy_arrays_and_back
+    def col(self):
+        return self._ivy_array.coo_indices[1]
+
+    def __getitem__(self, key):
+        raise TypeError("'coo_matrix' object is not subscriptable")
+
+
+def issparse(x):
+    return isinstance(x, _spmatrix)
+
+
+isspmatrix = issparse
+
+
+def isspmatrix_csr(x):
+    return isinstance(x, csr_matrix)
+
+
+def isspmatrix_csc(x):
+    return isinstance(x, csc_matrix)
+
+
+def isspmatrix_coo(x):
+    return isinstance(x, coo_matrix)
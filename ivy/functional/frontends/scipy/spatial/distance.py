@@ -4,10 +4,97 @@ from ivy.functional.frontends.numpy.func_wrapper import to_ivy_arrays_and_back
 import ivy.functional.frontends.scipy as sc_frontend
 
 
+# maximum size in bytes of the intermediate arrays of a block of distances, which
+# `cdist` and `pdist` compute one after the other
+_MAX_BLOCK_BYTES = 2**26
+
+# metrics computed from the products of the rows, with a matmul, rather than from
+# the differences of each pair of rows, broadcast against each other
+_MATMUL_METRICS = ("euclidean", "sqeuclidean", "cosine")
+
+
 # --- Helpers --- #
 # --------------- #
 
 
+def _block_shape(num_rows, num_cols, pair_bytes):
+    """Return the numbers of rows and columns of the blocks of distances, so
+    that their intermediate arrays take up at most `_MAX_BLOCK_BYTES`."""
+    cols = min(num_cols, max(1, _MAX_BLOCK_BYTES // pair_bytes))
+    rows = min(num_rows, max(1, _MAX_BLOCK_BYTES // (pair_bytes * cols)))
+    return rows, cols
+
+
+def _blocked_distances(distance_fn, a, b, cols):
+    """Return the distances between the rows of `a` and `b`, computed by blocks
+    of `cols` rows of `b`."""
+    blocks = [distance_fn(a, b[j : j + cols]) for j in range(0, b.shape[0], cols)]
+    return blocks[0] if len(blocks) == 1 else ivy.concat(blocks, axis=1)
+
+
+def _distance_fn(metric, num_features, p=None, w=None):
+    """Return the metric as a function computing the distances between the
+    rows of two blocks of vectors, and the number of bytes of its intermediate
+    arrays per pair of rows."""
+    if callable(metric):
+
+        def distance_fn(a, b):
+            rows = [[metric(u, v) for v in b] for u in a]
+            return ivy.asarray(rows, dtype="float64")
+
+        return distance_fn, 8
+    metric = metric.lower()
+    if metric == "minkowski":
+        p = 2 if p is None else p
+        if p <= 0:
+            raise ValueError("p must be greater than 0")
+        # the l1 and l2 distances are faster to compute as such
+        metric = {1: "cityblock", 2: "euclidean", ivy.inf: "chebyshev"}.get(p, metric)
+    if w is not None:
+        w = _validate_weights(w)
+        if w.shape[0] != num_features:
+            raise ValueError("Weights must have the same size as the vectors.")
+    if metric in _MATMUL_METRICS:
+        root_w = None if w is None else ivy.sqrt(w)
+
+        def distance_fn(a, b):
+            # the squared norms and products are computed once per block rather
+            # than once per pair of rows
+            if root_w is not None:
+                a, b = a * root_w, b * root_w
+            products = ivy.matmul(a, b, transpose_b=True)
+            a_norms = ivy.sum(a * a, axis=1, keepdims=True)
+            b_norms = ivy.sum(b * b, axis=1)
+            if metric == "cosine":
+                return 1 - products / ivy.sqrt(a_norms * b_norms)
+            dist = ivy.maximum(a_norms + b_norms - 2 * products, 0)
+            return dist if metric == "sqeuclidean" else ivy.sqrt(dist)
+
+        return distance_fn, 8 * 4
+    if metric not in ("cityblock", "chebyshev", "minkowski"):
+        raise ValueError(f"Unknown Distance Metric: {metric}")
+
+    def distance_fn(a, b):
+        diff = ivy.abs(ivy.expand_dims(a, axis=1) - ivy.expand_dims(b, axis=0))
+        if metric == "chebyshev":
+            if w is not None:
+                diff = diff * (w != 0)
+            return ivy.max(diff, axis=-1)
+        if metric == "cityblock":
+            return ivy.sum(diff if w is None else diff * w, axis=-1)
+        diff = diff**p
+        return ivy.sum(diff if w is None else diff * w, axis=-1) ** (1 / p)
+
+    return distance_fn, 8 * 2 * num_features
+
+
+def _validate_matrix(x, name):
+    x = ivy.asarray(x, dtype="float64")
+    if x.ndim != 2:
+        raise ValueError(f"{name} must be a 2-dimensional array.")
+    return x
+
+
 def _validate_vector(u, dtype=None):
     u = ivy.asarray(u, dtype=dtype)
     if u.ndim == 1:
@@ -26,6 +113,32 @@ def _validate_weights(w, dtype="float64"):
 # ------------ #
 
 
+@to_ivy_arrays_and_back
+def cdist(XA, XB, metric="euclidean", *, out=None, p=None, w=None):
+    XA = _validate_matrix(XA, "XA")
+    XB = _validate_matrix(XB, "XB")
+    if XA.shape[1] != XB.shape[1]:
+        raise ValueError(
+            "XA and XB must have the same number of columns "
+            "(i.e. feature dimension.)"
+        )
+    distance_fn, pair_bytes = _distance_fn(metric, XA.shape[1], p=p, w=w)
+    if not XA.shape[0] or not XB.shape[0]:
+        ret = ivy.zeros((XA.shape[0], XB.shape[0]), dtype="float64")
+    else:
+        # the distances are computed by blocks of rows and columns rather than all
+        # at once, so that the intermediate arrays fit in memory for large inputs
+        rows, cols = _block_shape(XA.shape[0], XB.shape[0], pair_bytes)
+        ret = [
+            _blocked_distances(distance_fn, XA[i : i + rows], XB, cols)
+            for i in range(0, XA.shape[0], rows)
+        ]
+        ret = ret[0] if len(ret) == 1 else ivy.concat(ret, axis=0)
+    if out is not None:
+        return ivy.inplace_update(out, ret)
+    return ret
+
+
 # euclidean
 @to_ivy_arrays_and_back
 def euclidean(u, v, /, *, w=None):
@@ -36,6 +149,33 @@ def euclidean(u, v, /, *, w=None):
 # --------- #
 
 
+@to_ivy_arrays_and_back
+def pdist(X, metric="euclidean", *, out=None, p=None, w=None):
+    X = _validate_matrix(X, "X")
+    num_rows = X.shape[0]
+    distance_fn, pair_bytes = _distance_fn(metric, X.shape[1], p=p, w=w)
+    # the distances between each row and the following ones are computed by blocks
+    # of rows, and the upper triangle of each block is kept, in the order of the
+    # condensed distance matrix
+    ret = []
+    i = 0
+    while i < num_rows - 1:
+        rows, cols = _block_shape(num_rows - 1 - i, num_rows - 1 - i, pair_bytes)
+        block = _blocked_distances(distance_fn, X[i : i + rows], X[i + 1 :], cols)
+        upper = ivy.expand_dims(ivy.arange(rows), axis=1) <= ivy.arange(
+            num_rows - 1 - i
+        )
+        ret.append(block[upper])
+        i += rows
+    if not ret:
+        ret = ivy.zeros((0,), dtype="float64")
+    else:
+        ret = ret[0] if len(ret) == 1 else ivy.concat(ret)
+    if out is not None:
+        return ivy.inplace_update(out, ret)
+    return ret
+
+
 # minkowski
 @to_ivy_arrays_and_back
 def minkowski(u, v, p=2, /, *, w=None):
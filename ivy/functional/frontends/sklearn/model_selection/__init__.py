@@ -1,2 +1,4 @@
 from . import _split
 from ._split import *
+from . import _validation
+from ._validation import *
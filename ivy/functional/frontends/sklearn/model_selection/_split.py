@@ -38,22 +38,41 @@ class KFold(BaseCrossValidator):
         self.shuffle = shuffle
         self.random_state = random_state
 
+    def _fold_bounds(self, n_samples):
+        """Yield the start and stop of each fold, the first `n_samples %
+        n_splits` of which have one more sample than the others."""
+        fold_size, remainder = divmod(n_samples, self.n_splits)
+        current = 0
+        for i in range(self.n_splits):
+            stop = current + fold_size + (i < remainder)
+            yield current, stop
+            current = stop
+
+    def split(self, X, y=None, groups=None):
+        # the indices of each fold are slices of a single permutation of the
+        # samples, or ranges if they aren't shuffled, rather than gathered with
+        # masks over all the samples
+        n_samples = X.shape[0]
+        if self.shuffle:
+            indices = ivy.shuffle(ivy.arange(n_samples), seed=self.random_state)
+        for start, stop in self._fold_bounds(n_samples):
+            if self.shuffle:
+                test_index = indices[start:stop]
+                train_index = ivy.concat((indices[:start], indices[stop:]))
+            else:
+                test_index = ivy.arange(start, stop)
+                train_index = ivy.concat(
+                    (ivy.arange(start), ivy.arange(stop, n_samples))
+                )
+            yield train_index, test_index
+
     def _iter_test_indices(self, X=None, y=None, groups=None):
         n_samples = X.shape[0]
         indices = ivy.arange(n_samples)
         if self.shuffle:
             indices = ivy.shuffle(indices, seed=self.random_state)
-
-        n_splits = self.n_splits
-        fold_sizes = ivy.full(
-            n_splits, n_samples // n_splits, dtype=ivy.default_int_dtype()
-        )
-        fold_sizes[: n_samples % n_splits] += 1
-        current = 0
-        for fold_size in fold_sizes:
-            start, stop = current, current + fold_size
+        for start, stop in self._fold_bounds(n_samples):
             yield indices[start:stop]
-            current = stop
 
     def get_n_splits(self, X=None, y=None, groups=None):
         return self.n_splits
@@ -73,12 +92,13 @@ class StratifiedKFold(KFold):
             random_state=random_state,
         )
 
-    def _iter_test_indices(self, X=None, y=None, groups=None):
-        ivy.seed(seed_value=self.random_state)
+    def _iter_test_masks(self, X=None, y=None, groups=None):
+        if self.random_state is not None:
+            ivy.seed(seed_value=self.random_state)
         y = ivy.array(y)
         y = column_or_1d(y)
         _, y_idx, y_inv, _ = ivy.unique_all(y)
-        class_perm = ivy.unique_inverse(y_idx)
+        _, class_perm = ivy.unique_inverse(y_idx)
         y_encoded = class_perm[y_inv]
 
         n_classes = len(y_idx)
@@ -99,7 +119,7 @@ class StratifiedKFold(KFold):
             yield test_folds == i
 
     def split(self, X, y, groups=None):
-        return super().split(X, y, groups)
+        return BaseCrossValidator.split(self, X, y, groups)
 
 
 @to_ivy_arrays_and_back
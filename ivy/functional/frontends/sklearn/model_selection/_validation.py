@@ -0,0 +1,88 @@
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import ivy
+from ivy.functional.frontends.numpy.func_wrapper import to_ivy_arrays_and_back
+from ivy.functional.frontends.sklearn.base import ClassifierMixin
+from ivy.functional.frontends.sklearn.utils.multiclass import type_of_target
+from ._split import KFold, StratifiedKFold
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _check_cv(cv, y, classifier):
+    if cv is None:
+        cv = 5
+    if isinstance(cv, int):
+        if (
+            classifier
+            and y is not None
+            and type_of_target(y) in ("binary", "multiclass")
+        ):
+            return StratifiedKFold(cv)
+        return KFold(cv)
+    return cv
+
+
+def _fit_and_predict(estimator, X, y, train, test, fit_params, method):
+    estimator = copy.deepcopy(estimator)
+    X_train = ivy.gather(X, train, axis=0)
+    if y is None:
+        estimator.fit(X_train, **fit_params)
+    else:
+        estimator.fit(X_train, ivy.gather(y, train, axis=0), **fit_params)
+    return ivy.asarray(getattr(estimator, method)(ivy.gather(X, test, axis=0)))
+
+
+def _num_workers(n_jobs, n_splits):
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+    return max(1, min(n_jobs, n_splits))
+
+
+# --- Main --- #
+# ------------ #
+
+
+@to_ivy_arrays_and_back
+def cross_val_predict(
+    estimator,
+    X,
+    y=None,
+    *,
+    groups=None,
+    cv=None,
+    n_jobs=None,
+    fit_params=None,
+    method="predict",
+):
+    cv = _check_cv(cv, y, isinstance(estimator, ClassifierMixin))
+    fit_params = {} if fit_params is None else fit_params
+    splits = list(cv.split(X, y, groups))
+    test_indices = ivy.concat([test for _, test in splits])
+    n_samples = X.shape[0]
+    if test_indices.shape[0] != n_samples or not ivy.array_equal(
+        ivy.sort(test_indices), ivy.arange(n_samples)
+    ):
+        raise ValueError("cross_val_predict only works for partitions")
+
+    # the folds are fitted and predicted concurrently by a pool of threads, which
+    # the backends release the gil to while running their kernels
+    def fit_and_predict(split):
+        train, test = split
+        return _fit_and_predict(estimator, X, y, train, test, fit_params, method)
+
+    n_workers = _num_workers(n_jobs, len(splits))
+    if n_workers == 1:
+        predictions = [fit_and_predict(split) for split in splits]
+    else:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            predictions = list(executor.map(fit_and_predict, splits))
+    # the predictions of the folds are put back in the order of the samples
+    inv_test_indices = ivy.argsort(test_indices)
+    return ivy.gather(ivy.concat(predictions), inv_test_indices, axis=0)
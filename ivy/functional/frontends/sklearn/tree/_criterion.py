@@ -36,6 +36,19 @@ class Criterion(ABC):
             - (self.weighted_n_left / self.weighted_n_node_samples * impurity_left)
         )
 
+    def proxy_impurity_improvements(
+        self, sum_left, sum_right, weighted_n_left, weighted_n_right
+    ):
+        """Vectorised proxy_impurity_improvement over many candidate splits.
+
+        The class sums have shape ``(..., n_outputs, max_n_classes)`` and the
+        weighted sample counts the matching leading shape ``(...)``.
+        """
+        impurity_left, impurity_right = self.children_impurities(
+            sum_left, sum_right, weighted_n_left, weighted_n_right
+        )
+        return -weighted_n_right * impurity_right - weighted_n_left * impurity_left
+
     def node_value(self, dest, node_id):
         return dest
 
@@ -84,22 +97,21 @@ class ClassificationCriterion(Criterion):
         self.end = end
         self.n_node_samples = end - start
         self.weighted_n_samples = weighted_n_samples
-        self.weighted_n_node_samples = 0.0
-        w = 1.0
+
+        node_indices = sample_indices[start:end]
+        y_node = ivy.astype(ivy.gather(y, node_indices, axis=0), ivy.int64)
+        if sample_weight is None:
+            w = None
+            self.weighted_n_node_samples = float(end - start)
+        else:
+            w = ivy.gather(sample_weight, node_indices, axis=0)
+            self.weighted_n_node_samples = ivy.to_scalar(ivy.sum(w))
 
         for k in range(self.n_outputs):
             n_cls = ivy.to_scalar(self.n_classes[k])
-            self.sum_total[k, :n_cls] = 0
-
-        for p in range(start, end):
-            i = sample_indices[p]
-            if sample_weight is not None:
-                w = sample_weight[i]
-            for k in range(self.n_outputs):
-                c = int(self.y[i, k])
-                self.sum_total[k, c] += w
-
-            self.weighted_n_node_samples += w
+            self.sum_total[k, :n_cls] = ivy.bincount(
+                y_node[:, k], weights=w, minlength=n_cls
+            )
 
         self.reset()
         return 0
@@ -239,6 +251,19 @@ class Gini(ClassificationCriterion):
         impurity_right = gini_right / self.n_outputs
         return impurity_left, impurity_right
 
+    def children_impurities(
+        self, sum_left, sum_right, weighted_n_left, weighted_n_right
+    ):
+        weighted_n_left = ivy.expand_dims(weighted_n_left, axis=-1)
+        weighted_n_right = ivy.expand_dims(weighted_n_right, axis=-1)
+        gini_left = 1.0 - ivy.sum(sum_left * sum_left, axis=-1) / (
+            weighted_n_left * weighted_n_left
+        )
+        gini_right = 1.0 - ivy.sum(sum_right * sum_right, axis=-1) / (
+            weighted_n_right * weighted_n_right
+        )
+        return ivy.mean(gini_left, axis=-1), ivy.mean(gini_right, axis=-1)
+
 
 # --- Helpers --- #
 # --------------- #
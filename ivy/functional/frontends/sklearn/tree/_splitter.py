@@ -30,22 +30,16 @@ class Splitter:
         *args,
     ):
         n_samples = X.shape[0]
-        self.samples = ivy.empty(n_samples, dtype=ivy.int32)
-        samples = self.samples
-        j = 0
-        weighted_n_samples = 0.0
-
-        for i in range(n_samples):
-            if sample_weight is None or sample_weight[i] != 0.0:
-                samples[j] = i
-                j += 1
-            if sample_weight is not None:
-                weighted_n_samples += sample_weight[i]
-            else:
-                weighted_n_samples += 1.0
+        if sample_weight is None:
+            self.samples = ivy.arange(n_samples, dtype=ivy.int32)
+            weighted_n_samples = float(n_samples)
+        else:
+            self.samples = ivy.astype(ivy.nonzero(sample_weight)[0], ivy.int32)
+            weighted_n_samples = ivy.to_scalar(ivy.sum(sample_weight))
 
-        self.n_samples = j
+        self.n_samples = self.samples.shape[0]
         self.weighted_n_samples = weighted_n_samples
+        self.X = X
         n_features = X.shape[1]
         self.features = ivy.arange(n_features, dtype=ivy.int32)
         self.n_features = n_features
@@ -53,6 +47,7 @@ class Splitter:
         self.constant_features = ivy.empty(n_features, dtype=ivy.int32)
         self.y = y
         self.sample_weight = sample_weight
+        self.missing_values_in_feature_mask = missing_values_in_feature_mask
         if missing_values_in_feature_mask is not None:
             self.criterion.init_sum_missing()
         return 0
@@ -124,7 +119,7 @@ class DensePartitioner:
                     current_end -= 1
                     continue
                 if ivy.isnan(X[samples[i], current_feature]):
-                    samples[i], samples[current_end] = samples[current_end], samples[i]
+                    _swap(samples, i, current_end)
                     n_missing += 1
                     current_end -= 1
                 feature_values[i] = X[samples[i], current_feature]
@@ -189,14 +184,8 @@ class DensePartitioner:
             else:
                 partition_end -= 1
 
-                feature_values[p], feature_values[partition_end] = (
-                    feature_values[partition_end],
-                    feature_values[p],
-                )
-                samples[p], samples[partition_end] = (
-                    samples[partition_end],
-                    samples[p],
-                )
+                _swap(feature_values, p, partition_end)
+                _swap(samples, p, partition_end)
         return partition_end
 
     def partition_samples_final(
@@ -220,26 +209,20 @@ class DensePartitioner:
                     continue
                 current_value = X[samples[p], best_feature]
                 if ivy.isnan(current_value):
-                    samples[p], samples[end] = samples[end], samples[p]
+                    _swap(samples, p, end)
                     end -= 1
                     current_value = X[samples[p], best_feature]
                 if current_value <= best_threshold:
                     p += 1
                 else:
-                    samples[p], samples[partition_end] = (
-                        samples[partition_end],
-                        samples[p],
-                    )
+                    _swap(samples, p, partition_end)
                     partition_end -= 1
         else:
             while p < partition_end:
                 if X[samples[p], best_feature] <= best_threshold:
                     p += 1
                 else:
-                    samples[p], samples[partition_end] = (
-                        samples[partition_end],
-                        samples[p],
-                    )
+                    _swap(samples, p, partition_end)
                     partition_end -= 1
         self.samples = samples
 
@@ -281,6 +264,12 @@ class BestSplitter(Splitter):
         )
 
     def node_split(self, impurity, split, n_constant_features):
+        if self.missing_values_in_feature_mask is None and hasattr(
+            self.criterion, "children_impurities"
+        ):
+            return node_split_best_vectorized(
+                self, self.criterion, impurity, split, n_constant_features
+            )
         return node_split_best(
             self,
             self.partitioner,
@@ -295,6 +284,11 @@ class BestSplitter(Splitter):
 # --------------- #
 
 
+def _swap(x, i, j):
+    # read both values out first, indexing may return views into ``x``
+    x[i], x[j] = ivy.to_scalar(x[j]), ivy.to_scalar(x[i])
+
+
 def _init_split(split_record, start_pos):
     split_record.impurity_left = ivy.inf
     split_record.impurity_right = ivy.inf
@@ -350,10 +344,7 @@ def node_split_best(
         f_j = ivy.randint(n_drawn_constants, f_i - n_found_constants)
 
         if f_j < n_known_constants:
-            features[n_drawn_constants], features[f_j] = (
-                features[f_j],
-                features[n_drawn_constants],
-            )
+            _swap(features, n_drawn_constants, f_j)
 
             n_drawn_constants += 1
             continue
@@ -361,7 +352,7 @@ def node_split_best(
         # f_j in the interval [n_known_constants, f_i - n_found_constants[
         f_j += n_found_constants
         # f_j in the interval [n_total_constants, f_i[
-        current_split.feature = features[f_j]
+        current_split.feature = int(features[f_j])
         partitioner.sort_samples_and_feature_values(current_split.feature)
         n_missing = partitioner.n_missing
         end_non_missing = end - n_missing
@@ -371,17 +362,14 @@ def node_split_best(
             or feature_values[end_non_missing - 1]
             <= feature_values[start] + FEATURE_THRESHOLD
         ):
-            features[f_j], features[n_total_constants] = (
-                features[n_total_constants],
-                features[f_j],
-            )
+            _swap(features, f_j, n_total_constants)
 
             n_found_constants += 1
             n_total_constants += 1
             continue
 
         f_i -= 1
-        features[f_i], features[f_j] = features[f_j], features[f_i]
+        _swap(features, f_i, f_j)
         has_missing = n_missing != 0
         criterion.init_missing(n_missing)
         n_searches = 2 if has_missing else 1
@@ -502,6 +490,159 @@ def node_split_best(
     return 0, n_constant_features, split
 
 
+def node_split_best_vectorized(
+    splitter, criterion, impurity, split, n_constant_features
+):
+    """Find the best split of the node like `node_split_best`, but with array ops.
+
+    The node's samples are sorted along every feature at once and the weighted
+    class counts left of each position are accumulated with a cumulative sum,
+    so the proxy improvement of every (position, feature) candidate is
+    evaluated in one go rather than by updating the criterion sample by
+    sample. Features are then drawn in the same order as in `node_split_best`
+    to pick the best of them. Missing values aren't supported.
+    """
+    start = splitter.start
+    end = splitter.end
+    samples = splitter.samples
+    features = splitter.features
+    constant_features = splitter.constant_features
+    n_features = splitter.n_features
+    max_features = splitter.max_features
+    min_samples_leaf = splitter.min_samples_leaf
+    min_weight_leaf = splitter.min_weight_leaf
+    n_node_samples = end - start
+
+    node_samples = samples[start:end]
+    X_node = ivy.gather(splitter.X, node_samples, axis=0)
+    order = ivy.argsort(X_node, axis=0)
+    feature_values = ivy.sort(X_node, axis=0)
+
+    # weighted one-hot class counts of shape (n_node_samples, n_outputs, n_classes)
+    y_node = ivy.astype(ivy.gather(splitter.y, node_samples, axis=0), ivy.int64)
+    if splitter.sample_weight is None:
+        w = ivy.ones(n_node_samples, dtype=ivy.float64)
+    else:
+        w = ivy.astype(
+            ivy.gather(splitter.sample_weight, node_samples, axis=0), ivy.float64
+        )
+    counts = ivy.one_hot(
+        y_node, criterion.max_n_classes, dtype=ivy.float64
+    ) * ivy.reshape(w, (-1, 1, 1))
+
+    # candidate i (of shape (n_node_samples - 1, n_features)) splits the sorted
+    # samples into [0, i] and [i + 1, n_node_samples)
+    sum_left = ivy.cumsum(ivy.gather(counts, order, axis=0), axis=0)[:-1]
+    sum_right = criterion.sum_total - sum_left
+    weighted_n_left = ivy.cumsum(ivy.gather(w, order, axis=0), axis=0)[:-1]
+    weighted_n_right = criterion.weighted_n_node_samples - weighted_n_left
+    n_left = ivy.expand_dims(ivy.arange(1, n_node_samples), axis=-1)
+    valid = (
+        (feature_values[1:] > feature_values[:-1] + FEATURE_THRESHOLD)
+        & (n_left >= min_samples_leaf)
+        & (n_node_samples - n_left >= min_samples_leaf)
+        & (weighted_n_left >= min_weight_leaf)
+        & (weighted_n_right >= min_weight_leaf)
+    )
+    proxy_improvements = ivy.where(
+        valid,
+        criterion.proxy_impurity_improvements(
+            sum_left, sum_right, weighted_n_left, weighted_n_right
+        ),
+        -ivy.inf,
+    )
+    best_positions = ivy.to_list(ivy.argmax(proxy_improvements, axis=0))
+    best_proxy_improvements = ivy.to_list(ivy.max(proxy_improvements, axis=0))
+    is_constant = ivy.to_list(
+        feature_values[-1] <= feature_values[0] + FEATURE_THRESHOLD
+    )
+
+    best_feature = None
+    best_proxy_improvement = -ivy.inf
+    f_i = n_features
+    n_visited_features = 0
+    # Number of features discovered to be constant during the split search
+    n_found_constants = 0
+    # Number of features known to be constant and drawn without replacement
+    n_drawn_constants = 0
+    n_known_constants = n_constant_features
+    n_total_constants = n_known_constants
+    while f_i > n_total_constants and (
+        n_visited_features < max_features
+        or n_visited_features <= n_found_constants + n_drawn_constants
+    ):
+        n_visited_features += 1
+        f_j = int(ivy.randint(n_drawn_constants, f_i - n_found_constants))
+
+        if f_j < n_known_constants:
+            _swap(features, n_drawn_constants, f_j)
+
+            n_drawn_constants += 1
+            continue
+
+        f_j += n_found_constants
+        current_feature = int(features[f_j])
+
+        if is_constant[current_feature]:
+            _swap(features, f_j, n_total_constants)
+
+            n_found_constants += 1
+            n_total_constants += 1
+            continue
+
+        f_i -= 1
+        _swap(features, f_i, f_j)
+        if best_proxy_improvements[current_feature] > best_proxy_improvement:
+            best_proxy_improvement = best_proxy_improvements[current_feature]
+            best_feature = current_feature
+
+    best_split = _init_split(SplitRecord(), end)
+    if best_feature is not None:
+        i = best_positions[best_feature]
+        threshold = (
+            feature_values[i, best_feature] / 2.0
+            + feature_values[i + 1, best_feature] / 2.0
+        )
+        if threshold in (feature_values[i + 1, best_feature], ivy.inf, -ivy.inf):
+            threshold = feature_values[i, best_feature]
+
+        # Reorganize into samples[start:best_split.pos] + samples[best_split.pos:end]
+        goes_left = X_node[:, best_feature] <= threshold
+        samples[start:end] = ivy.concat(
+            [node_samples[goes_left], node_samples[ivy.logical_not(goes_left)]]
+        )
+
+        best_split.feature = best_feature
+        best_split.threshold = threshold
+        best_split.pos = start + i + 1
+        best_split.missing_go_to_left = i + 1 > n_node_samples - i - 1
+
+        criterion.pos = best_split.pos
+        criterion.sum_left = sum_left[i, best_feature]
+        criterion.sum_right = sum_right[i, best_feature]
+        criterion.weighted_n_left = ivy.to_scalar(weighted_n_left[i, best_feature])
+        criterion.weighted_n_right = ivy.to_scalar(weighted_n_right[i, best_feature])
+        impurity_left, impurity_right = criterion.children_impurities(
+            criterion.sum_left,
+            criterion.sum_right,
+            criterion.weighted_n_left,
+            criterion.weighted_n_right,
+        )
+        best_split.impurity_left = ivy.to_scalar(impurity_left)
+        best_split.impurity_right = ivy.to_scalar(impurity_right)
+        best_split.improvement = criterion.impurity_improvement(
+            impurity, best_split.impurity_left, best_split.impurity_right
+        )
+
+    features[0:n_known_constants] = constant_features[0:n_known_constants]
+    constant_features[n_known_constants:n_found_constants] = features[
+        n_known_constants:n_found_constants
+    ]
+
+    n_constant_features = n_total_constants
+    return 0, n_constant_features, best_split
+
+
 def sort(feature_values, samples, n):
     if n == 0:
         return
@@ -38,6 +38,16 @@ class TensorArray:
         if isinstance(size, EagerTensor):
             size = size.ivy_array
         self._tensor_array = [None for _ in range(size)]
+        # once the shape of the elements is fully known, they are written into a
+        # preallocated buffer of shape (capacity, *element_shape) instead, in which
+        # the indices cleared by reads are zeroed
+        self._buffer = None
+        self._length = 0
+        self._cleared = set()
+        # whether the elements have different shapes, and hence can't be dense
+        self._ragged = False
+        self._inplace = ivy.inplace_arrays_supported()
+        self._maybe_to_dense()
         self._parent = weakref.ref(self)
 
     @property
@@ -56,6 +66,76 @@ class TensorArray:
     def element_shape(self):
         return self._element_shape
 
+    def _num_elements(self):
+        if self._buffer is not None:
+            return self._length
+        return len(self._tensor_array)
+
+    def _maybe_to_dense(self):
+        """Move the elements to a dense buffer if their shape is fully known and
+        the backend can update the buffer in place."""
+        if (
+            self._buffer is not None
+            or self._ragged
+            or self._element_shape is None
+            or not self._inplace
+        ):
+            return
+        shape = tuple(self._element_shape)
+        if any(dim is None for dim in shape):
+            return
+        if any(
+            tensor is not None and tuple(tensor.ivy_array.shape) != shape
+            for tensor in self._tensor_array
+        ):
+            self._ragged = True
+            return
+        length = len(self._tensor_array)
+        buffer = ivy.zeros((max(length, 1), *shape), dtype=self._dtype.ivy_dtype).data
+        for index, tensor in enumerate(self._tensor_array):
+            if tensor is not None:
+                buffer[index] = tensor.ivy_array.data
+            elif index in self._previously_read_indices:
+                self._cleared.add(index)
+        self._buffer, self._length, self._tensor_array = buffer, length, None
+
+    def _to_list(self):
+        if self._buffer is None:
+            return
+        self._tensor_array = [
+            None if index in self._cleared else self._dense_read(index)
+            for index in range(self._length)
+        ]
+        self._buffer, self._length = None, 0
+        self._cleared.clear()
+
+    def _set_elements(self, tensors):
+        self._buffer, self._length = None, 0
+        self._cleared.clear()
+        self._ragged = False
+        self._tensor_array = tensors
+        self._maybe_to_dense()
+
+    def _dense_read(self, index):
+        # the buffer is updated in place, so the elements are read as copies
+        return EagerTensor(ivy.copy_array(self._buffer[index]))
+
+    def _dense_write(self, index, value):
+        if index >= self._length:
+            capacity = self._buffer.shape[0]
+            if index >= capacity:
+                # grow the buffer geometrically so that writing the elements one
+                # after the other reallocates it a logarithmic number of times
+                capacity = max(index + 1, 2 * capacity)
+                buffer = ivy.zeros(
+                    (capacity, *self._buffer.shape[1:]), dtype=self._dtype.ivy_dtype
+                ).data
+                buffer[: self._length] = self._buffer[: self._length]
+                self._buffer = buffer
+            self._length = index + 1
+        self._buffer[index] = value.ivy_array.data
+        self._cleared.discard(index)
+
     def identity(self):
         return self._parent()
 
@@ -81,12 +161,25 @@ class TensorArray:
         if index < 0:
             raise IndexError(f"Reading from negative indices {index} is not allowed.")
 
-        if index >= len(self._tensor_array):
+        if index >= self._num_elements():
             raise IndexError(
                 f"Tried to read from index {index} but array size is:"
-                f" {len(self._tensor_array)} "
+                f" {self._num_elements()} "
             )
 
+        if self._buffer is not None:
+            if index in self._cleared:
+                raise ValueError(
+                    f"Could not read index {index} twice because it was cleared after a"
+                    " previous read (perhaps try setting clear_after_read = false?)"
+                )
+            tensor = self._dense_read(index)
+            if self._clear_after_read:
+                self._buffer[index] = 0
+                self._cleared.add(index)
+                self._previously_read_indices.append(index)
+            return tensor
+
         tensor = self._tensor_array[index]
         if tensor is None:
             if index in self._previously_read_indices:
@@ -111,14 +204,13 @@ class TensorArray:
         if index < 0:
             raise IndexError(f"Reading from negative indices {index} is not allowed.")
 
-        size = len(self._tensor_array)
+        size = self._num_elements()
         if index >= size:
             if not self._dynamic_size:
                 raise IndexError(
                     "Tried to write to index {index} but array is not resizeable and"
                     " size is: {size}"
                 )
-            self._tensor_array.extend(None for _ in range(index - size + 1))
 
         if not isinstance(value, EagerTensor):
             value = tf_frontend.cast(value, self.dtype)
@@ -132,15 +224,27 @@ class TensorArray:
         if self._infer_shape:
             self._element_shape = self._merge_shape(value)
 
+        self._maybe_to_dense()
+        if self._buffer is not None:
+            if tuple(value.ivy_array.data.shape) == tuple(self._buffer.shape[1:]):
+                self._dense_write(index, value)
+                return
+            # the elements don't all have the shape of the buffer
+            self._to_list()
+            self._ragged = True
+        size = len(self._tensor_array)
+        if index >= size:
+            self._tensor_array.extend(None for _ in range(index - size + 1))
         self._tensor_array[index] = value
 
     def _merge_shape(self, value):
+        value_shape = value.shape
         if self._element_shape is None:
-            return value.shape
-        if len(self._element_shape) != len(value.shape):
+            return value_shape
+        if len(self._element_shape) != len(value_shape):
             raise ValueError("Shapes not compatible")
         shape = []
-        for a, b in zip(self._element_shape, value.shape):
+        for a, b in zip(self._element_shape, value_shape):
             if a == b or a is None:
                 shape.append(b)
             else:
@@ -152,6 +256,8 @@ class TensorArray:
         return self._parent()
 
     def stack(self, name=None):
+        if self._buffer is not None:
+            return EagerTensor(ivy.copy_array(self._buffer[: self._length]))
         if self._tensor_array:
             for ix in range(len(self._tensor_array)):
                 if self._tensor_array[ix] is None:
@@ -176,9 +282,23 @@ class TensorArray:
     def gather(self, indices, name=None):
         if isinstance(indices, EagerTensor):
             indices = indices.ivy_array
+        if self._buffer is not None:
+            indices = ivy.to_list(indices) if ivy.is_array(indices) else list(indices)
+            for index in indices:
+                if not -self._length <= index < self._length:
+                    raise IndexError(
+                        f"Tried to read from index {index} but array size is:"
+                        f" {self._length} "
+                    )
+            indices = [index % self._length for index in indices]
+            return EagerTensor(ivy.Array(self._buffer[indices]))
         return tf_frontend.stack([self._maybe_zero(i) for i in indices])
 
     def concat(self, name=None):
+        if self._buffer is not None and self._buffer.ndim > 1:
+            buffer = ivy.copy_array(self._buffer[: self._length])
+            return EagerTensor(ivy.reshape(buffer, (-1, *buffer.shape[2:])))
+        self._to_list()
         return tf_frontend.concat(
             [self._maybe_zero(ix) for ix in range(len(self._tensor_array))],
             0,
@@ -187,12 +307,12 @@ class TensorArray:
 
     def unstack(self, value, name=None):
         tensors = tf_frontend.unstack(value, name=name)
-        if len(tensors) > len(self._tensor_array) and not self._dynamic_size:
+        if len(tensors) > self._num_elements() and not self._dynamic_size:
             raise ValueError(
                 f"Cannot unstack {len(tensors)} tensors into a TensorArray of static"
-                f" size {len(self._tensor_array)} "
+                f" size {self._num_elements()} "
             )
-        self._tensor_array = tensors
+        self._set_elements(tensors)
         return self._parent()
 
     def scatter(self, indices, value, name=None):
@@ -203,10 +323,10 @@ class TensorArray:
         return self._parent()
 
     def size(self, name=None):
-        return tf_frontend.constant(len(self._tensor_array))
+        return tf_frontend.constant(self._num_elements())
 
     def close(self, name=None):
-        del self._tensor_array[:]
+        self._set_elements([])
 
     def split(self, value, lengths, name=None):
         value = tf_frontend.cast(value, self.dtype)
@@ -215,5 +335,5 @@ class TensorArray:
             if not isinstance(lengths, EagerTensor)
             else lengths
         )
-        self._tensor_array = tf_frontend.split(value, lengths, name=name)
+        self._set_elements(tf_frontend.split(value, lengths, name=name))
         return self._parent()
@@ -29,7 +29,10 @@ class AccumulateGrad:
         return self.__name__ == __value
 
     def __call__(self, grads):
-        self.__self__._grads = grads
+        if self.__self__._grads is None:
+            self.__self__._grads = grads
+        else:
+            self.__self__._grads = self.__self__._grads + grads
         return None
 
 
@@ -68,6 +71,11 @@ class GradFn:
         self.__name__ = fn.__name__.capitalize() + "Backward"
 
     def __call__(self, prev_grads):
+        if self._fns is None:
+            raise RuntimeError(
+                "Trying to backward through the graph a second time, specify "
+                "retain_graph=True if you need to backward through it again"
+            )
         result = []
         for input_tensor, jac_fn in zip(self._inputs, self._fns):
             jacobian = jac_fn(input_tensor)
@@ -83,6 +91,12 @@ class GradFn:
             )
         return result
 
+    def release(self):
+        """Free the inputs saved for the backward pass, which can't be run
+        through this function again."""
+        self._inputs = None
+        self._fns = None
+
     def __repr__(self):
         return self.__name__
 
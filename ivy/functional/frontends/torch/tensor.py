@@ -1931,18 +1931,43 @@ class Tensor:
     def backward(self, gradient=None, retain_graph=None, create_graph=False):
         if gradient is None and int(torch_frontend.numel(self)) > 1:
             raise RuntimeError("grad can be implicitly created only for scalar outputs")
-        if self.grad_fn is None and self._grads is None:
+        if gradient is None:
+            gradient = torch_frontend.tensor(1.0)
+        if self.grad_fn is None:
             assert self.shape == gradient.shape, "Mismatch in shape"
-            self._grads = gradient
+            self._grads = gradient if self._grads is None else self._grads + gradient
             return
-        _grad_list = self.grad_fn(
-            gradient if gradient is not None else torch_frontend.tensor(1.0)
-        )
-        for idx, next_function in enumerate(self.grad_fn.next_functions):
-            if next_function.__self__.grad_fn is not None:
-                next_function.__self__.backward(_grad_list[idx])
-            else:
-                next_function(_grad_list[idx])
+        if retain_graph is None:
+            retain_graph = create_graph
+        # order the functions of the graph so that each one runs once, after all
+        # the functions its output flows into, with the sum of their gradients,
+        # rather than once per path from this tensor
+        order, visited, stack = [], set(), [(self.grad_fn, False)]
+        while stack:
+            fn, expanded = stack.pop()
+            if expanded:
+                order.append(fn)
+            elif id(fn) not in visited:
+                visited.add(id(fn))
+                stack.append((fn, True))
+                stack.extend(
+                    (next_fn, False)
+                    for next_fn in fn.next_functions
+                    if id(next_fn) not in visited
+                )
+        grads = {id(self.grad_fn): gradient}
+        for fn in reversed(order):
+            grad = grads.pop(id(fn), None)
+            if grad is None:
+                continue
+            if not fn.next_functions:
+                fn(grad)
+                continue
+            for next_fn, next_grad in zip(fn.next_functions, fn(grad)):
+                key = id(next_fn)
+                grads[key] = next_grad if key not in grads else grads[key] + next_grad
+            if not retain_graph:
+                fn.release()
 
     @with_unsupported_dtypes({"2.2 and below": ("float16", "bfloat16")}, "torch")
     def logaddexp(self, other):
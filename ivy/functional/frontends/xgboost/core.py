@@ -1,6 +1,6 @@
 import ivy
 from ivy.func_wrapper import with_unsupported_dtypes
-from .gbm import GBLinear
+from .gbm import GBLinear, GBTree
 
 
 class DMatrix:
@@ -99,7 +99,7 @@ class Booster:
         # by default xgboost calculates the mean of a target if base_score is not
         # provided
         params["base_score"] = (
-            cache[1].mean() if not params["base_score"] else params["base_score"]
+            cache[1].mean() if not params.get("base_score") else params["base_score"]
         )
 
         # add num_feature, num_target and num_instances to params
@@ -111,8 +111,11 @@ class Booster:
             }
         )
 
-        # create gbm(as for now only gblinear booster is available)
-        self.gbm = GBLinear(params, compile=compile, cache=cache)
+        # create gbm, gblinear remains the default for backward compatibility
+        if params.get("booster") == "gbtree" or params.get("tree_method") == "hist":
+            self.gbm = GBTree(params, compile=compile, cache=cache)
+        else:
+            self.gbm = GBLinear(params, compile=compile, cache=cache)
         self.compile = compile
         if self.compile:
             self._comp_binary_prediction = ivy.trace_graph(
@@ -217,7 +220,10 @@ class Booster:
         """
         # currently supports prediction for binary task
         # get raw predictions
-        pred = self.gbm.pred(data)
+        if iteration_range in (None, (0, 0)):
+            pred = self.gbm.pred(data)
+        else:
+            pred = self.gbm.pred(data, iteration_range=iteration_range)
         args = (self.gbm.obj, pred)
 
         if self.compile:
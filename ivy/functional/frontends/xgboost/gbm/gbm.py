@@ -5,7 +5,13 @@ from ivy.functional.frontends.xgboost.objective.regression_loss import (
 from ivy.functional.frontends.xgboost.linear.updater_coordinate import (
     coordinate_updater,
 )
+from ivy.functional.frontends.xgboost.tree.updater_quantile_hist import (
+    quantile_cuts,
+    quantile_hist_updater,
+    quantise,
+)
 from copy import deepcopy
+import weakref
 
 
 class GBLinear:
@@ -149,10 +155,122 @@ class GBLinear:
                 self.weight = self.updater(*args)
 
 
+class GBTree:
+    def __init__(self, params=None, compile=False, cache=None):
+        # we start boosting from zero
+        self.num_boosted_rounds = 0
+
+        # hist is the only tree method available, trees are grown depth-wise
+        self.updater = quantile_hist_updater
+
+        # LogisticRegression corresponds to 'binary:logistic' objective in terms of
+        # calculations
+        self.obj = LogisticRegression()
+        self.base_score = self.obj.prob_to_margin(params["base_score"])
+        self.base_margin = (
+            params["base_margin"] if params.get("base_margin") else self.base_score
+        )
+        self.scale_pos_weight = _get_param(params, 1.0, "scale_pos_weight")
+
+        # defaults of xgboost
+        self.learning_rate = _get_param(params, 0.3, "learning_rate", "eta")
+        self.max_depth = _get_param(params, 6, "max_depth")
+        self.min_child_weight = _get_param(params, 1.0, "min_child_weight")
+        self.gamma = _get_param(params, 0.0, "gamma", "min_split_loss")
+        self.reg_alpha = _get_param(params, 0.0, "reg_alpha", "alpha")
+        self.reg_lambda = _get_param(params, 1.0, "reg_lambda", "lambda")
+        self.max_bin = _get_param(params, 256, "max_bin")
+
+        self.trees = []
+
+        # the training data is quantised once, all trees are grown from its bins
+        self.train_data = cache[0]
+        self.cuts = quantile_cuts(cache[0], self.max_bin)
+        self.bins = quantise(cache[0], self.cuts)
+
+        # raw predictions of the data sets seen by pred, keyed by id and holding
+        # the number of trees they include, so that later calls only evaluate the
+        # trees added since(like xgboost's prediction cache)
+        self._pred_cache = {}
+
+        # growing trees is data dependent control flow, so compile is ignored
+        self.compile = False
+
+    def boosted_rounds(self):
+        return self.num_boosted_rounds
+
+    def model_fitted(self):
+        return self.num_boosted_rounds != 0
+
+    # used to obtain raw predictions
+    def pred(self, data, iteration_range=(0, 0)):
+        if iteration_range not in (None, (0, 0)):
+            trees = self.trees[slice(*iteration_range)]
+            return _tree_pred(data, trees, self.base_margin)
+        entry = self._cached_pred(data)
+        if entry is None:
+            return _tree_pred(data, self.trees, self.base_margin)
+        if entry[1] < len(self.trees):
+            entry[2] = entry[2] + _tree_pred(data, self.trees[entry[1] :], 0.0)
+            entry[1] = len(self.trees)
+        return entry[2]
+
+    def _cached_pred(self, data):
+        entry = self._pred_cache.get(id(data))
+        if entry is not None and entry[0]() is data:
+            return entry
+        try:
+            ref = weakref.ref(data)
+        except TypeError:
+            return None
+        # drop the entries of data sets which were garbage collected
+        for key in [k for k, v in self._pred_cache.items() if v[0]() is None]:
+            del self._pred_cache[key]
+        entry = [ref, 0, _tree_pred(data, [], self.base_margin)]
+        self._pred_cache[id(data)] = entry
+        return entry
+
+    def get_gradient(self, pred, label):
+        label = ivy.reshape(label, pred.shape)
+        return _get_gradient(self.obj, pred, label, self.scale_pos_weight)
+
+    def do_boost(self, data, gpair, iter):
+        bins = self.bins if data is self.train_data else quantise(data, self.cuts)
+        tree, positions = self.updater(
+            gpair,
+            bins,
+            self.cuts,
+            self.learning_rate,
+            self.max_depth,
+            self.min_child_weight,
+            self.gamma,
+            self.reg_alpha,
+            self.reg_lambda,
+        )
+        # the leaves the training samples ended up in give their predictions for
+        # the new tree, so the cache doesn't need to evaluate it
+        entry = self._pred_cache.get(id(data))
+        if entry is not None and entry[0]() is data and entry[1] == len(self.trees):
+            leaf_value = ivy.array(tree.leaf_value, dtype=entry[2].dtype)
+            entry[2] = entry[2] + ivy.expand_dims(
+                ivy.gather(leaf_value, positions), axis=-1
+            )
+            entry[1] += 1
+        self.trees.append(tree)
+        self.num_boosted_rounds += 1
+
+
 # --- Helpers --- #
 # --------------- #
 
 
+def _get_param(params, default, *names):
+    for name in names:
+        if params.get(name) is not None:
+            return params[name]
+    return default
+
+
 def _get_gradient(obj, pred, label, scale_pos_weight):
     p = obj.pred_transform(pred)
 
@@ -173,3 +291,10 @@ def _get_gradient(obj, pred, label, scale_pos_weight):
 
 def _pred(dt, w, base):
     return ivy.matmul(dt, w[:-1]) + w[-1] + base
+
+
+def _tree_pred(data, trees, base):
+    pred = ivy.zeros((data.shape[0], 1), dtype=ivy.float32) + base
+    for tree in trees:
+        pred = pred + ivy.expand_dims(tree.predict(data), axis=-1)
+    return pred
@@ -235,7 +235,24 @@ class XGBModel(XGBModelBase):
                 self._Booster.update(X, y, i)
         else:
             params = self.get_xgb_params()
-            self._Booster = train(params, X, y, self.get_num_boosting_rounds())
+            evals = [
+                (X_eval, y_eval, f"validation_{i}")
+                for i, (X_eval, y_eval) in enumerate(eval_set or [])
+            ]
+            self.evals_result_ = {}
+            self._Booster = train(
+                params,
+                X,
+                y,
+                self.get_num_boosting_rounds(),
+                evals=evals,
+                early_stopping_rounds=(
+                    early_stopping_rounds or self.early_stopping_rounds
+                ),
+                evals_result=self.evals_result_,
+                verbose_eval=verbose,
+                callbacks=callbacks or self.callbacks,
+            )
 
         return self
 
@@ -1,3 +1,4 @@
+import ivy
 from .core import Booster
 
 
@@ -78,11 +79,100 @@ def train(
     """
     # this function creates an instance of Booster and calls its update method
     # to learn model parameters
-    # ToDo: add handling for callbacks and write training history
+    if feval is not None or custom_metric is not None:
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            "custom evaluation metrics are not supported"
+        )
+    evals = [_unpack_eval(e) for e in evals] if evals else []
+    if early_stopping_rounds and not evals:
+        raise ivy.utils.exceptions.IvyValueError(
+            "Must have at least 1 validation dataset for early stopping."
+        )
+    metrics = params.get("eval_metric") or "logloss"
+    metrics = [metrics] if isinstance(metrics, str) else list(metrics)
+    for metric in metrics:
+        if metric not in _METRICS:
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                f"eval_metric {metric} is not supported"
+            )
+    callbacks = callbacks or []
+    if evals_result is None:
+        evals_result = {}
+    evals_result.clear()
 
     bst = Booster(params, cache=[dtrain, dlabel], model_file=xgb_model)
+    for callback in callbacks:
+        if hasattr(callback, "before_training"):
+            bst = callback.before_training(bst)
 
+    best_score = None
     for i in range(num_boost_round):
         bst.update(dtrain, dlabel, iteration=i, fobj=obj)
 
+        scores = []
+        for data, label, name in evals:
+            pred = bst.gbm.obj.pred_transform(bst.gbm.pred(data))
+            for metric in metrics:
+                score = _METRICS[metric](pred, label)
+                evals_result.setdefault(name, {}).setdefault(metric, []).append(score)
+                scores.append(f"{name}-{metric}:{score:.5f}")
+        if scores and verbose_eval and (
+            verbose_eval is True or i % verbose_eval == 0 or i == num_boost_round - 1
+        ):
+            print(f"[{i}]\t" + "\t".join(scores))
+
+        stop = False
+        if early_stopping_rounds:
+            # the last metric of the last validation set decides
+            score = evals_result[evals[-1][2]][metrics[-1]][-1]
+            if best_score is None or (
+                score > best_score if maximize else score < best_score
+            ):
+                best_score = score
+                bst.best_score = score
+                bst.best_iteration = i
+            stop = i - bst.best_iteration >= early_stopping_rounds
+        for callback in callbacks:
+            if hasattr(callback, "after_iteration"):
+                stop = callback.after_iteration(bst, i, evals_result) or stop
+        if stop:
+            break
+
+    for callback in callbacks:
+        if hasattr(callback, "after_training"):
+            bst = callback.after_training(bst)
     return bst
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _error(pred, label):
+    return ivy.to_scalar(ivy.mean(ivy.astype((pred > 0.5) != (label > 0.5), "float64")))
+
+
+def _logloss(pred, label):
+    pred = ivy.clip(ivy.astype(pred, "float64"), 1e-16, 1.0 - 1e-16)
+    return ivy.to_scalar(
+        -ivy.mean(label * ivy.log(pred) + (1.0 - label) * ivy.log(1.0 - pred))
+    )
+
+
+def _rmse(pred, label):
+    return ivy.to_scalar(ivy.sqrt(ivy.mean(ivy.square(pred - label))))
+
+
+def _unpack_eval(item):
+    # evals hold (DMatrix, name) pairs as in xgboost, or (data, label, name)
+    # like train's dtrain and dlabel arguments
+    if len(item) == 2:
+        dmatrix, name = item
+        item = (dmatrix.data, dmatrix.label, name)
+    data, label, name = item
+    # labels are compared to raw predictions of shape (n_samples, 1)
+    return data, ivy.reshape(label, (-1, 1)), name
+
+
+# all of them are minimized
+_METRICS = {"error": _error, "logloss": _logloss, "rmse": _rmse}
@@ -0,0 +1,6 @@
+from . import param
+from .param import *
+from . import tree_model
+from .tree_model import *
+from . import updater_quantile_hist
+from .updater_quantile_hist import *
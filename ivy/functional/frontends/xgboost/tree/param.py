@@ -0,0 +1,21 @@
+import ivy
+
+
+def threshold_l1(w, alpha):
+    if alpha == 0.0:
+        return w
+    return ivy.sign(w) * ivy.maximum(ivy.abs(w) - alpha, 0.0)
+
+
+def calc_gain(sum_grad, sum_hess, reg_alpha, reg_lambda):
+    # xgboost doesn't halve the gain, the loss change of a split is compared to
+    # gamma(min_split_loss) as is
+    grad = threshold_l1(sum_grad, reg_alpha)
+    return grad * grad / (sum_hess + reg_lambda)
+
+
+def calc_weight(sum_grad, sum_hess, reg_alpha, reg_lambda, min_child_weight):
+    weight = -threshold_l1(sum_grad, reg_alpha) / (sum_hess + reg_lambda)
+    return ivy.where(
+        (sum_hess < min_child_weight) | (sum_hess <= 0.0), 0.0, weight
+    )
@@ -0,0 +1,86 @@
+import ivy
+
+
+class RegTree:
+    """Regression tree grown by the hist updater.
+
+    Nodes are stored in flat lists indexed by node id, the root having id 0.
+    A sample goes to the left child of a node if its value of the node's
+    feature is smaller than the node's split value, as in xgboost. Leaves have
+    a left child of -1 and hold the (learning rate scaled) leaf value.
+    """
+
+    def __init__(self):
+        self.left_child = []
+        self.right_child = []
+        self.feature = []
+        self.split_bin = []
+        self.split_value = []
+        self.loss_chg = []
+        self.leaf_value = []
+        self.depth = []
+        self.max_depth = 0
+        self._arrays = None
+
+    @property
+    def num_nodes(self):
+        return len(self.left_child)
+
+    def add_node(self, leaf_value, depth=0):
+        self.left_child.append(-1)
+        self.right_child.append(-1)
+        self.feature.append(0)
+        self.split_bin.append(0)
+        self.split_value.append(ivy.inf)
+        self.loss_chg.append(0.0)
+        self.leaf_value.append(leaf_value)
+        self.depth.append(depth)
+        self.max_depth = max(self.max_depth, depth)
+        self._arrays = None
+        return self.num_nodes - 1
+
+    def expand_node(
+        self, nid, feature, split_bin, split_value, loss_chg, left_value, right_value
+    ):
+        depth = self.depth[nid] + 1
+        left = self.add_node(left_value, depth)
+        right = self.add_node(right_value, depth)
+        self.left_child[nid] = left
+        self.right_child[nid] = right
+        self.feature[nid] = feature
+        self.split_bin[nid] = split_bin
+        self.split_value[nid] = split_value
+        self.loss_chg[nid] = loss_chg
+        return left, right
+
+    def is_leaf(self, nid):
+        return self.left_child[nid] == -1
+
+    def predict(self, data):
+        """Leaf values of the samples of ``data``, of shape (n_samples,).
+
+        All samples descend the tree together, one level per iteration.
+        """
+        if self._arrays is None:
+            self._arrays = (
+                ivy.array(self.left_child, dtype=ivy.int64),
+                ivy.array(self.right_child, dtype=ivy.int64),
+                ivy.array(self.feature, dtype=ivy.int64),
+                ivy.array(self.split_value, dtype=data.dtype),
+                ivy.array(self.leaf_value, dtype=ivy.float32),
+            )
+        left_child, right_child, feature, split_value, leaf_value = self._arrays
+        n_samples, n_features = data.shape
+        flat_data = ivy.reshape(data, (-1,))
+        offsets = ivy.arange(n_samples, dtype=ivy.int64) * n_features
+        node = ivy.zeros(n_samples, dtype=ivy.int64)
+        for _ in range(self.max_depth):
+            value = ivy.gather(flat_data, offsets + ivy.gather(feature, node))
+            left = ivy.gather(left_child, node)
+            child = ivy.where(
+                value < ivy.gather(split_value, node),
+                left,
+                ivy.gather(right_child, node),
+            )
+            node = ivy.where(left == -1, node, child)
+        return ivy.gather(leaf_value, node)
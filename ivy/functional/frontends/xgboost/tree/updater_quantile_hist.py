@@ -0,0 +1,233 @@
+import ivy
+from ivy.functional.frontends.xgboost.tree.param import calc_gain, calc_weight
+from ivy.functional.frontends.xgboost.tree.tree_model import RegTree
+
+# splits whose loss change doesn't exceed this are never made(kRtEps in xgboost)
+RT_EPS = 1e-6
+
+
+def quantile_cuts(data, max_bin):
+    """Compute the cut points quantising each feature of ``data`` into at most
+    ``max_bin`` bins. A feature value ``x`` falls into bin ``b`` if ``cuts[f,
+    b - 1] <= x < cuts[f, b]``.
+
+    Features with no more than ``max_bin`` distinct values get a bin per value,
+    the cut points of the others are their quantiles. Features with fewer cut
+    points than others are padded with inf.
+
+    Parameters
+    ----------
+    data
+        Training data of shape (n_samples, n_features).
+    max_bin
+        Maximum number of bins per feature.
+
+    Returns
+    -------
+        Cut points of shape (n_features, n_cuts), sorted along the last axis.
+    """
+    quantiles = ivy.linspace(0.0, 1.0, max_bin + 1)[1:-1]
+    cuts = []
+    for f in range(data.shape[1]):
+        values = ivy.unique_values(data[:, f])
+        if values.shape[0] > max_bin:
+            values = ivy.unique_values(
+                ivy.quantile(data[:, f], ivy.astype(quantiles, data.dtype))
+            )
+        # values below the first cut point fall into bin 0
+        cuts.append(values[1:])
+    n_cuts = max(c.shape[0] for c in cuts)
+    return ivy.stack(
+        [
+            ivy.concat([c, ivy.full((n_cuts - c.shape[0],), ivy.inf, dtype=c.dtype)])
+            for c in cuts
+        ]
+    )
+
+
+def quantise(data, cuts):
+    """Bin index of each element of ``data``, of shape (n_samples,
+    n_features)."""
+    return ivy.stack(
+        [
+            ivy.searchsorted(cuts[f], data[:, f], side="right", ret_dtype=ivy.int64)
+            for f in range(data.shape[1])
+        ],
+        axis=1,
+    )
+
+
+def quantile_hist_updater(
+    gpair,
+    bins,
+    cuts,
+    lr,
+    max_depth,
+    min_child_weight,
+    gamma,
+    reg_alpha,
+    reg_lambda,
+):
+    """Grow one regression tree depth-wise from gradient histograms, as the
+    ``hist`` tree method does.
+
+    At each depth the gradients and hessians of the samples are summed per
+    (node, feature, bin) with a single bincount, and the cumulative sums over
+    the bins give the statistics of the left child of every candidate split of
+    every node at once, so the best split of all nodes of a level is found with
+    array ops only.
+
+    Parameters
+    ----------
+    gpair
+        Array of shape (n_samples, 2) holding gradient-hessian pairs.
+    bins
+        Quantised training data of shape (n_samples, n_features), see `quantise`.
+    cuts
+        Cut points of shape (n_features, n_cuts) used to quantise the data.
+    lr
+        Learning rate, applied to the leaf values.
+    max_depth
+        Maximum depth of the tree.
+    min_child_weight
+        Minimum sum of hessians of a child.
+    gamma
+        Minimum loss reduction of a split.
+    reg_alpha
+        L1 regularization on the leaf values.
+    reg_lambda
+        L2 regularization on the leaf values.
+
+    Returns
+    -------
+    ret
+        The grown tree and the id of the leaf each sample ended up in.
+    """
+    n_samples, n_features = bins.shape
+    n_cuts = cuts.shape[1]
+    n_bins = n_cuts + 1
+    grad = ivy.astype(gpair[:, 0], ivy.float64)
+    hess = ivy.astype(gpair[:, 1], ivy.float64)
+    split_valid = ivy.isfinite(cuts)
+    split_values = ivy.to_list(cuts)
+
+    def leaf_value(sum_grad, sum_hess):
+        weight = calc_weight(
+            sum_grad, sum_hess, reg_alpha, reg_lambda, min_child_weight
+        )
+        return ivy.to_list(lr * weight)
+
+    tree = RegTree()
+    tree.add_node(leaf_value(ivy.sum(grad), ivy.sum(hess)))
+    positions = ivy.zeros(n_samples, dtype=ivy.int64)
+
+    # nodes to expand at the current depth, and for each sample the index of its
+    # node among them(-1 once the sample reached a leaf)
+    level = [0]
+    level_idx = ivy.zeros(n_samples, dtype=ivy.int64)
+    sample_offsets = ivy.arange(n_samples, dtype=ivy.int64) * n_features
+    feature_offsets = ivy.arange(n_features, dtype=ivy.int64) * n_bins
+    for _ in range(max_depth):
+        if not level or n_cuts == 0:
+            break
+        n_nodes = len(level)
+        active = level_idx >= 0
+        idx = ivy.reshape(
+            ivy.expand_dims(level_idx[active] * n_features * n_bins, axis=-1)
+            + feature_offsets
+            + bins[active],
+            (-1,),
+        )
+        hists = [
+            ivy.reshape(
+                ivy.bincount(
+                    idx,
+                    weights=ivy.repeat(x[active], n_features),
+                    minlength=n_nodes * n_features * n_bins,
+                ),
+                (n_nodes, n_features, n_bins),
+            )
+            for x in (grad, hess)
+        ]
+        sum_grad, sum_hess = (ivy.sum(h[:, 0], axis=-1) for h in hists)
+        # statistics of the left child of splitting after each bin but the last
+        left_grad, left_hess = (ivy.cumsum(h, axis=-1)[..., :-1] for h in hists)
+        right_grad = ivy.reshape(sum_grad, (-1, 1, 1)) - left_grad
+        right_hess = ivy.reshape(sum_hess, (-1, 1, 1)) - left_hess
+        loss_chg = (
+            calc_gain(left_grad, left_hess, reg_alpha, reg_lambda)
+            + calc_gain(right_grad, right_hess, reg_alpha, reg_lambda)
+            - ivy.reshape(
+                calc_gain(sum_grad, sum_hess, reg_alpha, reg_lambda), (-1, 1, 1)
+            )
+        )
+        valid = (
+            split_valid
+            & (left_hess >= min_child_weight)
+            & (right_hess >= min_child_weight)
+        )
+        loss_chg = ivy.reshape(ivy.where(valid, loss_chg, -ivy.inf), (n_nodes, -1))
+        best = ivy.argmax(loss_chg, axis=-1)
+        best_loss_chg = ivy.to_list(ivy.max(loss_chg, axis=-1))
+        best_flat = best + ivy.arange(n_nodes, dtype=best.dtype) * loss_chg.shape[1]
+        best_left_grad, best_left_hess, best_right_grad, best_right_hess = (
+            ivy.gather(ivy.reshape(x, (-1,)), best_flat)
+            for x in (left_grad, left_hess, right_grad, right_hess)
+        )
+        left_value = leaf_value(best_left_grad, best_left_hess)
+        right_value = leaf_value(best_right_grad, best_right_hess)
+        best = ivy.to_list(best)
+
+        next_level = []
+        # per node of the level, -1 if it stays a leaf
+        split_feature = [-1] * n_nodes
+        split_bins = [0] * n_nodes
+        left_id = [0] * n_nodes
+        right_id = [0] * n_nodes
+        for i, nid in enumerate(level):
+            if best_loss_chg[i] <= RT_EPS or best_loss_chg[i] < gamma:
+                continue
+            feature, split_bin = divmod(best[i], n_cuts)
+            left_id[i], right_id[i] = tree.expand_node(
+                nid,
+                feature,
+                split_bin,
+                split_values[feature][split_bin],
+                best_loss_chg[i],
+                left_value[i],
+                right_value[i],
+            )
+            split_feature[i] = feature
+            split_bins[i] = split_bin
+            next_level += [left_id[i], right_id[i]]
+        if not next_level:
+            break
+
+        # move the samples of the split nodes to their children
+        node_idx = ivy.where(active, level_idx, 0)
+        feature = ivy.gather(ivy.array(split_feature, dtype=ivy.int64), node_idx)
+        is_split = active & (feature >= 0)
+        goes_left = ivy.gather(
+            ivy.reshape(bins, (-1,)), sample_offsets + ivy.maximum(feature, 0)
+        ) <= ivy.gather(ivy.array(split_bins, dtype=ivy.int64), node_idx)
+        child = ivy.where(
+            goes_left,
+            ivy.gather(ivy.array(left_id, dtype=ivy.int64), node_idx),
+            ivy.gather(ivy.array(right_id, dtype=ivy.int64), node_idx),
+        )
+        positions = ivy.where(is_split, child, positions)
+        child_idx = {nid: i for i, nid in enumerate(next_level)}
+        level_idx = ivy.where(
+            is_split,
+            ivy.gather(
+                ivy.array(
+                    [child_idx.get(nid, -1) for nid in range(tree.num_nodes)],
+                    dtype=ivy.int64,
+                ),
+                child,
+            ),
+            -1,
+        )
+        level = next_level
+
+    return tree, positions
@@ -3,12 +3,14 @@
 # global
 import os
 import gc
+import sys
 import abc
 import math
 import psutil
 import warnings
 import types
-from typing import Type, Optional, Tuple
+import concurrent.futures
+from typing import Type, Optional, Tuple, Sequence
 
 # noinspection PyUnresolvedReferences
 try:
@@ -152,16 +154,19 @@ def _get_nvml_gpu_handle(device: Union[ivy.Device, ivy.NativeDevice], /) -> int:
 
 
 def _shift_native_arrays_on_default_device(*args, **kwargs):
-    with ivy.ArrayMode(False):
-        default_device = ivy.default_device(as_native=True)
-        args, kwargs = ivy.nested_map(
-            lambda x: (
-                ivy.to_device(x, default_device)
-                if (ivy.is_native_array(x) and ivy.dev(x) != default_device)
-                else x
-            ),
-            [args, kwargs],
-        )
+    # the backend functions are called directly, rather than the ivy functions
+    # within ivy.ArrayMode(False), as setting the global array mode on each call
+    # would race with the ivy calls made in other threads
+    backend = ivy.current_backend()
+    default_device = ivy.default_device(as_native=True)
+    args, kwargs = ivy.nested_map(
+        lambda x: (
+            backend.to_device(x, default_device)
+            if (backend.is_native_array(x) and backend.dev(x) != default_device)
+            else x
+        ),
+        [args, kwargs],
+    )
     return args, kwargs, ivy.as_native_dev(default_device)
 
 
@@ -1029,6 +1034,77 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _call_on_device(func, inputs, device, dst_device):
+    inputs = [ivy.to_device(inp, device) for inp in inputs]
+    ret = func(*inputs)
+    return ivy.nested_map(
+        lambda x: ivy.to_device(x, dst_device) if ivy.is_array(x) else x,
+        ret,
+        include_derived={"tuple": True},
+    )
+
+
+def _call_with_native_arrays(func, backend, inputs):
+    # ivy arrays re-set the backend when unpickled, so only native arrays are
+    # exchanged with worker processes
+    if ivy.current_backend_str() != backend:
+        ivy.set_backend(backend)
+    ret = func(*ivy.to_ivy(list(inputs), nested=True))
+    return ivy.to_native(ret, nested=True, include_derived={"tuple": True})
+
+
+def _split_func_call_returns(func, chunks, executor, device, ordered):
+    """Yield the returns of func for each chunk of inputs, dispatching the
+    chunks with the given executor.
+
+    If not ordered, the returns are yielded as the chunks complete.
+    """
+    if executor is None:
+        for inps in chunks:
+            yield func(*inps)
+        return
+    if not isinstance(executor, (str, concurrent.futures.Executor)):
+        devices = list(executor)
+        dst_device = ivy.default_device(device)
+        for i, inps in enumerate(chunks):
+            yield _call_on_device(func, inps, devices[i % len(devices)], dst_device)
+        return
+    own_executor = isinstance(executor, str)
+    if own_executor:
+        ivy.utils.assertions.check_equal(executor, "process", as_array=False)
+        executor = concurrent.futures.ProcessPoolExecutor(
+            min(len(chunks), os.cpu_count() or 1)
+        )
+    in_processes = isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+    if in_processes:
+        backend = ivy.current_backend_str()
+        # look the worker up through sys.modules, as the copy of this function
+        # in a local ivy from ivy.with_backend cannot be pickled
+        worker = sys.modules[__name__]._call_with_native_arrays
+        futures = [
+            executor.submit(
+                worker,
+                func,
+                backend,
+                ivy.to_native(list(inps), nested=True),
+            )
+            for inps in chunks
+        ]
+    else:
+        futures = [executor.submit(func, *inps) for inps in chunks]
+    try:
+        for future in futures if ordered else concurrent.futures.as_completed(futures):
+            ret = future.result()
+            if in_processes:
+                ret = ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
+            yield ret
+    finally:
+        for future in futures:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -1042,10 +1118,18 @@ def split_func_call(
     output_axes: Optional[Union[int, Iterable[int]]] = None,
     stop_gradients: bool = False,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    executor: Optional[
+        Union[
+            str,
+            concurrent.futures.Executor,
+            Sequence[Union[ivy.Device, ivy.NativeDevice]],
+        ]
+    ] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """Call a function by splitting its inputs along a given axis, and calling
     the function in chunks, rather than feeding the entire input array at once.
     This can be useful to reduce memory usage of the device the arrays are on.
+    The chunks can also be dispatched concurrently, by specifying an executor.
 
     Parameters
     ----------
@@ -1071,6 +1155,20 @@ def split_func_call(
         Whether to stop the gradients for each computed return. Default is ``False``.
     device
         The device to set the split factor for. Sets the default device by default.
+    executor
+        How to dispatch the chunks. Either an instance of
+        ``concurrent.futures.Executor``, ``"process"`` for a temporary process pool
+        with one worker per CPU, or a sequence of devices, in which case the chunks
+        are distributed round-robin over these devices and the results are moved
+        back to ``device``. Chunks are exchanged with worker processes as native
+        arrays, and ``func`` must be picklable. Ivy's global modes are shared by all
+        threads, so a thread pool should only be used with functions which are safe
+        to call concurrently. The shifting of native arrays to the default device
+        by ``handle_soft_device_variable`` no longer sets the array mode on each
+        call, which let the ivy calls of the other threads pass ivy arrays to the
+        backend. For ``sum`` and ``mean`` modes, the returns are reduced as the
+        chunks complete. Default is ``None``, which calls the function on each chunk
+        serially.
 
     Returns
     -------
@@ -1124,26 +1222,29 @@ def split_func_call(
     is_mean = mode == "mean"
     is_sum = mode == "sum"
     post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
+    rets = _split_func_call_returns(
+        func,
+        list(zip(*inputs_split)),
+        executor,
+        device,
+        ordered=not (is_mean or is_sum),
+    )
     if is_mean or is_sum:
         sums = None
-        for inps in zip(*inputs_split):
+        for ret in rets:
             if not sums:
-                sums = func(*inps)
                 sums = (
-                    [post_fn(s) for s in sums]
-                    if isinstance(sums, tuple)
-                    else [post_fn(sums)]
+                    [post_fn(s) for s in ret]
+                    if isinstance(ret, tuple)
+                    else [post_fn(ret)]
                 )
+            elif isinstance(ret, tuple):
+                for i, r in enumerate(ret):
+                    sums[i] = sums[i] + post_fn(r)
             else:
-                ret = func(*inps)
-                if isinstance(ret, tuple):
-                    for i, r in enumerate(ret):
-                        sums[i] = sums[i] + post_fn(r)
-                else:
-                    sums[0] = sums[0] + post_fn(ret)
+                sums[0] = sums[0] + post_fn(ret)
         sums_or_means = [s / num_chunks_ceiled for s in sums] if is_mean else sums
         return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
-    rets = [func(*i) for i in zip(*inputs_split)]
     rets = [
         tuple(post_fn(r) for r in ret) if isinstance(ret, tuple) else (post_fn(ret),)
         for ret in rets
@@ -354,6 +354,37 @@ def _is_valid_format(
     )
 
 
+# maximum size in bytes of the products of the values with the rows of a dense
+# matrix held at once by `SparseArray.matmul`, which multiplies the rows of the
+# sparse array one block after the other
+_MAX_BLOCK_BYTES = 2**26
+
+
+def _expand_compressed_indices(compressed_indices):
+    """Return the uncompressed row (column) index of each entry of a CSR
+    (CSC) array from its `crow_indices` (`ccol_indices`)."""
+    num_rows = compressed_indices.shape[0] - 1
+    return ivy.repeat(ivy.arange(num_rows, dtype="int64"), ivy.diff(compressed_indices))
+
+
+def _compress_indices(indices, size):
+    """Return the `crow_indices` (`ccol_indices`) of a CSR (CSC) array from
+    the sorted row (column) index of each entry."""
+    counts = ivy.bincount(indices, minlength=size)
+    return ivy.concat(
+        (
+            ivy.zeros((1,), dtype="int64"),
+            ivy.cumsum(counts, dtype="int64"),
+        )
+    )
+
+
+def _segment_sum(data, segment_ids, num_segments):
+    if data.shape[0] == 0:
+        return ivy.zeros((num_segments, *data.shape[1:]), dtype=data.dtype)
+    return ivy.unsorted_segment_sum(data, segment_ids, num_segments)
+
+
 class SparseArray(ivy.Array):
     def __init__(
         self,
@@ -398,7 +429,6 @@ class SparseArray(ivy.Array):
                     crow_indices, col_indices, values, dense_shape, format
                 )
             else:
-                print(format)
                 self._init_compressed_column_components(
                     ccol_indices, row_indices, values, dense_shape, format
                 )
@@ -730,29 +760,6 @@ class SparseArray(ivy.Array):
             all_coordinates.append(coordinate.to_list())
         return all_coordinates
 
-    def _csr_to_dense_coordinates(self):
-        all_coordinates = []
-        total_rows = self._dense_shape[0]
-        all_rows = self._col_indices.to_list()
-        all_cols = self._crow_indices.to_list()
-        for row in range(total_rows):
-            cols = all_rows[all_cols[row] : all_cols[row + 1]]
-            for col in cols:
-                all_coordinates.append([row, col])
-        return all_coordinates
-
-    def _csc_to_dense_coordinates(self):
-        # CSC sparse array
-        all_coordinates = []
-        total_rows = self._dense_shape[1]
-        all_cols = self._row_indices.to_list()
-        all_rows = self._ccol_indices.to_list()
-        for col in range(total_rows):
-            rows = all_cols[all_rows[col] : all_rows[col + 1]]
-            for row in rows:
-                all_coordinates.append([row, col])
-        return all_coordinates
-
     def _bsr_to_dense_coordinates(self):
         all_coordinates = []
         total_rows = self._dense_shape[0]
@@ -795,13 +802,230 @@ class SparseArray(ivy.Array):
                         )
         return all_coordinates
 
+    def _coordinates(self):
+        """Return the row and column indices and the values of the entries of
+        a 2D COO, CSR or CSC array, without densifying it."""
+        if self._format == "coo" and len(self._dense_shape) == 2:
+            return self._coo_indices[0], self._coo_indices[1], self._values
+        if self._format == "csr":
+            rows = _expand_compressed_indices(self._crow_indices)
+            return rows, self._col_indices, self._values
+        if self._format == "csc":
+            cols = _expand_compressed_indices(self._ccol_indices)
+            return self._row_indices, cols, self._values
+        raise ivy.utils.exceptions.IvyException(
+            "only 2D sparse arrays in the COO, CSR or CSC format are supported, got"
+            f" a {len(self._dense_shape)}D {self._format.upper()} sparse array"
+        )
+
+    def _with_values(self, values):
+        """Return a sparse array with the indices of this one and
+        `values`."""
+        if self._format == "coo":
+            return SparseArray(
+                coo_indices=self._coo_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+                format="coo",
+            )
+        if self._format in ["csr", "bsr"]:
+            return SparseArray(
+                crow_indices=self._crow_indices,
+                col_indices=self._col_indices,
+                values=values,
+                dense_shape=self._dense_shape,
+                format=self._format,
+            )
+        return SparseArray(
+            ccol_indices=self._ccol_indices,
+            row_indices=self._row_indices,
+            values=values,
+            dense_shape=self._dense_shape,
+            format=self._format,
+        )
+
+    def to_coo(self):
+        """Return the array in the COO format, with its entries in the order
+        of its current format."""
+        if self._format == "coo":
+            return self
+        rows, cols, values = self._coordinates()
+        return SparseArray(
+            coo_indices=ivy.stack((rows, cols)),
+            values=values,
+            dense_shape=self._dense_shape,
+            format="coo",
+        )
+
+    def to_csr(self):
+        """Return the array in the CSR format, with its entries sorted by row
+        and column rather than densified."""
+        if self._format == "csr":
+            return self
+        rows, cols, values = self._coordinates()
+        num_rows, num_cols = self._dense_shape
+        order = ivy.argsort(rows * num_cols + cols, stable=True)
+        return SparseArray(
+            crow_indices=_compress_indices(ivy.gather(rows, order), num_rows),
+            col_indices=ivy.gather(cols, order),
+            values=ivy.gather(values, order),
+            dense_shape=self._dense_shape,
+            format="csr",
+        )
+
+    def to_csc(self):
+        """Return the array in the CSC format, with its entries sorted by
+        column and row rather than densified."""
+        if self._format == "csc":
+            return self
+        rows, cols, values = self._coordinates()
+        num_rows, num_cols = self._dense_shape
+        order = ivy.argsort(cols * num_rows + rows, stable=True)
+        return SparseArray(
+            ccol_indices=_compress_indices(ivy.gather(cols, order), num_cols),
+            row_indices=ivy.gather(rows, order),
+            values=ivy.gather(values, order),
+            dense_shape=self._dense_shape,
+            format="csc",
+        )
+
+    @property
+    def T(self):
+        """The transpose of a 2D COO, CSR or CSC array, the CSR (CSC)
+        transpose of which is the CSC (CSR) array with the same indices."""
+        num_rows, num_cols = self._dense_shape
+        if self._format == "csr":
+            return SparseArray(
+                ccol_indices=self._crow_indices,
+                row_indices=self._col_indices,
+                values=self._values,
+                dense_shape=(num_cols, num_rows),
+                format="csc",
+            )
+        if self._format == "csc":
+            return SparseArray(
+                crow_indices=self._ccol_indices,
+                col_indices=self._row_indices,
+                values=self._values,
+                dense_shape=(num_cols, num_rows),
+                format="csr",
+            )
+        rows, cols, values = self._coordinates()
+        return SparseArray(
+            coo_indices=ivy.stack((cols, rows)),
+            values=values,
+            dense_shape=(num_cols, num_rows),
+            format="coo",
+        )
+
+    def matmul(self, x):
+        """Multiply the 2D sparse array by the dense vector or matrix `x`.
+
+        The products of the values with the matching elements (rows) of
+        `x` are summed over the rows of the sparse array as segments,
+        so the memory used is proportional to the number of entries
+        rather than to the dense shape.
+        """
+        x = ivy.asarray(x)
+        if x.ndim not in (1, 2) or x.shape[0] != self._dense_shape[1]:
+            raise ivy.utils.exceptions.IvyException(
+                f"cannot multiply a sparse array of shape {self._dense_shape} by an"
+                f" array of shape {x.shape}"
+            )
+        num_rows = self._dense_shape[0]
+        if x.ndim == 1:
+            rows, cols, values = self._coordinates()
+            return _segment_sum(values * ivy.gather(x, cols), rows, num_rows)
+
+        # the rows are multiplied one block after the other, the products of which
+        # take at most _MAX_BLOCK_BYTES, each block being a range of rows
+        csr = self.to_csr()
+        crow_indices = csr.crow_indices
+        nnz = csr.values.shape[0]
+        dtype = ivy.promote_types(csr.values.dtype, x.dtype)
+        if x.shape[1] == 0:
+            return ivy.zeros((num_rows, 0), dtype=dtype)
+        block = max(1, _MAX_BLOCK_BYTES // (x.shape[1] * ivy.dtype_bits(dtype) // 8))
+        bounds = [0]
+        if nnz > block:
+            targets = ivy.arange(block, nnz, block, dtype="int64")
+            bounds += ivy.searchsorted(crow_indices, targets).to_list()
+        bounds = sorted(set(bounds) - {num_rows}) + [num_rows]
+        rows = _expand_compressed_indices(crow_indices)
+        ret = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            begin, end = int(crow_indices[start]), int(crow_indices[stop])
+            products = ivy.expand_dims(csr.values[begin:end], axis=1) * ivy.gather(
+                x, csr.col_indices[begin:end], axis=0
+            )
+            ret.append(_segment_sum(products, rows[begin:end] - start, stop - start))
+        return ret[0] if len(ret) == 1 else ivy.concat(ret)
+
+    def __matmul__(self, other):
+        return self.matmul(other)
+
+    def sum(self, axis=None):
+        """Sum the entries of the 2D array over `axis`, as segment sums of
+        the values by row (column) for `axis` 1 (0)."""
+        if axis is None:
+            return ivy.sum(self._values)
+        rows, cols, values = self._coordinates()
+        if axis in (1, -1):
+            return _segment_sum(values, rows, self._dense_shape[0])
+        if axis in (0, -2):
+            return _segment_sum(values, cols, self._dense_shape[1])
+        raise ivy.utils.exceptions.IvyException(
+            f"axis {axis} is out of bounds for a 2D sparse array"
+        )
+
+    def mean(self, axis=None):
+        """Mean of the elements of the 2D array over `axis`, the elements
+        without an entry counting as zeros."""
+        size = (
+            self._dense_shape[0] * self._dense_shape[1]
+            if axis is None
+            else self._dense_shape[1 if axis in (1, -1) else 0]
+        )
+        return self.sum(axis) / size
+
+    # the elementwise operations which map zeros to zeros only apply to the
+    # values of the entries, and return sparse arrays with the same indices
+
+    def __neg__(self):
+        return self._with_values(-self._values)
+
+    def __abs__(self):
+        return self._with_values(ivy.abs(self._values))
+
+    def __mul__(self, other):
+        if ivy.isscalar(other):
+            return self._with_values(self._values * other)
+        return super().__mul__(other)
+
+    def __rmul__(self, other):
+        if ivy.isscalar(other):
+            return self._with_values(other * self._values)
+        return super().__rmul__(other)
+
+    def __truediv__(self, other):
+        if ivy.isscalar(other):
+            return self._with_values(self._values / other)
+        return super().__truediv__(other)
+
     def to_dense_array(self, *, native=False):
+        if self._format in ["csr", "csc"] or (
+            self._format == "coo" and len(self._dense_shape) == 2
+        ):
+            # the entries are summed into the flattened dense array as segments
+            rows, cols, values = self._coordinates()
+            num_rows, num_cols = self._dense_shape
+            ret = ivy.reshape(
+                _segment_sum(values, rows * num_cols + cols, num_rows * num_cols),
+                (num_rows, num_cols),
+            )
+            return ret.to_native() if native else ret
         if self._format == "coo":
             all_coordinates = self._coo_to_dense_coordinates()
-        elif self._format == "csr":
-            all_coordinates = self._csr_to_dense_coordinates()
-        elif self._format == "csc":
-            all_coordinates = self._csc_to_dense_coordinates()
         elif self._format == "bsc":
             all_coordinates = self._bsc_to_dense_coordinates()
         else:
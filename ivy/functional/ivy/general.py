@@ -2,9 +2,11 @@
 
 # global
 import gc
+import hashlib
 import inspect
 import itertools
 import math
+from collections import OrderedDict
 from functools import wraps
 from numbers import Number
 from typing import (
@@ -47,6 +49,7 @@ from ivy.func_wrapper import (
 from ivy.functional.ivy.device import dev
 
 FN_CACHE = {}
+FN_CACHE_MAX_ENTRIES = 1024
 INF = float("inf")
 
 precise_mode_stack = []
@@ -1731,22 +1734,141 @@ def match_kwargs(
     return split_kwargs
 
 
+class _FnCache:
+    """LRU cache of the outputs of a single function, with hit/miss
+    statistics."""
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, args, ret):
+        # the args are kept alive with the entry, so that the ids used in the
+        # keys of array arguments cannot be reused by new arrays, and so they count
+        # towards the size of the entry
+        nbytes = _cache_nbytes(ret) + _cache_nbytes(args)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        if key in self.entries:
+            self.nbytes -= self.entries.pop(key)[2]
+        self.entries[key] = (ret, args, nbytes)
+        self.nbytes += nbytes
+        while (
+            self.max_entries is not None and len(self.entries) > self.max_entries
+        ) or (self.max_bytes is not None and self.nbytes > self.max_bytes):
+            self.nbytes -= self.entries.popitem(last=False)[1][2]
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.entries),
+            "nbytes": self.nbytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+
+def _cache_key(x, content_hash):
+    if isinstance(x, (ivy.Array, ivy.NativeArray)):
+        if content_hash:
+            x_np = ivy.to_numpy(x)
+            return (
+                "array",
+                x_np.shape,
+                str(x_np.dtype),
+                hashlib.blake2b(np.ascontiguousarray(x_np).tobytes()).hexdigest(),
+            )
+        device = x.device if isinstance(x, ivy.Array) else ivy.dev(x)
+        return ("array", id(x), tuple(x.shape), str(x.dtype), str(device))
+    if isinstance(x, (list, tuple)):
+        return (type(x).__name__,) + tuple(_cache_key(v, content_hash) for v in x)
+    if isinstance(x, dict):
+        return (type(x).__name__,) + tuple(
+            (k, _cache_key(v, content_hash)) for k, v in sorted(x.items())
+        )
+    try:
+        hash(x)
+        # keep the type, so that e.g. 1, 1.0 and True are cached separately
+        return (type(x), x)
+    except TypeError:
+        return ("str", str(x))
+
+
+def _cache_nbytes(x):
+    if isinstance(x, (ivy.Array, ivy.NativeArray)):
+        return math.prod(x.shape) * ivy.dtype_bits(x.dtype) // 8
+    if isinstance(x, (list, tuple)):
+        return sum(_cache_nbytes(v) for v in x)
+    if isinstance(x, dict):
+        return sum(_cache_nbytes(v) for v in x.values())
+    return 0
+
+
 @handle_exceptions
-def cache_fn(func: Callable) -> Callable:
+def cache_fn(
+    func: Optional[Callable] = None,
+    /,
+    *,
+    max_entries: Optional[int] = FN_CACHE_MAX_ENTRIES,
+    max_bytes: Optional[int] = None,
+    content_hash: bool = False,
+) -> Callable:
     """Cache function outputs.
 
     A decorator to wrap a function, such that computed outputs are cached to avoid
-    recalculating them later.
+    recalculating them later. The cache of each function is shared by all of its
+    cache wrapped versions, and the least recently used outputs are evicted when it
+    is full.
+
+    Array arguments are keyed by their identity, shape, dtype and device, and the
+    arrays are kept alive for as long as the output is cached, counting towards
+    ``max_bytes``. Other hashable
+    arguments are keyed by value, and unhashable ones by their string
+    representation.
 
     Parameters
     ----------
     func
-        The function to wrap, whose output should be cached for later.
+        The function to wrap, whose output should be cached for later. If ``None``, a
+        decorator with the given cache settings is returned.
+    max_entries
+        The maximum number of outputs to cache for the function. ``None`` for no
+        limit. Default is ``1024``.
+    max_bytes
+        The maximum total number of bytes of the cached array outputs of the
+        function, and of the array arguments kept alive with them. ``None`` for no
+        limit. Default is ``None``.
+    content_hash
+        Whether to key array arguments on a hash of their contents instead of their
+        identity, so that equal arrays share cached outputs, and the arrays are not
+        kept alive. This requires copying the arrays to host memory on each call.
+        Default is ``False``.
 
     Returns
     -------
     ret
-        The newly cache wrapped function.
+        The newly cache wrapped function, with ``cache_info`` and ``cache_clear``
+        methods to query the hit/miss statistics of the cache and to clear it.
 
     Examples
     --------
@@ -1763,24 +1885,45 @@ def cache_fn(func: Callable) -> Callable:
     >>> cached_line_eq = ivy.cache_fn(line_eq)
     >>> print(cached_line_eq(3, itc=5, slp=2))
     11
+
+    As a decorator, with a bounded cache:
+
+    >>> @ivy.cache_fn(max_entries=2)
+    ... def square(x): return x**2
+    >>> print([square(i) for i in [1, 2, 1, 3]])
+    [1, 4, 1, 9]
+    >>> print(square.cache_info()["hits"], square.cache_info()["entries"])
+    1 2
     """
+    if func is None:
+        return lambda fn: cache_fn(
+            fn,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            content_hash=content_hash,
+        )
     global FN_CACHE
     if func not in FN_CACHE:
-        FN_CACHE[func] = {}
+        FN_CACHE[func] = _FnCache(max_entries, max_bytes)
+    else:
+        FN_CACHE[func].max_entries = max_entries
+        FN_CACHE[func].max_bytes = max_bytes
+    cache = FN_CACHE[func]
 
     @wraps(func)
     def cached_fn(*args, **kwargs):
-        key = "".join(
-            ([f"{str(i)}, " for i in args] + [" kw, "])
-            + [f"{str(i)}, " for i in sorted(kwargs.items())]
-        )
-        cache = FN_CACHE[func]
-        if key in cache:
-            return cache[key]
+        key = _cache_key((args, kwargs), content_hash)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
         ret = func(*args, **kwargs)
-        cache[key] = ret
+        # keys on the contents of the arrays don't depend on their identity, so
+        # the args needn't be kept alive
+        cache.put(key, None if content_hash else (args, kwargs), ret)
         return ret
 
+    cached_fn.cache_info = cache.info
+    cached_fn.cache_clear = cache.clear
     return cached_fn
 
 
@@ -1,6 +1,8 @@
 """Collection of Ivy neural network layers in functional form."""
 
 # global
+import itertools
+import math
 from typing import Optional, Tuple, Union, Sequence
 
 # local
@@ -17,6 +19,7 @@ from ivy.func_wrapper import (
     handle_array_like_without_promotion,
     handle_device,
     handle_backend_invalid,
+    _trace_native_call,
 )
 from ivy.utils.exceptions import handle_exceptions
 
@@ -2319,63 +2322,27 @@ def lstm_update(
         states, both of shape *[batch_shape,out]*.
     """
     # ToDo: test_lstm_update needs to be fixed
-    if time_major:
-        x = ivy.swapaxes(x, 0, 1)
-    # get shapes
+    # the timesteps are run over time major, with the batch dimensions flattened
+    if not time_major:
+        x = ivy.moveaxis(x, -2, 0)
     x_shape = list(x.shape)
-    batch_shape = x_shape[:-2]
-    timesteps = x_shape[-2]
-    input_channels = x_shape[-1]
-    x_flat = ivy.reshape(x, (-1, input_channels))
-
-    # input kernel
-    Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
+    timesteps, batch_shape = x_shape[0], x_shape[1:-1]
+    batch_size = math.prod(batch_shape)
+    ret, (ht, ct) = _lstm_packed(
+        ivy.reshape(x, (-1, x_shape[-1])),
+        ivy.reshape(init_h, (batch_size, -1)),
+        ivy.reshape(init_c, (batch_size, -1)),
+        kernel,
+        recurrent_kernel,
+        bias,
+        recurrent_bias,
+        [batch_size] * timesteps,
     )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
-
-    # recurrent kernel
-    Wh = recurrent_kernel
-
-    # lstm states
-    ht = init_h
-    ct = init_c
-
-    # lstm outputs
-    hts_list = []
-
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
-        ht = ot * ivy.tanh(ct)
-
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
-
-    ret = ivy.concat(hts_list, axis=-2)
-    if time_major:
-        ret = ivy.swapaxes(ret, 0, 1)
-
+    ret = ivy.reshape(ret, [timesteps] + batch_shape + [-1])
+    if not time_major:
+        ret = ivy.moveaxis(ret, 0, -2)
+    ht = ivy.reshape(ht, batch_shape + [-1])
+    ct = ivy.reshape(ct, batch_shape + [-1])
     return ret, (ht, ct)
 
 
@@ -2487,9 +2454,13 @@ def lstm(
     ]
 
     if batch_sizes is not None:
-        input, batch_sizes = _pad_packed_sequence(input, batch_sizes)
-
-    if batch_first:
+        # the packed sequences are run over as they are, on the sequences which
+        # haven't ended yet at each timestep
+        batch_sizes = (
+            ivy.to_list(batch_sizes) if ivy.is_array(batch_sizes) else batch_sizes
+        )
+        batch_sizes = [int(batch_size) for batch_size in batch_sizes]
+    elif batch_first:
         input = ivy.swapaxes(input, 0, 1)
 
     if dropout and train:
@@ -2551,15 +2522,12 @@ def lstm(
         h_outs.append(h_out)
         c_outs.append(c_out)
 
-    if batch_first:
+    if batch_first and batch_sizes is None:
         output = ivy.swapaxes(output, 0, 1)
 
     h_outs = h_out if num_layers == 1 else ivy.concat(h_outs, axis=0)
     c_outs = c_out if num_layers == 1 else ivy.concat(c_outs, axis=0)
 
-    if batch_sizes is not None:
-        output = _pack_padded_sequence(output, batch_sizes)[0]
-
     return output[:, -1], output, (h_outs, c_outs)
 
 
@@ -2817,23 +2785,41 @@ def _lstm_cell(
     recurrent_bias,
     batch_first,
     batch_sizes=None,
+    reverse=False,
 ):
     init_h = ivy.squeeze(init_h, axis=0)
     init_c = ivy.squeeze(init_c, axis=0)
-    out, states = ivy.lstm_update(
-        x,
-        init_h,
-        init_c,
-        kernel,
-        recurrent_kernel,
-        bias=bias,
-        recurrent_bias=recurrent_bias,
-        time_major=not batch_first,
-    )
-    h, c = states
-    h = ivy.expand_dims(h) if len(h.shape) == 2 else h
-    c = ivy.expand_dims(c) if len(c.shape) == 2 else c
-    return out, (h, c)
+    if batch_sizes is not None:
+        out, (h, c) = _lstm_packed(
+            x,
+            init_h,
+            init_c,
+            kernel,
+            recurrent_kernel,
+            bias,
+            recurrent_bias,
+            batch_sizes,
+            reverse=reverse,
+        )
+    else:
+        if batch_first:
+            x = ivy.swapaxes(x, 0, 1)
+        timesteps, batch_size = x.shape[:2]
+        out, (h, c) = _lstm_packed(
+            ivy.reshape(x, (timesteps * batch_size, -1)),
+            init_h,
+            init_c,
+            kernel,
+            recurrent_kernel,
+            bias,
+            recurrent_bias,
+            [batch_size] * timesteps,
+            reverse=reverse,
+        )
+        out = ivy.reshape(out, (timesteps, batch_size, -1))
+        if batch_first:
+            out = ivy.swapaxes(out, 0, 1)
+    return out, (ivy.expand_dims(h, axis=0), ivy.expand_dims(c, axis=0))
 
 
 def _lstm_layer(
@@ -2860,9 +2846,8 @@ def _lstm_layer(
             batch_first=batch_first,
             batch_sizes=batch_sizes,
         )
-        x_reversed = ivy.flip(x, axis=0)
         result_bw, (h_bw, c_bw) = _lstm_cell(
-            x_reversed,
+            x,
             hidden[0][1:],
             hidden[1][1:],
             weights[0][1],
@@ -2871,47 +2856,122 @@ def _lstm_layer(
             biases[1][1],
             batch_first=batch_first,
             batch_sizes=batch_sizes,
+            reverse=True,
         )
-        result_bw = ivy.flip(result_bw, axis=0)
         result = ivy.concat([result_fw, result_bw], axis=len(result_fw.shape) - 1)
         c = ivy.concat([c_fw, c_bw], axis=0)
         h = ivy.concat([h_fw, h_bw], axis=0)
     return result, (h, c)
 
 
+def _lstm_packed(
+    x,
+    init_h,
+    init_c,
+    kernel,
+    recurrent_kernel,
+    bias,
+    recurrent_bias,
+    batch_sizes,
+    reverse=False,
+):
+    """Run an lstm over the packed sequences `x` *[sum(batch_sizes), in]*, the
+    rows of which are the inputs of the first `batch_sizes[t]` sequences at
+    each timestep `t` in turn, and return the packed outputs and the final
+    states *[batch_sizes[0], out]* of each sequence."""
+    hidden_size = recurrent_kernel.shape[0]
+    # the input projections of all timesteps at once, with both biases folded in,
+    # and the gates scaled so that a single tanh gives all of their activations,
+    # as sigmoid(x) = (tanh(x / 2) + 1) / 2
+    gate_scale = ivy.repeat(
+        ivy.array([0.5, 0.5, 1.0, 0.5], dtype=recurrent_kernel.dtype), hidden_size
+    )
+    x_proj = ivy.matmul(x, kernel)
+    if bias is not None:
+        x_proj = x_proj + bias
+    if recurrent_bias is not None:
+        x_proj = x_proj + recurrent_bias
+    out, h, c = _lstm_recurrence(
+        ivy.to_native(x_proj * gate_scale),
+        ivy.to_native(init_h),
+        ivy.to_native(init_c),
+        ivy.to_native(recurrent_kernel * gate_scale),
+        batch_sizes,
+        reverse,
+    )
+    return ivy.to_ivy(out), (ivy.to_ivy(h), ivy.to_ivy(c))
+
+
+def _lstm_recurrence(x_proj, init_h, init_c, recurrent_kernel, batch_sizes, reverse):
+    """The recurrent steps of `_lstm_packed`, on native arrays.
+
+    Only the matmul with the recurrent kernel and the elementwise gate
+    updates are left for each timestep, which are run with the native
+    operators and the backend's tanh rather than through ivy's function
+    wrappers.
+    """
+    backend = ivy.current_backend(x_proj)
+    tanh = backend.tanh
+    hidden_size = recurrent_kernel.shape[0]
+    i_end, f_end, g_end = hidden_size, 2 * hidden_size, 3 * hidden_size
+    offsets = list(itertools.accumulate(batch_sizes, initial=0))
+    steps = range(len(batch_sizes))
+    if reverse:
+        steps = reversed(steps)
+    # the states of the sequences which haven't ended, which are the first rows
+    n_active = batch_sizes[-1] if reverse else batch_sizes[0]
+    h, c = init_h[:n_active], init_c[:n_active]
+    # the final states of the sequences which have ended, last ended first
+    ended = []
+    outputs = []
+    for t in steps:
+        batch_size = batch_sizes[t]
+        if batch_size < n_active:
+            ended.append((h[batch_size:], c[batch_size:]))
+            h, c = h[:batch_size], c[:batch_size]
+        elif batch_size > n_active:
+            # running backwards, sequences start from their initial states
+            h = backend.concat([h, init_h[n_active:batch_size]], axis=0)
+            c = backend.concat([c, init_c[n_active:batch_size]], axis=0)
+        n_active = batch_size
+        gates = tanh(x_proj[offsets[t] : offsets[t + 1]] + h @ recurrent_kernel)
+        i, f, g, o = (
+            gates[:, :i_end],
+            gates[:, i_end:f_end],
+            gates[:, f_end:g_end],
+            gates[:, g_end:],
+        )
+        c = 0.5 * ((f + 1) * c + (i + 1) * g)
+        h = 0.5 * (o + 1) * tanh(c)
+        outputs.append(h)
+    if reverse:
+        outputs.reverse()
+    if ended:
+        h = backend.concat([h] + [h for h, _ in reversed(ended)], axis=0)
+        c = backend.concat([c] + [c for _, c in reversed(ended)], axis=0)
+    return backend.concat(outputs, axis=0), h, c
+
+
+# the recurrence is recorded as a single call by `ivy.trace_replay`
+_lstm_recurrence = _trace_native_call("_lstm_recurrence", _lstm_recurrence)
+
+
 def _pack_padded_sequence(input, lengths):
-    input = ivy.swapaxes(input, 0, 1)
-    data = []
-    batch_sizes = []
-    for i in range(int(max(lengths))):
-        valid_data_mask = ivy.array(lengths) > i
-        data.append(input[valid_data_mask, i])
-        batch_sizes.append(int(sum(valid_data_mask)))
-    data = ivy.concat(data)
+    lengths = ivy.to_list(lengths) if ivy.is_array(lengths) else lengths
+    lengths = [int(length) for length in lengths]
+    # the (sequence, timestep) of each packed row, timestep by timestep
+    indices = [
+        (i, t)
+        for t in range(max(lengths))
+        for i, length in enumerate(lengths)
+        if length > t
+    ]
+    batch_sizes = [sum(length > t for length in lengths) for t in range(max(lengths))]
+    data = ivy.gather_nd(ivy.swapaxes(input, 0, 1), ivy.array(indices))
     batch_sizes = ivy.array(batch_sizes, dtype=ivy.int64)
     return data, batch_sizes
 
 
-def _pad_packed_sequence(data, batch_sizes):
-    padded_data = ivy.full(
-        (len(batch_sizes), int(max(batch_sizes)), *data.shape[1:]),
-        0,
-        dtype=data.dtype,
-        device=data.device,
-    )
-    data_offset = 0
-    for i, batch_size in enumerate(batch_sizes):
-        batch_size = int(batch_size)
-        padded_data[i, :batch_size] = data[data_offset : data_offset + batch_size]
-        data_offset += batch_size
-    lengths = ivy.sum(
-        ivy.arange(1, int(max(batch_sizes)) + 1)[:, ivy.newaxis] <= batch_sizes,
-        axis=1,
-        dtype=ivy.int64,
-    )
-    return padded_data, lengths
-
-
 def _retrieve_state(x, start, end, num_layers):
     return x if num_layers == 1 else _slice_along_axis(x, start=start, stop=end, axis=0)
 
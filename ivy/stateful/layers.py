@@ -1657,10 +1657,10 @@ class LSTM(Module):
             self.v.input.items(),
             self.v.recurrent.items(),
         ):
-            h_t, c_n = ivy.lstm_update(
+            h_t, (h_n, c_n) = ivy.lstm_update(
                 h_t, h_0, c_0, lstm_input_var.w, lstm_recurrent_var.w
             )
-            h_n_list.append(h_t[..., -1, :])
+            h_n_list.append(h_n)
             c_n_list.append(c_n)
         if not self._return_sequence:
             h_t = h_t[..., -1, :]
@@ -3,12 +3,108 @@
 
 # global
 import abc
+import math
 from typing import Union, Optional, Callable
 
 # local
 import ivy
 
 
+# Helpers #
+# --------#
+
+
+def _native(x):
+    return x.data if isinstance(x, ivy.Array) else x
+
+
+class _FlatLayout:
+    """Layout of the leaves of a container of variables in one contiguous flat
+    buffer per dtype and device, which the optimizers update at once in
+    foreach mode."""
+
+    def __init__(self, v: ivy.Container):
+        self.structure = v
+        self.signature = self._signature(v)
+        self.key_chains = [kc for kc, _ in self.signature]
+        groups = {}
+        for i, (_, x) in enumerate(v.cont_to_iterator()):
+            groups.setdefault((str(_native(x).dtype), ivy.dev(x)), []).append(i)
+        self.groups = list(groups.values())
+        self.shapes = [shape for _, (shape, _) in self.signature]
+        self.sizes = [math.prod(shape) for shape in self.shapes]
+        self._segment_ids = {}
+
+    @staticmethod
+    def _signature(v):
+        # read from the native arrays, bypassing the wrapped `ivy.Array.dtype`
+        leaves = ((kc, _native(x)) for kc, x in v.cont_to_iterator())
+        return [(kc, (tuple(x.shape), str(x.dtype))) for kc, x in leaves]
+
+    def matches(self, v: ivy.Container) -> bool:
+        return self._signature(v) == self.signature
+
+    def _pack(self, buffers):
+        # a single buffer is updated as an array, which the optimizer functions
+        # handle with less overhead than a container
+        if len(buffers) == 1:
+            return buffers[0]
+        return ivy.Container({f"group_{i}": x for i, x in enumerate(buffers)})
+
+    def _unpack(self, packed):
+        if isinstance(packed, ivy.Container):
+            return [packed[f"group_{i}"] for i in range(len(self.groups))]
+        return [packed]
+
+    def flatten(self, cont: ivy.Container) -> Union[ivy.Array, ivy.Container]:
+        """Pack the leaves of `cont`, which has the structure of the variables,
+        into one flat buffer per group, in a container if there are several
+        groups."""
+        # the layout only moves memory around, so it calls the backend directly
+        # rather than going through the wrappers of each ivy function once per leaf
+        backend = ivy.current_backend()
+        leaves = dict(cont.cont_to_iterator())
+        leaves = [_native(leaves[kc]) for kc in self.key_chains]
+        return self._pack(
+            [
+                ivy.Array(
+                    backend.concat([backend.reshape(leaves[j], (-1,)) for j in idxs])
+                )
+                for idxs in self.groups
+            ]
+        )
+
+    def unflatten(self, packed: Union[ivy.Array, ivy.Container]) -> ivy.Container:
+        """Return a container with the structure of the variables, the leaves
+        of which are views of the flat buffers packed by `flatten`."""
+        backend = ivy.current_backend()
+        leaves = [None] * len(self.shapes)
+        for idxs, x in zip(self.groups, self._unpack(packed)):
+            parts = backend.split(
+                _native(x), num_or_size_splits=[self.sizes[j] for j in idxs]
+            )
+            for j, part in zip(idxs, parts):
+                leaves[j] = ivy.Array(backend.reshape(part, self.shapes[j]))
+        return self.structure.cont_from_flat_list(leaves)
+
+    def segment_norm(
+        self, packed: Union[ivy.Array, ivy.Container]
+    ) -> Union[ivy.Array, ivy.Container]:
+        """Return the vector norm of each variable packed by `flatten`,
+        repeated over the elements of the variable."""
+        ret = []
+        for i, (idxs, x) in enumerate(zip(self.groups, self._unpack(packed))):
+            segment_ids = self._segment_ids.get(i)
+            if segment_ids is None:
+                segment_ids = self._segment_ids[i] = ivy.repeat(
+                    ivy.arange(len(idxs), device=ivy.dev(x)),
+                    [self.sizes[j] for j in idxs],
+                )
+            norms = ivy.unsorted_segment_sum(x**2, segment_ids, len(idxs)) ** 0.5
+            ret.append(ivy.gather(norms, segment_ids))
+        return self._pack(ret)
+
+
 # Base #
 # -----#
 
@@ -23,6 +119,7 @@ class Optimizer(abc.ABC):
         trace_on_next_step: bool = False,
         fallback_to_non_traced: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """Construct a general Optimizer. This is an abstract class, and must
         be derived.
@@ -50,6 +147,10 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables at once, packed into one flat buffer
+            per dtype and device, rather than one variable at a time.
+            Default is ``False``.
         """
         self._lr = lr
         self._inplace = inplace
@@ -62,6 +163,8 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._traced_step_fn = None
         self._traced = False
+        self._foreach = foreach
+        self._flat_layout = None
 
     # Private #
     # --------#
@@ -107,8 +210,44 @@ class Optimizer(abc.ABC):
             Default is ``False``
         """
         if ignore_missing:
-            return v.cont_set_at_keys(self._step(v.cont_at_key_chains(grads), grads))
-        return self._step(v, grads)
+            return v.cont_set_at_keys(
+                self._foreach_step(v.cont_at_key_chains(grads), grads)
+            )
+        return self._foreach_step(v, grads)
+
+    def _foreach_step(self, v: ivy.Container, grads: ivy.Container):
+        """Call the custom child step function implementation, on the
+        variables and gradients packed into flat buffers in foreach mode.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        grads
+            Nested gradients to update.
+        """
+        if not self._foreach:
+            return self._step(v, grads)
+        if self._flat_layout is None or not self._flat_layout.matches(v):
+            # the state is packed with the layout of the variables it was built for
+            state = self.state
+            self._flat_layout = _FlatLayout(v)
+            self.set_state(state)
+        layout = self._flat_layout
+        return layout.unflatten(self._step(layout.flatten(v), layout.flatten(grads)))
+
+    def _flatten(self, x: Optional[ivy.Container]):
+        """Pack the state `x` in foreach mode, once the layout of the variables
+        is known."""
+        if x is None or self._flat_layout is None:
+            return x
+        return self._flat_layout.flatten(x)
+
+    def _unflatten(self, x: Optional[ivy.Container]):
+        """Unpack the state `x` packed by `_flatten`."""
+        if x is None or self._flat_layout is None:
+            return x
+        return self._flat_layout.unflatten(x)
 
     # Public #
     # -------#
@@ -166,6 +305,7 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        foreach: bool = False,
     ):
         """Construct a Stochastic-Gradient-Descent (SGD) optimizer.
 
@@ -183,9 +323,18 @@ class SGD(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to update all the variables at once, packed into one flat buffer
+            per dtype and device, rather than one variable at a time.
+            Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -236,6 +385,7 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        foreach: bool = False,
     ):
         """Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
 
@@ -255,10 +405,19 @@ class LARS(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to update all the variables at once, packed into one flat buffer
+            per dtype and device, rather than one variable at a time.
+            Default is ``False``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -279,10 +438,21 @@ class LARS(Optimizer):
         ret
             The new updated variables container, following LARS step.
         """
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        if self._foreach:
+            # the learning rate is scaled by the norms of each variable rather than
+            # of the whole flat buffers
+            w_norm = self._flat_layout.segment_norm(v)
+            lr = ivy.stable_divide(w_norm * lr, self._flat_layout.segment_norm(grads))
+            if self._decay_lambda > 0:
+                lr /= w_norm * self._decay_lambda
+            return ivy.gradient_descent_update(
+                v, grads, lr, stop_gradients=self._stop_gradients
+            )
         return ivy.lars_update(
             v,
             grads,
-            self._lr if isinstance(self._lr, float) else self._lr(),
+            lr,
             decay_lambda=self._decay_lambda,
             stop_gradients=self._stop_gradients,
         )
@@ -313,6 +483,7 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """Construct an ADAM optimizer.
 
@@ -340,6 +511,10 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables at once, packed into one flat buffer
+            per dtype and device, rather than one variable at a time.
+            Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -350,7 +525,14 @@ class Adam(Optimizer):
         self._should_trace = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -398,12 +580,14 @@ class Adam(Optimizer):
         state
             Nested state to update.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        self._mw = self._flatten(state.mw)
+        self._vw = self._flatten(state.vw)
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container(
+            {"mw": self._unflatten(self._mw), "vw": self._unflatten(self._vw)}
+        )
 
 
 class AdamW(Adam):
@@ -418,6 +602,7 @@ class AdamW(Adam):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """Construct an ADAMW optimizer.
 
@@ -447,6 +632,10 @@ class AdamW(Adam):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables at once, packed into one flat buffer
+            per dtype and device, rather than one variable at a time.
+            Default is ``False``.
         """
         self._weight_decay = weight_decay
         super().__init__(
@@ -458,6 +647,7 @@ class AdamW(Adam):
             stop_gradients,
             trace_on_next_step,
             device,
+            foreach,
         )
 
     def _step(self, v: ivy.Container, grads: ivy.Container):
@@ -496,6 +686,7 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """Construct an LAMB optimizer.
 
@@ -528,9 +719,20 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update all the variables at once, packed into one flat buffer
+            per dtype and device, rather than one variable at a time.
+            Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            foreach=foreach,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -564,6 +766,8 @@ class LAMB(Optimizer):
             self._vw = grads**2
             self._first_pass = False
 
+        if self._foreach:
+            return self._foreach_lamb_update(v, grads)
         new_v, self._mw, self._vw = ivy.lamb_update(
             v,
             grads,
@@ -580,6 +784,30 @@ class LAMB(Optimizer):
         )
         return new_v
 
+    def _foreach_lamb_update(self, v: ivy.Container, grads: ivy.Container):
+        """LAMB update step of the variables packed into flat buffers, with
+        the trust ratio of each variable rather than of the whole buffers."""
+        eff_grads, self._mw, self._vw = ivy.adam_step(
+            grads,
+            self._mw,
+            self._vw,
+            self._count,
+            beta1=self._beta1,
+            beta2=self._beta2,
+            epsilon=self._epsilon,
+        )
+        layout = self._flat_layout
+        r1 = layout.segment_norm(v)
+        if self._decay_lambda > 0:
+            r2 = layout.segment_norm(eff_grads + self._decay_lambda * v)
+        else:
+            r2 = layout.segment_norm(eff_grads)
+        r = ivy.minimum(ivy.stable_divide(r1, r2), self._max_trust_ratio)
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        return ivy.optimizer_update(
+            v, eff_grads, r * lr, stop_gradients=self._stop_gradients
+        )
+
     def set_state(self, state: ivy.Container):
         """Set state of the optimizer.
 
@@ -588,9 +816,11 @@ class LAMB(Optimizer):
         state
             Nested state to update.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        self._mw = self._flatten(state.mw)
+        self._vw = self._flatten(state.vw)
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container(
+            {"mw": self._unflatten(self._mw), "vw": self._unflatten(self._vw)}
+        )
@@ -1,4 +1,5 @@
 from . import backend
 from . import dynamic_import
+from . import instrumentation
 from .dynamic_import import *
 from .binaries import *
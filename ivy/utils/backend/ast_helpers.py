@@ -1,10 +1,12 @@
 import ast
+import hashlib
+import marshal
 import os
 import sys
 import traceback
 from ast import parse
 from string import Template
-from importlib.util import spec_from_file_location
+from importlib.util import MAGIC_NUMBER, spec_from_file_location
 from importlib.abc import Loader, MetaPathFinder
 
 
@@ -39,6 +41,80 @@ def _retrive_local_modules():
 local_modules = _retrive_local_modules()
 
 
+def _persistent_cache_dir():
+    """Directory of the on-disk cache of compiled modules, None if disabled.
+
+    The code objects depend on the ivy version, the Python version, the
+    rewriting done by this module and the set of local modules, so each
+    combination of those gets its own directory.
+    """
+    cache_dir = os.environ.get("IVY_AST_CACHE_DIR")
+    if cache_dir is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        cache_dir = os.path.join(cache_home, "ivy", "with_backend")
+    if not cache_dir:
+        return None
+    from ivy._version import __version__
+
+    digest = hashlib.sha1()
+    with open(__file__, "rb") as f:
+        digest.update(f.read())
+    digest.update(" ".join(sorted(local_modules)).encode())
+    return os.path.join(
+        cache_dir,
+        f"{__version__}-{sys.implementation.cache_tag}-{digest.hexdigest()[:16]}",
+    )
+
+
+# set IVY_AST_CACHE_DIR to an empty string to disable the on-disk cache
+persistent_cache_dir = _persistent_cache_dir()
+
+
+def _cache_path(filename):
+    key = hashlib.sha1(os.path.abspath(filename).encode()).hexdigest()
+    return os.path.join(persistent_cache_dir, f"{key}.bin")
+
+
+def _load_cached_code(filename, source_stat):
+    """Return the cached code object of ``filename``, or None if it isn't
+    cached or the source changed since it was."""
+    if persistent_cache_dir is None:
+        return None
+    try:
+        with open(_cache_path(filename), "rb") as f:
+            magic, mtime_ns, size, code = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if magic != MAGIC_NUMBER or (mtime_ns, size) != (
+        source_stat.st_mtime_ns,
+        source_stat.st_size,
+    ):
+        return None
+    return code
+
+
+def _cache_code(filename, source_stat, code):
+    if persistent_cache_dir is None:
+        return
+    path = _cache_path(filename)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(persistent_cache_dir, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump(
+                (MAGIC_NUMBER, source_stat.st_mtime_ns, source_stat.st_size, code), f
+            )
+        # other processes only ever see complete files
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
 def _parse_absolute_fromimport(node: ast.ImportFrom):
     # Not to override absolute imports to other packages
     if node.module.partition(".")[0] not in local_modules:
@@ -262,17 +338,27 @@ class IvyLoader(Loader):
         if self.filename in _compiled_modules_cache:
             compiled_obj = _compiled_modules_cache[self.filename]
         else:
-            # enforce UTF-8 for compiling when installed as a package
-            # according to PEP 686
-            with open(self.filename, encoding="utf-8") as f:
-                data = f.read()
-
-            ast_tree = parse(data)
-            transformer = ImportTransformer()
-            transformer.visit(ast_tree)
-            transformer.impersonate_import(ast_tree, local_ivy_id)
-            ast.fix_missing_locations(ast_tree)
-            compiled_obj = compile(ast_tree, filename=self.filename, mode="exec")
+            # code importing from a local ivy embeds its id, which is only
+            # meaningful within this process, so it's never cached on disk
+            persist = local_ivy_id is None
+            source_stat = os.stat(self.filename)
+            compiled_obj = (
+                _load_cached_code(self.filename, source_stat) if persist else None
+            )
+            if compiled_obj is None:
+                # enforce UTF-8 for compiling when installed as a package
+                # according to PEP 686
+                with open(self.filename, encoding="utf-8") as f:
+                    data = f.read()
+
+                ast_tree = parse(data)
+                transformer = ImportTransformer()
+                transformer.visit(ast_tree)
+                transformer.impersonate_import(ast_tree, local_ivy_id)
+                ast.fix_missing_locations(ast_tree)
+                compiled_obj = compile(ast_tree, filename=self.filename, mode="exec")
+                if persist:
+                    _cache_code(self.filename, source_stat, compiled_obj)
             _compiled_modules_cache[self.filename] = compiled_obj
         try:
             exec(compiled_obj, module.__dict__)
@@ -5,8 +5,11 @@ import types
 import ivy
 import importlib
 import functools
-import numpy as np
 import gc
+import math
+import numpy as np
+import operator
+import weakref
 from ivy.utils import _importlib, verbosity
 
 # local
@@ -23,6 +26,34 @@ _compiled_backends_ids = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = {}
+# the fully wrapped ivy namespace of each backend, keyed by the backend module, the
+# cython wrappers mode and the instrumentation mode, so switching back to a backend
+# which has been set before only has to swap the cached dicts in. The key `None`
+# holds the namespace of ivy without any backend. The cache is reset whenever
+# `ivy_original_dict` changes.
+_backend_namespaces = {}
+
+# weak references to all ivy.Array instances with dynamic_backend=True, which are
+# converted to the new backend on ivy.set_backend(..., dynamic=True)
+_dynamic_backend_arrays = []
+_dynamic_backend_prune_size = 1024
+# arrays with at most this many elements are packed into a shared buffer, of at
+# most _DYNAMIC_BATCH_MAX_NUMEL elements, so they are converted with one DLPack
+# transfer per batch. The converted arrays are views into the converted buffer,
+# which isn't copied per array as that would be one more op per array, so the
+# whole buffer stays alive while any of them does: a single small surviving
+# array can keep up to _DYNAMIC_BATCH_MAX_NUMEL elements (4 MiB of float32)
+# alive. Lower _DYNAMIC_BATCH_MAX_NUMEL to bound this at the cost of more
+# transfers
+_DYNAMIC_BATCH_ARRAY_NUMEL = 4096
+_DYNAMIC_BATCH_MAX_NUMEL = 2**20
+_NATIVE_CONCAT_FNS = {
+    "jax": ("jax.numpy", "concatenate"),
+    "numpy": ("numpy", "concatenate"),
+    "paddle": ("paddle", "concat"),
+    "tensorflow": ("tensorflow", "concat"),
+    "torch": ("torch", "cat"),
+}
 
 
 class ContextManager:
@@ -206,7 +237,9 @@ def _set_module_backend(
     for k, v in original_dict.items():
         if k in ivy.GLOBAL_PROPS:
             continue
-        compositional = k not in backend.__dict__
+        # compositional functions are copied into the backend module when its
+        # namespace is first built
+        compositional = k not in backend.__dict__ or backend.__dict__[k] is v
         if compositional:
             if k in invalid_dtypes and k in target.__dict__:
                 del target.__dict__[k]
@@ -229,6 +262,71 @@ def _set_module_backend(
             )
 
 
+def _refresh_original_dict():
+    global ivy_original_dict
+    # keep the same original dict, and with it the cached namespaces, as long as
+    # nothing in the unset ivy namespace has been replaced since it was captured
+    unset_namespace = _backend_namespaces.get(None)
+    if unset_namespace is not None and len(ivy.__dict__) == len(ivy_original_dict):
+        ivy_dict = unset_namespace[0]
+        current_values = map(ivy.__dict__.get, ivy_dict)
+        if all(map(operator.is_, current_values, ivy_dict.values())):
+            return
+    ivy_original_dict = ivy.__dict__.copy()
+    _backend_namespaces.clear()
+
+
+def _build_backend_namespace(backend):
+    if backend is None:
+        ivy_dict = {
+            k: v for k, v in ivy_original_dict.items() if k not in ivy.GLOBAL_PROPS
+        }
+        deleted = ()
+    else:
+        set_backend_to_specific_version(backend)
+        _set_module_backend(ivy_original_dict, ivy, backend)
+        ivy_dict = {
+            k: ivy.__dict__[k]
+            for k in ivy_original_dict
+            if k not in ivy.GLOBAL_PROPS and k in ivy.__dict__
+        }
+        deleted = tuple(
+            k
+            for k in ivy_original_dict
+            if k not in ivy.GLOBAL_PROPS and k not in ivy.__dict__
+        )
+    # the ivy.functional namespace needs to point to the backend-specific
+    # functions as well
+    functional_dict = {
+        k: v
+        for k, v in ivy_dict.items()
+        if k in ivy.functional.__dict__ and not k.startswith("__")
+    }
+    return ivy_dict, deleted, functional_dict
+
+
+def _set_backend_namespace(backend):
+    """Point the ivy and ivy.functional namespaces to the wrapped functions of
+    `backend`, or to ivy's own functions if `backend` is None.
+
+    The namespace is only built the first time a backend is set, and is then
+    reused from `_backend_namespaces`.
+    """
+    key = (
+        None
+        if backend is None
+        else (backend, ivy.cython_wrappers_mode, ivy.instrumentation_mode)
+    )
+    namespace = _backend_namespaces.get(key)
+    if namespace is None:
+        namespace = _backend_namespaces[key] = _build_backend_namespace(backend)
+    ivy_dict, deleted, functional_dict = namespace
+    ivy.__dict__.update(ivy_dict)
+    for k in deleted:
+        ivy.__dict__.pop(k, None)
+    ivy.functional.__dict__.update(functional_dict)
+
+
 def _handle_backend_specific_vars(target, backend):
     if backend.current_backend_str() == "numpy":
         target.set_default_device("cpu")
@@ -247,81 +345,108 @@ def _data_to_new_backend(x, previous_backend):
     return result
 
 
-def dynamic_backend_converter(backend_stack):
-    from ivy.functional.ivy.gradients import _variable
-
-    def _is_var(obj, backend):
-        if isinstance(obj, ivy.Container):
+def _register_dynamic_backend_array(x):
+    global _dynamic_backend_prune_size
+    _dynamic_backend_arrays.append(weakref.ref(x))
+    if len(_dynamic_backend_arrays) > _dynamic_backend_prune_size:
+        _dynamic_backend_arrays[:] = [
+            ref for ref in _dynamic_backend_arrays if ref() is not None
+        ]
+        _dynamic_backend_prune_size = max(1024, 2 * len(_dynamic_backend_arrays))
 
-            def _map_fn(x):
-                x = x.data if isinstance(x, ivy.Array) else x
-                if x.__class__.__module__ in (
-                    "numpy",
-                    "jax.interpreters.xla",
-                    "jaxlib.xla_extension",
-                ):
-                    return False
 
-                return backend.gradients._is_variable(x)
+def _native_reshape(x, shape):
+    if hasattr(x, "reshape"):
+        return x.reshape(shape)
+    return ivy.reshape(x, shape).data
 
-            return obj.cont_map(lambda x, kc: _map_fn(x)).cont_all_true()
 
-        else:
-            obj = obj.data if isinstance(obj, ivy.Array) else obj
-            if obj.__class__.__module__ in (
-                "numpy",
-                "jax.interpreters.xla",
-                "jaxlib.xla_extension",
-            ):
-                return False
-            return backend.gradients._is_variable(obj)
-
-    # get all ivy array instances in the project scope
-    container_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Container)
-    ]
-    cont_array_idxs = ivy.nested_argwhere(
-        container_list,
-        lambda x: isinstance(x, ivy.Array) and x.backend != ivy.current_backend_str(),
+def _batched_data_to_new_backend(arrays, previous_backend):
+    shapes = [tuple(arr.data.shape) for arr in arrays]
+    # the native concat avoids the per-input overhead of the backend's concat
+    module_name, fn_name = _NATIVE_CONCAT_FNS[previous_backend.backend]
+    flat = getattr(importlib.import_module(module_name), fn_name)(
+        [_native_reshape(arr.data, (-1,)) for arr in arrays], 0
     )
-    cont_array_vals = ivy.multi_index_nest(container_list, cont_array_idxs)
-    array_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Array)
-    ]
-    array_list.extend(cont_array_vals)
-
-    # filter uninitialized arrays and arrays with other backends, and ensure the order
-    array_list = [
-        arr
-        for arr in array_list
-        if arr.__dict__ and arr.backend != ivy.current_backend_str()
-    ]
-    new_objs = [obj for obj in array_list if obj.dynamic_backend]
-
-    # now convert all ivy.Array and ivy.Container instances
-    # to the new backend
-
-    for obj in new_objs:
-        # the following if condition avoids converting arrays that were already
-        # updated inplace i.e. are references to other arrays
-        if obj.backend != ivy.current_backend_str():
-            backend = ivy.with_backend(obj.backend, cached=True)
-            if _is_var(obj, backend):
-                native_var = backend.gradients._variable_data(obj)
-                data = _data_to_new_backend(native_var, backend)
-                new_data = _variable(data)
-
-            else:
-                new_data = _data_to_new_backend(obj, backend)
-
-            if isinstance(obj, ivy.Container):
-                obj.cont_inplace_update(new_data)
-            else:
-                obj.data = new_data.data
+    new_flat = _data_to_new_backend(
+        types.SimpleNamespace(data=flat), previous_backend
+    ).data
+    start = 0
+    for arr, shape in zip(arrays, shapes):
+        stop = start + math.prod(shape)
+        # a view, which keeps new_flat alive, see _DYNAMIC_BATCH_ARRAY_NUMEL
+        arr.data = _native_reshape(new_flat[start:stop], shape)
+        start = stop
+
+
+def dynamic_backend_converter(backend_stack):
+    from ivy.functional.ivy.gradients import _variable
+
+    def _is_var(x, backend):
+        if x.__class__.__module__ in (
+            "numpy",
+            "jax.interpreters.xla",
+            "jaxlib.xla_extension",
+        ):
+            return False
+        return backend.gradients._is_variable(x)
+
+    # group the live dynamic arrays of other backends by their backend
+    current_backend = ivy.current_backend_str()
+    arrays_by_backend = {}
+    seen = set()
+    for ref in _dynamic_backend_arrays:
+        arr = ref()
+        if (
+            arr is None
+            or id(arr) in seen
+            or not arr.dynamic_backend
+            or arr.backend == current_backend
+        ):
+            continue
+        seen.add(id(arr))
+        arrays_by_backend.setdefault(arr.backend, []).append(arr)
+
+    # now convert all ivy.Array instances to the new backend, which also covers
+    # the arrays held by ivy.Container instances. The conversion allocates many
+    # objects, so the garbage collector is paused to avoid repeated full scans of
+    # a large heap.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for backend_str, arrays in arrays_by_backend.items():
+            backend = ivy.with_backend(backend_str, cached=True)
+            batches = []
+            open_batches = {}
+            for arr in arrays:
+                data = arr.data
+                numel = math.prod(data.shape)
+                if _is_var(data, backend):
+                    native_var = backend.gradients._variable_data(arr)
+                    new_data = _data_to_new_backend(native_var, backend)
+                    arr.data = _variable(new_data).data
+                elif numel <= _DYNAMIC_BATCH_ARRAY_NUMEL:
+                    # batch by device and dtype
+                    key = (str(getattr(data, "device", "")), str(data.dtype))
+                    if key not in open_batches or (
+                        open_batches[key][1] + numel > _DYNAMIC_BATCH_MAX_NUMEL
+                    ):
+                        open_batches[key] = [[], 0]
+                        batches.append(open_batches[key][0])
+                    open_batches[key][0].append(arr)
+                    open_batches[key][1] += numel
+                else:
+                    arr.data = _data_to_new_backend(arr, backend).data
+            for batch in batches:
+                try:
+                    _batched_data_to_new_backend(batch, backend)
+                except Exception:
+                    for arr in batch:
+                        if arr.backend != current_backend:
+                            arr.data = _data_to_new_backend(arr, backend).data
+    finally:
+        if gc_was_enabled:
+            gc.enable()
 
 
 @prevent_access_locally
@@ -355,9 +480,8 @@ def set_backend(backend: str, dynamic: bool = False):
 
     # update the global dict with the new backend
     with ivy.locks["backend_setter"]:
-        global ivy_original_dict
         if not backend_stack:
-            ivy_original_dict = ivy.__dict__.copy()
+            _refresh_original_dict()
         _clear_current_sub_backends()
         if isinstance(backend, str):
             temp_stack = []
@@ -371,13 +495,7 @@ def set_backend(backend: str, dynamic: bool = False):
         elif backend.current_backend_str() == "jax":
             ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
         backend_stack.append(backend)
-        set_backend_to_specific_version(backend)
-        _set_module_backend(ivy_original_dict, ivy, backend)
-        # following snippet is required to update the ivy.functional namespace with
-        # backend-specific functions
-        for key in ivy.__dict__.keys():
-            if key in ivy.functional.__dict__ and not key.startswith("__"):
-                ivy.functional.__dict__[key] = ivy.__dict__[key]
+        _set_backend_namespace(backend)
 
         if dynamic:
             dynamic_backend_converter(backend_stack)
@@ -486,20 +604,9 @@ def previous_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if k in ivy.GLOBAL_PROPS:
-                continue
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
-            if k in ivy.functional.__dict__ and not k.startswith("__"):
-                ivy.functional.__dict__[k] = v
+        # swap in the namespace of the new backend, or ivy's own namespace if
+        # there is no previously set backend
+        _set_backend_namespace(backend_stack[-1] if backend_stack else None)
     if verbosity.level > 0:
         verbosity.cprint(f"backend stack: {backend_stack}")
     _handle_inplace_mode()
@@ -0,0 +1,291 @@
+"""Per-function instrumentation of the ivy functions of the current backend.
+
+While `ivy.instrumentation_mode` is set, the functions of the backend are
+wrapped with hooks (see `ivy.func_wrapper.instrument_function`) which record
+the calls into this module: the number of calls of each function, their wall
+time, the part of it spent in the backend implementation rather than in ivy's
+wrappers, the shapes and dtypes of their array inputs and the size of the
+arrays they return. When the mode is unset the functions aren't wrapped, so it
+costs nothing.
+
+The memory used is bounded however long the mode is set: the statistics are
+running sums, the percentiles are estimated from a fixed size sample of the
+calls of each function, only the most common input signatures of each function
+are counted separately, and only the latest `max_events` calls are kept for
+tracing.
+
+The calls of all the threads are recorded into the same statistics, each thread
+keeping track of its own calls in progress. The updates of the statistics
+aren't locked, so concurrent calls of the same function may be miscounted.
+
+Example
+-------
+    ivy.set_backend("torch")
+    ivy.set_instrumentation_mode(True)
+    fn(x, y)
+    ivy.unset_instrumentation_mode()
+    ivy.utils.instrumentation.print_report()
+    ivy.utils.instrumentation.export_chrome_trace("trace.json")
+"""
+
+import collections
+import json
+import math
+import os
+import random
+import threading
+
+import ivy
+
+_local = threading.local()
+_stats = {}
+# number of calls of each function the wall times of which are sampled for the
+# percentiles
+RESERVOIR_SIZE = 1024
+# number of the most common input signatures of each function which are kept
+# when the others are merged, as OTHER_SIGNATURES
+SIGNATURES_SIZE = 64
+OTHER_SIGNATURES = "<other>"
+max_events = 100_000
+# (name, category, start ns, end ns, input signature, thread id) of the latest
+# calls, for tracing
+_events = collections.deque(maxlen=max_events)
+_random = random.Random(0)
+
+
+def _call_stack():
+    """Return the [name, time spent in the backend implementation] of each
+    instrumented call in progress in the current thread, innermost last."""
+    try:
+        return _local.call_stack
+    except AttributeError:
+        _local.call_stack = []
+        return _local.call_stack
+
+
+class OpStats:
+    """Statistics of the calls of one ivy function."""
+
+    __slots__ = (
+        "name",
+        "count",
+        "time",
+        "times",
+        "native_time",
+        "signatures",
+        "bytes_allocated",
+    )
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        # total wall time of the calls, in ns
+        self.time = 0
+        # wall times of a uniform sample of at most RESERVOIR_SIZE calls, in ns
+        self.times = []
+        # total time spent in the backend implementation, in ns, None for
+        # compositional functions
+        self.native_time = None
+        # number of calls with each input signature
+        self.signatures = collections.Counter()
+        self.bytes_allocated = 0
+
+    def add_time(self, time):
+        self.count += 1
+        self.time += time
+        if len(self.times) < RESERVOIR_SIZE:
+            self.times.append(time)
+        else:
+            # reservoir sampling, each call is kept with the same probability
+            i = _random.randrange(self.count)
+            if i < RESERVOIR_SIZE:
+                self.times[i] = time
+
+    def add_signature(self, signature):
+        signatures = self.signatures
+        signatures[signature] += 1
+        if len(signatures) > 2 * SIGNATURES_SIZE:
+            # all but the most common signatures are merged, so that the counts
+            # of the signatures which keep coming back are still separate
+            other = signatures.pop(OTHER_SIGNATURES, 0)
+            kept = collections.Counter(dict(signatures.most_common(SIGNATURES_SIZE)))
+            kept[OTHER_SIGNATURES] = (
+                other + sum(signatures.values()) - sum(kept.values())
+            )
+            self.signatures = kept
+
+    @property
+    def total_time(self):
+        return self.time / 1e9
+
+    def percentile(self, q):
+        """Wall time of a call at percentile ``q`` (in [0, 100]), in seconds,
+        estimated from the sampled calls."""
+        times = sorted(self.times)
+        return times[min(len(times) - 1, math.ceil(q / 100 * len(times)) - 1)] / 1e9
+
+    def as_dict(self):
+        native_time = None if self.native_time is None else self.native_time / 1e9
+        return {
+            "name": self.name,
+            "count": self.count,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.count,
+            "p50_time": self.percentile(50),
+            "p90_time": self.percentile(90),
+            "p99_time": self.percentile(99),
+            "native_time": native_time,
+            "wrapper_time": (
+                None if native_time is None else self.total_time - native_time
+            ),
+            "bytes_allocated": self.bytes_allocated,
+            "signatures": dict(self.signatures.most_common()),
+        }
+
+
+def _dtype_str(dtype):
+    name = getattr(dtype, "name", None)
+    return name if isinstance(name, str) else str(dtype).rpartition(".")[2]
+
+
+def _array_signature(x):
+    if isinstance(x, ivy.Array):
+        x = x._data
+    if isinstance(x, ivy.NativeArray):
+        return f"{_dtype_str(x.dtype)}{list(x.shape)}"
+    return None
+
+
+def _input_signature(args, kwargs):
+    """Dtypes and shapes of the arrays among the inputs, and those in lists or
+    tuples of inputs."""
+    sig = []
+    for arg in (*args, *kwargs.values()):
+        if isinstance(arg, (list, tuple)):
+            sig.extend(filter(None, map(_array_signature, arg)))
+        else:
+            sig.append(_array_signature(arg))
+    return ", ".join(filter(None, sig))
+
+
+def _nbytes(x):
+    if isinstance(x, ivy.Array):
+        x = x._data
+    if isinstance(x, ivy.NativeArray):
+        nbytes = getattr(x, "nbytes", None)
+        if isinstance(nbytes, int):
+            return nbytes
+        itemsize = getattr(x.dtype, "itemsize", None) or getattr(x.dtype, "size", 0)
+        return math.prod(x.shape) * itemsize
+    if isinstance(x, (list, tuple)):
+        return sum(map(_nbytes, x))
+    return 0
+
+
+def record_call(name, start, end, native_time, args, kwargs, ret):
+    """Record a call of the ivy function ``name`` which ran from ``start`` to
+    ``end`` (in ns), ``native_time`` ns of which in the backend
+    implementation."""
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats[name] = OpStats(name)
+    stats.add_time(end - start)
+    if native_time is not None:
+        stats.native_time = (stats.native_time or 0) + native_time
+    signature = _input_signature(args, kwargs)
+    stats.add_signature(signature)
+    stats.bytes_allocated += _nbytes(ret)
+    _events.append((name, "ivy", start, end, signature, threading.get_ident()))
+
+
+def record_native_call(name, start, end):
+    """Record a call of the backend implementation of ``name`` which ran from
+    ``start`` to ``end`` (in ns).
+
+    The time is added to the innermost call of ``name`` in progress rather than
+    to the innermost call, as backend implementations are also called back from
+    within other functions, e.g. `handle_soft_device_variable`.
+    """
+    for frame in reversed(_call_stack()):
+        if frame[0] == name:
+            frame[1] += end - start
+            break
+    _events.append((name, "backend", start, end, None, threading.get_ident()))
+
+
+def report(sort_by="total_time"):
+    """Return the statistics of the recorded calls of each function.
+
+    Parameters
+    ----------
+    sort_by
+        Key of the statistics to sort the functions by, in decreasing order.
+
+    Returns
+    -------
+    ret
+        A dict per function, with its number of calls, their total, mean and
+        percentile wall times, the time spent in the backend implementation and
+        in ivy's wrappers (all in seconds), the number of bytes of the returned
+        arrays, and the number of calls with each of the most common signatures
+        of the inputs, those with the other signatures being counted under
+        OTHER_SIGNATURES.
+    """
+    ret = [stats.as_dict() for stats in _stats.values()]
+    return sorted(ret, key=lambda x: x[sort_by] or 0, reverse=True)
+
+
+def print_report(sort_by="total_time", limit=None):
+    """Print the statistics of `report` as a table, for the first ``limit``
+    functions."""
+    print(
+        f"{'function':<32}{'calls':>8}{'total (s)':>11}{'p50 (ms)':>10}"
+        f"{'p99 (ms)':>10}{'native (s)':>12}{'wrappers (s)':>14}{'MB':>10}"
+    )
+    for stats in report(sort_by)[:limit]:
+        native, wrapper = (
+            ("-", "-")
+            if stats["native_time"] is None
+            else (f"{stats['native_time']:.4f}", f"{stats['wrapper_time']:.4f}")
+        )
+        print(
+            f"{stats['name']:<32}{stats['count']:>8}{stats['total_time']:>11.4f}"
+            f"{stats['p50_time'] * 1e3:>10.3f}{stats['p99_time'] * 1e3:>10.3f}"
+            f"{native:>12}{wrapper:>14}{stats['bytes_allocated'] / 2**20:>10.2f}"
+        )
+
+
+def export_chrome_trace(path):
+    """Write the recorded calls to ``path`` in the Chrome trace event format,
+    which can be loaded into chrome://tracing or Perfetto."""
+    pid = os.getpid()
+    events = []
+    for name, category, start, end, signature, tid in _events:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start / 1e3,
+            "dur": (end - start) / 1e3,
+            "pid": pid,
+            "tid": tid,
+        }
+        if signature:
+            event["args"] = {"inputs": signature}
+        events.append(event)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def set_max_events(n):
+    """Keep only the latest ``n`` calls for tracing, or all of them if
+    ``None``."""
+    global max_events, _events
+    max_events = n
+    _events = collections.deque(_events, maxlen=n)
+
+
+def reset():
+    """Discard all the recorded calls."""
+    _stats.clear()
+    _events.clear()
@@ -0,0 +1,83 @@
+# global
+from hypothesis import strategies as st
+
+# local
+import ivy_tests.test_ivy.helpers as helpers
+from ivy_tests.test_ivy.helpers import handle_frontend_test
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+@st.composite
+def _obs_and_code_book(draw):
+    dtype, obs = draw(
+        helpers.dtype_and_values(
+            available_dtypes=helpers.get_dtypes("float"),
+            min_num_dims=2,
+            max_num_dims=2,
+            min_dim_size=2,
+            max_dim_size=20,
+            min_value=-100,
+            max_value=100,
+        )
+    )
+    num_codes = draw(st.integers(1, obs[0].shape[0]))
+    # the codes are distinct observations, so that no two are equally near
+    code_book = obs[0][:num_codes]
+    return dtype, obs[0], code_book
+
+
+# --- Main --- #
+# ------------ #
+
+
+# kmeans2
+@handle_frontend_test(
+    fn_tree="scipy.cluster.vq.kmeans2",
+    args=_obs_and_code_book(),
+    iter=st.integers(1, 10),
+    test_with_out=st.just(False),
+)
+def test_scipy_kmeans2(
+    args, iter, frontend, test_flags, fn_tree, on_device, backend_fw
+):
+    dtype, obs, code_book = args
+    helpers.test_frontend_function(
+        input_dtypes=dtype * 2,
+        backend_to_test=backend_fw,
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        rtol=1e-4,
+        atol=1e-4,
+        data=obs,
+        k=code_book,
+        iter=iter,
+        minit="matrix",
+        missing="warn",
+    )
+
+
+# vq
+@handle_frontend_test(
+    fn_tree="scipy.cluster.vq.vq",
+    args=_obs_and_code_book(),
+    test_with_out=st.just(False),
+)
+def test_scipy_vq(args, frontend, test_flags, fn_tree, on_device, backend_fw):
+    dtype, obs, code_book = args
+    helpers.test_frontend_function(
+        input_dtypes=dtype * 2,
+        backend_to_test=backend_fw,
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        rtol=1e-4,
+        atol=1e-4,
+        obs=obs,
+        code_book=code_book,
+    )
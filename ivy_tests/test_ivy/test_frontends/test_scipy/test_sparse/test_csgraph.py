@@ -0,0 +1,94 @@
+# global
+import numpy as np
+from hypothesis import strategies as st
+
+# local
+import ivy
+import ivy_tests.test_ivy.helpers as helpers
+from ivy_tests.test_ivy.helpers import handle_frontend_test
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+@st.composite
+def _graph(draw):
+    num_nodes = draw(helpers.ints(min_value=1, max_value=10))
+    weights = draw(
+        helpers.array_values(
+            dtype="float64", shape=(num_nodes, num_nodes), min_value=1, max_value=10
+        )
+    )
+    # most of the pairs of nodes have no edge between them
+    edges = draw(
+        helpers.array_values(dtype="bool", shape=(num_nodes, num_nodes))
+    ) & draw(helpers.array_values(dtype="bool", shape=(num_nodes, num_nodes)))
+    return ["float64"], weights * edges
+
+
+# --- Main --- #
+# ------------ #
+
+
+# connected_components
+@handle_frontend_test(
+    fn_tree="scipy.sparse.csgraph.connected_components",
+    graph=_graph(),
+    directed=st.booleans(),
+    test_with_out=st.just(False),
+)
+def test_scipy_connected_components(
+    graph, directed, frontend, test_flags, fn_tree, on_device, backend_fw
+):
+    dtype, csgraph = graph
+    helpers.test_frontend_function(
+        input_dtypes=dtype,
+        backend_to_test=backend_fw,
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        csgraph=csgraph,
+        directed=directed,
+        connection="weak",
+    )
+
+
+# shortest_path
+@handle_frontend_test(
+    fn_tree="scipy.sparse.csgraph.shortest_path",
+    graph=_graph(),
+    directed=st.booleans(),
+    unweighted=st.booleans(),
+    test_with_out=st.just(False),
+)
+def test_scipy_shortest_path(
+    graph, directed, unweighted, frontend, test_flags, fn_tree, on_device, backend_fw
+):
+    dtype, csgraph = graph
+    helpers.test_frontend_function(
+        input_dtypes=dtype,
+        backend_to_test=backend_fw,
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        csgraph=csgraph,
+        directed=directed,
+        unweighted=unweighted,
+    )
+
+
+def test_scipy_shortest_path_without_edges(backend_fw):
+    ivy.set_backend(backend_fw)
+    from ivy.functional.frontends.scipy.sparse import csgraph, csr_matrix
+
+    dist, pred = csgraph.shortest_path(
+        csr_matrix(np.zeros((3, 3))), return_predecessors=True
+    )
+    # only the starting nodes themselves are reached
+    expected = np.where(np.eye(3, dtype=bool), 0.0, np.inf)
+    assert np.array_equal(ivy.to_numpy(dist.ivy_array), expected)
+    assert (ivy.to_numpy(pred.ivy_array) == -9999).all()
+    ivy.previous_backend()
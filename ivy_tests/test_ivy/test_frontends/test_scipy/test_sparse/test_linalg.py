@@ -0,0 +1,73 @@
+# global
+import numpy as np
+import pytest
+from hypothesis import strategies as st
+
+# local
+import ivy
+import ivy_tests.test_ivy.helpers as helpers
+from ivy_tests.test_ivy.helpers import handle_frontend_test
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+@st.composite
+def _spd_system(draw):
+    n = draw(helpers.ints(min_value=1, max_value=10))
+    m = draw(
+        helpers.array_values(dtype="float64", shape=(n, n), min_value=-5, max_value=5)
+    )
+    b = draw(
+        helpers.array_values(dtype="float64", shape=(n,), min_value=-10, max_value=10)
+    )
+    # symmetric positive definite, and well conditioned
+    a = np.matmul(m, m.T) + n * 25 * np.eye(n)
+    return ["float64", "float64"], a, b
+
+
+# --- Main --- #
+# ------------ #
+
+
+# cg
+@handle_frontend_test(
+    fn_tree="scipy.sparse.linalg.cg",
+    system=_spd_system(),
+    test_with_out=st.just(False),
+)
+def test_scipy_cg(system, frontend, test_flags, fn_tree, on_device, backend_fw):
+    dtype, a, b = system
+    helpers.test_frontend_function(
+        input_dtypes=dtype,
+        backend_to_test=backend_fw,
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        rtol=1e-4,
+        atol=1e-4,
+        A=a,
+        b=b,
+    )
+
+
+@pytest.mark.parametrize(
+    "a", [[[1.0, 0.0], [0.0, 0.0]], [[0.0, 0.0], [0.0, 0.0]], [[1.0, 2.0], [2.0, 4.0]]]
+)
+def test_scipy_singular_system(a, backend_fw):
+    ivy.set_backend(backend_fw)
+    from ivy.functional.frontends.scipy.sparse import csr_matrix, linalg
+
+    A = csr_matrix(np.array(a))
+    b = np.array([1.0, 1.0])
+    # the solvers report the breakdown instead of dividing by zero
+    for solver in (linalg.cg, linalg.bicgstab):
+        _, info = solver(A, b)
+        assert info < 0
+    # and spsolve warns and returns NaNs, like scipy does
+    with pytest.warns(UserWarning, match="singular"):
+        x = linalg.spsolve(A, b)
+    assert np.isnan(ivy.to_numpy(x.ivy_array)).all()
+    ivy.previous_backend()
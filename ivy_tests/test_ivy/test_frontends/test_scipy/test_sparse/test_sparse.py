@@ -0,0 +1,159 @@
+# global
+import numpy as np
+import pytest
+import scipy.sparse
+
+# local
+import ivy
+import ivy.functional.frontends.numpy as np_frontend
+import ivy.functional.frontends.scipy.sparse as sparse_frontend
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+_DENSE = np.array(
+    [
+        [0.0, 1.0, 0.0, 2.0],
+        [0.0, 0.0, 0.0, 0.0],
+        [3.0, 0.0, 4.0, 0.0],
+        [0.0, 5.0, 0.0, -6.0],
+        [7.0, 0.0, 0.0, 8.0],
+    ]
+)
+
+
+def _to_numpy(x):
+    if hasattr(x, "toarray"):
+        x = x.toarray()
+    return ivy.to_numpy(getattr(x, "ivy_array", x))
+
+
+def _assert_matches(ret, expected):
+    if scipy.sparse.issparse(expected):
+        assert ret.format == expected.format
+        assert ret.shape == expected.shape
+        expected = expected.toarray()
+    assert np.allclose(_to_numpy(ret), np.asarray(expected))
+
+
+# --- Main --- #
+# ------------ #
+
+
+@pytest.mark.parametrize("format", ["csr", "csc", "coo"])
+def test_scipy_sparse_constructors(format, backend_fw):
+    ivy.set_backend(backend_fw)
+    cls = getattr(sparse_frontend, f"{format}_matrix")
+    scipy_cls = getattr(scipy.sparse, f"{format}_matrix")
+    coo = scipy.sparse.coo_matrix(_DENSE)
+    args = [
+        (coo.data, (coo.row, coo.col)),
+        _DENSE,
+        (3, 2),
+    ]
+    if format != "coo":
+        compressed = scipy_cls(_DENSE)
+        args.append((compressed.data, compressed.indices, compressed.indptr))
+    for arg in args:
+        ret, expected = cls(arg), scipy_cls(arg)
+        _assert_matches(ret, expected)
+        assert ret.nnz == expected.nnz
+    # the shape is checked against that of the entries
+    _assert_matches(cls(_DENSE, shape=(5, 4)), scipy_cls(_DENSE, shape=(5, 4)))
+    with pytest.raises(ValueError):
+        cls(_DENSE, shape=(4, 4))
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("format", ["csr", "csc", "coo"])
+def test_scipy_sparse_conversions(format, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = getattr(sparse_frontend, f"{format}_matrix")(_DENSE)
+    expected = getattr(scipy.sparse, f"{format}_matrix")(_DENSE)
+    for to_format in ("tocsr", "tocsc", "tocoo"):
+        _assert_matches(getattr(x, to_format)(), getattr(expected, to_format)())
+    _assert_matches(x.T, expected.T)
+    _assert_matches(x.transpose(), expected.transpose())
+    csr, expected_csr = x.tocsr(), expected.tocsr()
+    assert np.array_equal(_to_numpy(csr.indptr), expected_csr.indptr)
+    assert np.array_equal(_to_numpy(csr.indices), expected_csr.indices)
+    assert np.array_equal(_to_numpy(csr.data), expected_csr.data)
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("format", ["csr", "csc", "coo"])
+def test_scipy_sparse_matmul(format, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = getattr(sparse_frontend, f"{format}_matrix")(_DENSE)
+    expected = getattr(scipy.sparse, f"{format}_matrix")(_DENSE)
+    vector = np.arange(4.0)
+    matrix = np.arange(12.0).reshape(4, 3)
+    other = scipy.sparse.csr_matrix(np.eye(4, 2) * 3)
+    sparse_other = sparse_frontend.csr_matrix(other.toarray())
+    _assert_matches(x @ vector, expected @ vector)
+    _assert_matches(x @ matrix, expected @ matrix)
+    _assert_matches(x.dot(matrix), expected.dot(matrix))
+    _assert_matches(x * matrix, expected * matrix)
+    _assert_matches(x @ sparse_other, expected @ other)
+    _assert_matches(x.dot(sparse_other), expected.dot(other))
+    with pytest.raises(ValueError):
+        x @ sparse_other.T.tocsr()
+
+    # numpy and frontend arrays defer their operators to the sparse matrices
+    for left in (np.arange(5.0), np.arange(10.0).reshape(2, 5)):
+        _assert_matches(left @ x, left @ expected)
+        _assert_matches(left * x, left * expected)
+        _assert_matches(np_frontend.array(left) @ x, left @ expected)
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("format", ["csr", "csc", "coo"])
+def test_scipy_sparse_reductions(format, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = getattr(sparse_frontend, f"{format}_matrix")(_DENSE)
+    expected = getattr(scipy.sparse, f"{format}_matrix")(_DENSE)
+    for axis in (None, 0, 1, -1):
+        ret = x.sum(axis=axis)
+        assert np.shape(_to_numpy(ret)) == np.shape(expected.sum(axis=axis))
+        _assert_matches(ret, expected.sum(axis=axis))
+        _assert_matches(x.mean(axis=axis), expected.mean(axis=axis))
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("format", ["csr", "csc", "coo"])
+def test_scipy_sparse_scalar_ops(format, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = getattr(sparse_frontend, f"{format}_matrix")(_DENSE)
+    expected = getattr(scipy.sparse, f"{format}_matrix")(_DENSE)
+    _assert_matches(x * 2, expected * 2)
+    _assert_matches(2 * x, 2 * expected)
+    _assert_matches(x / 4, expected / 4)
+    _assert_matches(-x, -expected)
+    _assert_matches(abs(x), abs(expected))
+    _assert_matches(x.astype("float32"), expected.astype("float32"))
+    assert x.astype("float32").dtype.ivy_dtype == "float32"
+    _assert_matches(x.copy(), expected.copy())
+    with pytest.raises(ivy.utils.exceptions.IvyNotImplementedException):
+        x / x
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+def test_scipy_sparse_row_indexing(format, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = getattr(sparse_frontend, f"{format}_matrix")(_DENSE)
+    expected = getattr(scipy.sparse, f"{format}_matrix")(_DENSE).tocsr()
+    for key in (2, -1, slice(1, 4), slice(None, None, 2), [4, 0, 2], [1, 1]):
+        _assert_matches(x[key], expected[key])
+    _assert_matches(x[np.array([3, 0])], expected[np.array([3, 0])])
+    _assert_matches(x[2, :], expected[2, :])
+    _assert_matches(x.getrow(3), expected.getrow(3))
+    with pytest.raises(IndexError):
+        x[5]
+    with pytest.raises(ivy.utils.exceptions.IvyNotImplementedException):
+        x[1, 2]
+    with pytest.raises(TypeError):
+        x.tocoo()[0]
+    ivy.previous_backend()
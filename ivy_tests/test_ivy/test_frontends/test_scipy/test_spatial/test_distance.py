@@ -0,0 +1,98 @@
+# global
+from hypothesis import strategies as st
+
+# local
+import ivy_tests.test_ivy.helpers as helpers
+from ivy_tests.test_ivy.helpers import handle_frontend_test
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+@st.composite
+def _distance_args(draw, num_arrays):
+    dtype, x = draw(
+        helpers.dtype_and_values(
+            available_dtypes=helpers.get_dtypes("float"),
+            num_arrays=num_arrays,
+            shared_dtype=True,
+            min_num_dims=2,
+            max_num_dims=2,
+            min_dim_size=1,
+            max_dim_size=10,
+            min_value=-100,
+            max_value=100,
+        )
+    )
+    metric = draw(
+        st.sampled_from([
+            "euclidean",
+            "sqeuclidean",
+            "cityblock",
+            "cosine",
+            "chebyshev",
+            "minkowski",
+        ])
+    )
+    kwargs = {}
+    if metric == "minkowski":
+        kwargs["p"] = draw(st.sampled_from([1, 1.5, 2, 3]))
+    if metric != "cosine" and draw(st.booleans()):
+        kwargs["w"] = draw(
+            helpers.array_values(
+                dtype="float64", shape=(x[0].shape[1],), min_value=0, max_value=10
+            )
+        )
+    return dtype, x, metric, kwargs
+
+
+# --- Main --- #
+# ------------ #
+
+
+# cdist
+@handle_frontend_test(
+    fn_tree="scipy.spatial.distance.cdist",
+    args=_distance_args(num_arrays=2),
+    test_with_out=st.just(False),
+)
+def test_scipy_cdist(args, frontend, test_flags, fn_tree, on_device, backend_fw):
+    dtype, x, metric, kwargs = args
+    helpers.test_frontend_function(
+        input_dtypes=dtype,
+        backend_to_test=backend_fw,
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        rtol=1e-4,
+        atol=1e-4,
+        XA=x[0],
+        XB=x[1],
+        metric=metric,
+        **kwargs,
+    )
+
+
+# pdist
+@handle_frontend_test(
+    fn_tree="scipy.spatial.distance.pdist",
+    args=_distance_args(num_arrays=1),
+    test_with_out=st.just(False),
+)
+def test_scipy_pdist(args, frontend, test_flags, fn_tree, on_device, backend_fw):
+    dtype, x, metric, kwargs = args
+    helpers.test_frontend_function(
+        input_dtypes=dtype,
+        backend_to_test=backend_fw,
+        frontend=frontend,
+        test_flags=test_flags,
+        fn_tree=fn_tree,
+        on_device=on_device,
+        rtol=1e-4,
+        atol=1e-4,
+        X=x[0],
+        metric=metric,
+        **kwargs,
+    )
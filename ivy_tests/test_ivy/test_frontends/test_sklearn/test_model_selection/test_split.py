@@ -1,5 +1,7 @@
 from hypothesis import strategies as st
 
+import ivy
+import ivy.functional.frontends.sklearn.model_selection as ivy_model_selection
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_frontend_test, handle_frontend_method
 
@@ -194,3 +196,54 @@ def test_sklearn_test_train_split(
         **kw,
         shuffle=shuffle,
     )
+
+
+def test_sklearn_kfold_split_folds(backend_fw):
+    ivy.set_backend(backend_fw)
+    X = ivy.zeros((10, 2))
+
+    # contiguous folds, the first n_samples % n_splits of which are larger
+    kfold = ivy_model_selection.KFold(n_splits=3)
+    folds = [
+        (ivy.to_numpy(train).tolist(), ivy.to_numpy(test).tolist())
+        for train, test in kfold.split(X)
+    ]
+    assert folds == [
+        ([4, 5, 6, 7, 8, 9], [0, 1, 2, 3]),
+        ([0, 1, 2, 3, 7, 8, 9], [4, 5, 6]),
+        ([0, 1, 2, 3, 4, 5, 6], [7, 8, 9]),
+    ]
+
+    # shuffled folds of the same sizes, which partition the samples
+    kfold = ivy_model_selection.KFold(n_splits=3, shuffle=True, random_state=0)
+    tests = []
+    for train, test in kfold.split(X):
+        train, test = ivy.to_numpy(train).tolist(), ivy.to_numpy(test).tolist()
+        assert sorted(train + test) == list(range(10))
+        tests.append(test)
+    assert [len(test) for test in tests] == [4, 3, 3]
+    assert sorted(sum(tests, [])) == list(range(10))
+    ivy.previous_backend()
+
+
+def test_sklearn_stratifiedkfold_split_folds(backend_fw):
+    ivy.set_backend(backend_fw)
+    X = ivy.zeros((9, 2))
+    # the classes are encoded in the order in which they first appear
+    y = ivy.array([1, 1, 1, 0, 0, 0, 0, 0, 0])
+
+    skfold = ivy_model_selection.StratifiedKFold(n_splits=3)
+    tests = [ivy.to_numpy(test).tolist() for _, test in skfold.split(X, y)]
+    assert tests == [[0, 3, 4], [1, 5, 6], [2, 7, 8]]
+
+    # shuffled without a random state, each fold still has one sample of class 1
+    # and two of class 0
+    skfold = ivy_model_selection.StratifiedKFold(n_splits=3, shuffle=True)
+    tests = []
+    for train, test in skfold.split(X, y):
+        train, test = ivy.to_numpy(train).tolist(), ivy.to_numpy(test).tolist()
+        assert sorted(train + test) == list(range(9))
+        assert sorted(ivy.to_numpy(y).take(test).tolist()) == [0, 0, 1]
+        tests.append(test)
+    assert sorted(sum(tests, [])) == list(range(9))
+    ivy.previous_backend()
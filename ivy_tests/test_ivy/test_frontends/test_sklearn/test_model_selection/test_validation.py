@@ -0,0 +1,75 @@
+import ivy
+import numpy as np
+import pytest
+
+from ivy.functional.frontends.sklearn.model_selection import (
+    KFold,
+    cross_val_predict,
+)
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+class _MeanRegressor:
+    """Predicts the first feature plus the mean target of the training
+    samples."""
+
+    def fit(self, X, y):
+        self.mean_ = ivy.mean(y)
+        return self
+
+    def predict(self, X):
+        return X[:, 0] + self.mean_
+
+
+class _OverlappingSplitter:
+    def split(self, X, y=None, groups=None):
+        yield ivy.arange(2, 4), ivy.arange(0, 2)
+        yield ivy.arange(0, 4), ivy.arange(1, 3)
+
+
+def _to_numpy(x):
+    return ivy.to_numpy(getattr(x, "ivy_array", x))
+
+
+# --- Main --- #
+# ------------ #
+
+
+def test_sklearn_cross_val_predict(backend_fw):
+    ivy.set_backend(backend_fw)
+    X = ivy.stack((ivy.arange(4, dtype="float64") * 10, ivy.zeros(4)), axis=1)
+    y = ivy.arange(4, dtype="float64")
+
+    # each fold is predicted by an estimator fitted on the other fold
+    ret = cross_val_predict(_MeanRegressor(), X, y, cv=2)
+    assert np.allclose(_to_numpy(ret), [2.5, 12.5, 20.5, 30.5])
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_sklearn_cross_val_predict_sample_order(backend_fw, n_jobs):
+    ivy.set_backend(backend_fw)
+    n_samples = 12
+    X = ivy.stack(
+        (ivy.arange(n_samples, dtype="float64"), ivy.zeros(n_samples)), axis=1
+    )
+    y = ivy.zeros(n_samples, dtype="float64")
+
+    # the predictions of the shuffled folds are put back in the order of the
+    # samples, whether the folds are run sequentially or in threads
+    cv = KFold(n_splits=3, shuffle=True, random_state=0)
+    ret = cross_val_predict(_MeanRegressor(), X, y, cv=cv, n_jobs=n_jobs)
+    assert np.allclose(_to_numpy(ret), np.arange(n_samples))
+    ivy.previous_backend()
+
+
+def test_sklearn_cross_val_predict_not_partition(backend_fw):
+    ivy.set_backend(backend_fw)
+    X = ivy.zeros((4, 2))
+    y = ivy.zeros(4)
+    with pytest.raises(ValueError):
+        cross_val_predict(_MeanRegressor(), X, y, cv=_OverlappingSplitter())
+    ivy.previous_backend()
@@ -1,5 +1,11 @@
 from ivy.functional.frontends.sklearn.tree import DecisionTreeClassifier as ivy_DTC
+from ivy.functional.frontends.sklearn.tree._criterion import Gini
+from ivy.functional.frontends.sklearn.tree._splitter import (
+    BestSplitter,
+    node_split_best,
+)
 import ivy
+import numpy as np
 from hypothesis import given
 import ivy_tests.test_ivy.helpers as helpers
 
@@ -42,3 +48,40 @@ def test_sklearn_tree_predict(X, y, max_depth):
     sklearn_pred = _get_sklearn_predict(X, y, max_depth, sklearn_DTC)(X)
     ivy_pred = _get_sklearn_predict(ivy.array(X), ivy.array(y), max_depth, ivy_DTC)(X)
     helpers.assert_same_type_and_shape([sklearn_pred, ivy_pred])
+
+
+def test_sklearn_tree_vectorized_split(backend_fw):
+    ivy.set_backend(backend_fw)
+
+    class PerSampleSplitter(BestSplitter):
+        def node_split(self, impurity, split, n_constant_features):
+            return node_split_best(
+                self,
+                self.partitioner,
+                self.criterion,
+                impurity,
+                split,
+                n_constant_features,
+            )
+
+    rng = np.random.default_rng(0)
+    X = ivy.array(rng.normal(size=(30, 3)).astype("float32"))
+    y = ivy.array(rng.integers(0, 3, size=30))
+    sample_weight = ivy.array(rng.integers(0, 3, size=30).astype("float64"))
+    per_sample = PerSampleSplitter(Gini(1, ivy.array([3])), 3, 1, 0.0, 0)
+    trees = [
+        ivy_DTC(max_depth=3, random_state=0, splitter=splitter)
+        .fit(X, y, sample_weight=sample_weight)
+        .tree_
+        for splitter in ("best", per_sample)
+    ]
+    assert trees[0].node_count == trees[1].node_count
+    for node, expected in zip(trees[0].nodes, trees[1].nodes):
+        assert node.left_child == expected.left_child
+        assert node.right_child == expected.right_child
+        assert int(node.feature) == int(expected.feature)
+        assert float(node.threshold) == float(expected.threshold)
+        assert node.n_node_samples == expected.n_node_samples
+        assert np.isclose(float(node.impurity), float(expected.impurity))
+    assert np.allclose(ivy.to_numpy(trees[0].value), ivy.to_numpy(trees[1].value))
+    ivy.previous_backend()
@@ -306,3 +306,40 @@ def test_tensorflow_unstack(
         ret_np_flat=np.array(ta.stack()).flatten(),
         backend=backend_fw,
     )
+
+
+@given(
+    num_writes=st.integers(1, 20),
+    clear_after_read=st.booleans(),
+)
+def test_tensorflow_write_dynamic_size(num_writes, clear_after_read, backend_fw):
+    # writing past the size grows the dense buffer of the elements
+    kwargs = {
+        "dtype": "float32",
+        "size": 1,
+        "dynamic_size": True,
+        "clear_after_read": clear_after_read,
+        "element_shape": (2, 3),
+    }
+    values = np.arange(num_writes * 6, dtype="float32").reshape((num_writes, 2, 3))
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        local_importer = ivy_backend.utils.dynamic_import
+        tf_frontend = local_importer.import_module(
+            "ivy.functional.frontends.tensorflow"
+        )
+        ta = tf_frontend.tensor.TensorArray(**kwargs)
+        ta_gt = tf.TensorArray(**kwargs)
+        for id in range(0, 2 * num_writes, 2):
+            ta = ta.write(id, tf_frontend.constant(values[id // 2]))
+            ta_gt = ta_gt.write(id, tf.constant(values[id // 2]))
+        helpers.value_test(
+            ret_np_from_gt_flat=ta_gt.read(0).numpy().flatten(),
+            ret_np_flat=np.array(ta.read(0)).flatten(),
+            backend=backend_fw,
+        )
+        helpers.value_test(
+            ret_np_from_gt_flat=ta_gt.gather([2 * num_writes - 2, 1]).numpy().flatten(),
+            ret_np_flat=np.array(ta.gather([2 * num_writes - 2, 1])).flatten(),
+            backend=backend_fw,
+        )
+        assert np.array(ta.size()) == ta_gt.size().numpy()
@@ -3937,6 +3937,46 @@ def test_torch_backward(
     )
 
 
+def test_torch_backward_shared_inputs(backend_fw):
+    ivy.set_backend(backend_fw)
+    if ivy.current_backend_str() in ("numpy", "paddle"):
+        ivy.warnings.warn("torch.Tensor.backward() unavailable for this backend")
+        return
+    values = np.array([0.5, -1.0, 2.0], dtype="float32")
+    weights = np.array([1.5, 0.5, -0.5], dtype="float32")
+
+    def residual(x, w, torch_module):
+        h = x
+        for _ in range(4):
+            h = h + torch_module.tanh(h * w)
+        return h.sum()
+
+    x = Tensor(values, requires_grad=True)
+    w = Tensor(weights, requires_grad=True)
+    c = residual(x, w, ivy.functional.frontends.torch)
+    c.backward(retain_graph=True)
+    c.backward()
+    with pytest.raises(RuntimeError):
+        c.backward()
+    x_torch = torch.tensor(values, requires_grad=True)
+    w_torch = torch.tensor(weights, requires_grad=True)
+    c_torch = residual(x_torch, w_torch, torch)
+    c_torch.backward(retain_graph=True)
+    c_torch.backward()
+    for ret, gt in ((x, x_torch), (w, w_torch)):
+        helpers.assertions.value_test(
+            ret_np_flat=helpers.flatten_and_to_np(
+                ret=ret.grad.ivy_array, backend=backend_fw
+            ),
+            ret_np_from_gt_flat=helpers.flatten_and_to_np(
+                ret=ivy.to_ivy(gt.grad.numpy()), backend=backend_fw
+            ),
+            rtol=1e-3,
+            atol=1e-3,
+            backend="torch",
+        )
+
+
 @handle_frontend_method(
     class_tree=CLASS_TREE,
     init_tree="torch.tensor",
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import ivy
+from ivy.functional.frontends import xgboost
+
+
+def test_xgboost_train_gbtree_early_stopping(backend_fw):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 3)).astype("float32")
+    y = ((X[:, 0] > 0) ^ (X[:, 1] > 0.5)).astype("float32").reshape(-1, 1)
+    X_train, y_train = ivy.array(X[:200]), ivy.array(y[:200])
+    X_val, y_val = ivy.array(X[200:]), ivy.array(y[200:])
+    evals_result = {}
+    bst = xgboost.train(
+        {"booster": "gbtree", "max_depth": 3, "eval_metric": "error"},
+        X_train,
+        y_train,
+        50,
+        evals=[(X_val, y_val, "val")],
+        early_stopping_rounds=3,
+        evals_result=evals_result,
+        verbose_eval=False,
+    )
+    errors = evals_result["val"]["error"]
+    # the classes are separated by two axis-aligned cuts
+    assert bst.best_score == min(errors) < 0.05
+    assert len(errors) == bst.best_iteration + 4 < 50
+    assert len(bst.gbm.trees) == len(errors)
+    pred = ivy.to_numpy(bst.predict(X_val))
+    assert np.mean(pred != y[200:]) == errors[-1]
+    # cached raw predictions match predicting with all the trees from scratch
+    assert np.allclose(
+        ivy.to_numpy(bst.gbm.pred(X_val)),
+        ivy.to_numpy(bst.gbm.pred(X_val, iteration_range=(0, len(errors)))),
+        atol=1e-5,
+    )
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("metric_arg", ["feval", "custom_metric"])
+def test_xgboost_train_custom_metric_not_implemented(metric_arg, backend_fw):
+    ivy.set_backend(backend_fw)
+    X, y = ivy.ones((4, 2)), ivy.ones((4, 1))
+    with pytest.raises(ivy.utils.exceptions.IvyNotImplementedException):
+        xgboost.train(
+            {"booster": "gbtree"}, X, y, 1, **{metric_arg: lambda pred, data: 0.0}
+        )
+    ivy.previous_backend()
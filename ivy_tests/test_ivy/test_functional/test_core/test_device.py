@@ -63,6 +63,11 @@ def _empty_dir(path, recreate=False):
         os.makedirs(path)
 
 
+def _split_func_call_fn(t0, t1):
+    # defined at module level, so it can be pickled for process pools
+    return t0 * t1, t0 - t1
+
+
 def _get_possible_devices():
     # Return all the possible usable devices
     with BackendHandler.update_backend(test_globals.CURRENT_BACKEND) as ivy_backend:
@@ -639,6 +644,79 @@ def test_split_func_call_with_cont_input(
         )
 
 
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+    array_shape=helpers.lists(
+        x=helpers.ints(min_value=2, max_value=6),
+        min_size="num_dims",
+        max_size="num_dims",
+        size_bounds=[1, 3],
+    ),
+    dtype=helpers.get_dtypes("float", full=False),
+    chunk_size=helpers.ints(min_value=1, max_value=3),
+    mode=st.sampled_from(["concat", "sum"]),
+    executor=st.sampled_from(["process", "devices"]),
+)
+def test_split_func_call_with_executor(
+    *,
+    array_shape,
+    dtype,
+    chunk_size,
+    mode,
+    executor,
+    on_device,
+    backend_fw,
+):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        # inputs, split into equally sized chunks so they can be summed
+        shape = (chunk_size * array_shape[0],) + tuple(array_shape[1:])
+        x1 = ivy_backend.asarray(
+            np.random.uniform(size=shape).astype(dtype[0]), device=on_device
+        )
+        x2 = ivy_backend.asarray(
+            np.random.uniform(size=shape).astype(dtype[0]), device=on_device
+        )
+        if executor == "devices":
+            executor = [on_device, on_device]
+
+        # predictions
+        a, b = ivy_backend.split_func_call(
+            _split_func_call_fn,
+            [x1, x2],
+            mode,
+            chunk_size=chunk_size,
+            executor=executor,
+        )
+
+        # true
+        a_true, b_true = _split_func_call_fn(x1, x2)
+        if mode == "sum":
+            a_true, b_true = (
+                ivy_backend.sum(
+                    ivy_backend.reshape(t, (array_shape[0], chunk_size) + shape[1:]),
+                    axis=0,
+                )
+                for t in (a_true, b_true)
+            )
+
+        # value test
+        assert isinstance(a, ivy_backend.Array)
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(a),
+            ivy_backend.to_numpy(a_true),
+            rtol=1e-2,
+            atol=1e-2,
+            backend=backend_fw,
+        )
+        helpers.assert_all_close(
+            ivy_backend.to_numpy(b),
+            ivy_backend.to_numpy(b_true),
+            rtol=1e-2,
+            atol=1e-2,
+            backend=backend_fw,
+        )
+
+
 # to_dev
 @handle_test(
     fn_tree="functional.ivy.to_device",
@@ -528,6 +528,52 @@ def test_cache_fn_with_args():
     assert ret0 is not ret1
 
 
+def test_cache_fn_with_limits():
+    def func(x):
+        return x * 2
+
+    # least recently used entries are evicted
+    cached_fn = ivy.cache_fn(func, max_entries=2)
+    cached_fn(1)
+    cached_fn(2)
+    cached_fn(1)
+    cached_fn(3)
+    info = cached_fn.cache_info()
+    assert info["entries"] == 2
+    assert info["hits"] == 1
+    assert info["misses"] == 3
+    cached_fn(1)
+    assert cached_fn.cache_info()["hits"] == 2
+    cached_fn(2)
+    assert cached_fn.cache_info()["misses"] == 4
+
+    # arrays are keyed by identity, or by content if requested
+    x = ivy.array([1.0, 2.0])
+    y = ivy.array([1.0, 2.0])
+    # each entry holds its output and the array argument kept alive with it
+    cached_fn = ivy.cache_fn(lambda a: a * 2, max_bytes=2 * x.size * x.itemsize)
+    assert cached_fn(x) is cached_fn(x)
+    assert cached_fn(x) is not cached_fn(y)
+    assert cached_fn.cache_info()["entries"] == 1
+    cached_fn = ivy.cache_fn(lambda a: a * 2, content_hash=True)
+    assert cached_fn(x) is cached_fn(y)
+
+    # the array arguments kept alive count towards the size of the cache, unless
+    # they are keyed by content
+    nbytes = x.size * x.itemsize
+    cached_fn = ivy.cache_fn(lambda a: ivy.sum(a), max_bytes=2 * nbytes)
+    cached_fn(x)
+    assert cached_fn.cache_info()["nbytes"] == nbytes + x.itemsize
+    cached_fn = ivy.cache_fn(lambda a: ivy.sum(a), content_hash=True)
+    cached_fn(x)
+    assert cached_fn.cache_info()["nbytes"] == x.itemsize
+
+    # clearing
+    cached_fn.cache_clear()
+    assert cached_fn.cache_info()["entries"] == 0
+    assert cached_fn.cache_info()["hits"] == 0
+
+
 # clip_matrix_norm
 @handle_test(
     fn_tree="functional.ivy.clip_matrix_norm",
@@ -1,4 +1,5 @@
 # global
+import pytest
 from hypothesis import strategies as st
 
 # local
@@ -176,6 +177,65 @@ def _sparse_csr_indices_values_shape(draw):
     return crow_indices, col_indices, value_dtype, values, shape
 
 
+@st.composite
+def _sparse_csr_and_dense(draw):
+    crow_indices, col_indices, value_dtype, values, shape = draw(
+        _sparse_csr_indices_values_shape()
+    )
+    x_shape = draw(st.sampled_from([(shape[1],), (shape[1], 3)]))
+    x = draw(helpers.array_values(dtype=value_dtype, shape=x_shape))
+    return crow_indices, col_indices, value_dtype, values, shape, x
+
+
+_DENSE = np.array(
+    [
+        [0.0, 1.0, 0.0, 2.0],
+        [0.0, 0.0, 0.0, 0.0],
+        [3.0, 0.0, 4.0, 0.0],
+        [0.0, 5.0, 0.0, -6.0],
+        [7.0, 0.0, 0.0, 8.0],
+    ]
+)
+
+
+def _sparse(dense, format):
+    """Return the sparse array of the nonzero elements of `dense`, built
+    with the components of `format`."""
+    num_rows, num_cols = dense.shape
+    if format == "csc":
+        cols, rows = np.nonzero(dense.T)
+        return ivy.SparseArray(
+            ccol_indices=ivy.array(
+                np.concatenate(([0], np.cumsum(np.bincount(cols, minlength=num_cols))))
+            ),
+            row_indices=ivy.array(rows),
+            values=ivy.array(dense[rows, cols]),
+            dense_shape=dense.shape,
+            format="csc",
+        )
+    rows, cols = np.nonzero(dense)
+    if format == "csr":
+        return ivy.SparseArray(
+            crow_indices=ivy.array(
+                np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=num_rows))))
+            ),
+            col_indices=ivy.array(cols),
+            values=ivy.array(dense[rows, cols]),
+            dense_shape=dense.shape,
+            format="csr",
+        )
+    return ivy.SparseArray(
+        coo_indices=ivy.array(np.stack((rows, cols))),
+        values=ivy.array(dense[rows, cols]),
+        dense_shape=dense.shape,
+        format="coo",
+    )
+
+
+def _assert_dense(x, expected):
+    assert np.allclose(ivy.to_numpy(x.to_dense_array()), expected)
+
+
 # --- Main --- #
 # ------------ #
 
@@ -410,3 +470,132 @@ def test_sparse_csr(
         class_name=class_name,
         method_name=method_name,
     )
+
+
+# csr - matmul
+@handle_method(
+    method_tree="SparseArray.matmul",
+    sparse_data=_sparse_csr_and_dense(),
+    method_num_positional_args=st.just(1),
+    init_num_positional_args=st.just(0),
+)
+def test_sparse_csr_matmul(
+    sparse_data,
+    class_name,
+    method_name,
+    backend_fw,
+    ground_truth_backend,
+    init_flags,
+    on_device,
+    method_flags,
+):
+    crow_indices, col_indices, value_dtype, values, shape, x = sparse_data
+    helpers.test_method(
+        backend_to_test=backend_fw,
+        ground_truth_backend=ground_truth_backend,
+        init_flags=init_flags,
+        method_flags=method_flags,
+        on_device=on_device,
+        init_input_dtypes=["int64", "int64", value_dtype],
+        init_all_as_kwargs_np={
+            "crow_indices": crow_indices,
+            "col_indices": col_indices,
+            "values": values,
+            "dense_shape": shape,
+            "format": "csr",
+        },
+        method_input_dtypes=[value_dtype],
+        method_all_as_kwargs_np={"x": x},
+        class_name=class_name,
+        method_name=method_name,
+    )
+
+
+@pytest.mark.parametrize("format", ["coo", "csr", "csc"])
+def test_sparse_conversions(format, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = _sparse(_DENSE, format)
+    _assert_dense(x, _DENSE)
+    for to_format in ("coo", "csr", "csc"):
+        ret = getattr(x, f"to_{to_format}")()
+        assert ret.format == to_format
+        _assert_dense(ret, _DENSE)
+    # the compressed indices are sorted as when built from the dense array
+    csr, expected = x.to_csr(), _sparse(_DENSE, "csr")
+    for name in ("crow_indices", "col_indices", "values"):
+        assert np.array_equal(
+            ivy.to_numpy(getattr(csr, name)), ivy.to_numpy(getattr(expected, name))
+        )
+    csc, expected = x.to_csc(), _sparse(_DENSE, "csc")
+    for name in ("ccol_indices", "row_indices", "values"):
+        assert np.array_equal(
+            ivy.to_numpy(getattr(csc, name)), ivy.to_numpy(getattr(expected, name))
+        )
+    transposed = x.T
+    assert tuple(transposed.dense_shape) == _DENSE.T.shape
+    assert transposed.format == {"coo": "coo", "csr": "csc", "csc": "csr"}[format]
+    _assert_dense(transposed, _DENSE.T)
+    ivy.previous_backend()
+
+
+def test_sparse_coo_duplicates_to_dense_array(backend_fw):
+    ivy.set_backend(backend_fw)
+    # the values of duplicate entries are summed, in any order
+    rows, cols = np.array([2, 0, 2, 1]), np.array([1, 3, 1, 0])
+    values = np.array([1.0, 2.0, 3.0, 4.0])
+    x = ivy.SparseArray(
+        coo_indices=ivy.array(np.stack((rows, cols))),
+        values=ivy.array(values),
+        dense_shape=(3, 4),
+        format="coo",
+    )
+    expected = np.zeros((3, 4))
+    np.add.at(expected, (rows, cols), values)
+    _assert_dense(x, expected)
+    _assert_dense(x.to_csr(), expected)
+    _assert_dense(x.to_csc(), expected)
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("format", ["coo", "csr", "csc"])
+def test_sparse_matmul(format, backend_fw, monkeypatch):
+    ivy.set_backend(backend_fw)
+    x = _sparse(_DENSE, format)
+    vector, matrix = np.arange(4.0), np.arange(12.0).reshape(4, 3)
+    assert np.allclose(ivy.to_numpy(x.matmul(ivy.array(vector))), _DENSE @ vector)
+    assert np.allclose(ivy.to_numpy(x @ ivy.array(matrix)), _DENSE @ matrix)
+    ret = x.matmul(ivy.zeros((4, 0)))
+    assert tuple(ret.shape) == (5, 0)
+
+    # the rows are multiplied in several blocks when the products are too large
+    module = ivy.functional.ivy.experimental.sparse_array
+    monkeypatch.setattr(module, "_MAX_BLOCK_BYTES", 2 * matrix.shape[1] * 8)
+    assert np.allclose(ivy.to_numpy(x.matmul(ivy.array(matrix))), _DENSE @ matrix)
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("format", ["coo", "csr", "csc"])
+def test_sparse_reductions(format, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = _sparse(_DENSE, format)
+    for axis in (None, 0, 1, -1, -2):
+        assert np.allclose(ivy.to_numpy(x.sum(axis)), _DENSE.sum(axis=axis))
+        assert np.allclose(ivy.to_numpy(x.mean(axis)), _DENSE.mean(axis=axis))
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("format", ["coo", "csr", "csc"])
+def test_sparse_elementwise(format, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = _sparse(_DENSE, format)
+    # the results keep the indices and the format of the sparse array
+    for ret, expected in [
+        (-x, -_DENSE),
+        (abs(x), np.abs(_DENSE)),
+        (x * 2, _DENSE * 2),
+        (3 * x, 3 * _DENSE),
+        (x / 4, _DENSE / 4),
+    ]:
+        assert ret.format == format
+        _assert_dense(ret, expected)
+    ivy.previous_backend()
@@ -4,6 +4,7 @@
 from hypothesis import strategies as st, assume
 import ivy
 import numpy as np
+import pytest
 
 
 # local
@@ -1565,6 +1566,49 @@ def test_linear(*, dtype_x_weight_bias, test_flags, backend_fw, fn_name, on_devi
 #     )
 
 
+@pytest.mark.parametrize("bidirectional", [False, True])
+def test_lstm_packed_sequences(bidirectional, backend_fw):
+    import torch
+
+    # the compositional implementation is run on all the backends, and compared
+    # against torch.nn.LSTM on the same packed sequences
+    seq_len, batch, input_size, hidden_size, num_layers = 5, 3, 4, 6, 2
+    lengths = [5, 3, 2]
+    num_directions = 1 + bidirectional
+    rng = np.random.default_rng(0)
+    torch_lstm = torch.nn.LSTM(
+        input_size, hidden_size, num_layers, bidirectional=bidirectional
+    ).double()
+    all_weights = [
+        rng.normal(size=tuple(weight.shape)) for weight in torch_lstm._flat_weights
+    ]
+    x = rng.normal(size=(seq_len, batch, input_size))
+    h0, c0 = rng.normal(size=(2, num_layers * num_directions, batch, hidden_size))
+    with torch.no_grad():
+        for weight, value in zip(torch_lstm._flat_weights, all_weights):
+            weight.copy_(torch.tensor(value))
+        packed = torch.nn.utils.rnn.pack_padded_sequence(torch.tensor(x), lengths)
+        expected, (expected_h, expected_c) = torch_lstm(
+            packed, (torch.tensor(h0), torch.tensor(c0))
+        )
+
+    ivy.set_backend(backend_fw)
+    _, output, (h, c) = ivy.functional.ivy.layers.lstm(
+        ivy.array(packed.data.numpy()),
+        (ivy.array(h0), ivy.array(c0)),
+        [ivy.array(weight) for weight in all_weights],
+        num_layers,
+        0.0,
+        False,
+        bidirectional,
+        batch_sizes=packed.batch_sizes.tolist(),
+    )
+    assert np.allclose(ivy.to_numpy(output), expected.data.numpy(), atol=1e-6)
+    assert np.allclose(ivy.to_numpy(h), expected_h.numpy(), atol=1e-6)
+    assert np.allclose(ivy.to_numpy(c), expected_c.numpy(), atol=1e-6)
+    ivy.previous_backend()
+
+
 # lstm_update
 @handle_test(
     fn_tree="functional.ivy.lstm_update",
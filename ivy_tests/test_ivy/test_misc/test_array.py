@@ -2281,6 +2281,29 @@ def test_array_function():
     assert all(y1 == ivy.array([1, 1]))
 
 
+def test_array_init(backend_fw):
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        native = ivy_backend.native_array([1.0, 2.0])
+        x = ivy_backend.Array(native)
+        assert x.data is native
+        assert x.backend == backend_fw
+        # the core attributes are stored in slots, not in the instance dict
+        assert not x.__dict__
+        assert ivy_backend.Array(x).data is native
+        assert np.array_equal(
+            ivy_backend.to_numpy(ivy_backend.Array([1.0, 2.0])), [1.0, 2.0]
+        )
+        assert np.array_equal(
+            ivy_backend.to_numpy(ivy_backend.Array(np.array([1.0, 2.0]))), [1.0, 2.0]
+        )
+        # other attributes can still be set on arrays
+        x.custom_attr = 1
+        assert x.custom_attr == 1
+        x.data = ivy_backend.native_array([3.0])
+        assert x.shape == (1,)
+        assert x.custom_attr == 1
+
+
 @handle_test(
     fn_tree="functional.ivy.native_array",  # dummy fn_tree
     dtype_x=helpers.dtype_and_values(
@@ -1,4 +1,5 @@
 # global
+import functools
 from packaging import version
 import pytest
 import importlib
@@ -134,6 +135,45 @@ def test_dynamic_backend_all_combos(middle_backend, end_backend):
         assert ivy.gradients._is_variable(var_cont["b"])
 
 
+@pytest.mark.parametrize(
+    ("middle_backend", "end_backend"),
+    [
+        (a, b)
+        for a in _available_frameworks()
+        for b in _available_frameworks()
+        if (a != b and "mxnet" not in [a, b])
+    ],
+)
+def test_dynamic_backend_batched_conversion(middle_backend, end_backend):
+    ivy.set_backend(middle_backend)
+    # small arrays are converted in batches, large ones one by one
+    small = [ivy.array([i, i + 1], dtype="float32") for i in range(10)]
+    scalars = [ivy.array(i, dtype="int64") for i in range(3)]
+    large = ivy.ones((100, 100))
+    static = ivy.array([1, 2, 3])
+    static.dynamic_backend = False
+    ivy_cont = ivy.Container({"a": ivy.array([[1.0, 2.0]]), "b": {"c": small[0]}})
+
+    ivy.set_backend(end_backend, dynamic=True)
+
+    for i, x in enumerate(small):
+        assert isinstance(x.data, ivy.NativeArray)
+        assert x.backend == end_backend
+        assert np.array_equal(ivy.to_numpy(x), np.array([i, i + 1], dtype="float32"))
+    for i, x in enumerate(scalars):
+        assert isinstance(x.data, ivy.NativeArray)
+        assert x.shape == ()
+        assert ivy.to_numpy(x).item() == i
+    assert isinstance(large.data, ivy.NativeArray)
+    assert np.array_equal(ivy.to_numpy(large), np.ones((100, 100)))
+    assert not isinstance(static.data, ivy.NativeArray)
+    assert isinstance(ivy_cont.a.data, ivy.NativeArray)
+    assert ivy_cont.b.c is small[0]
+
+    ivy.previous_backend()
+    ivy.previous_backend()
+
+
 def test_dynamic_backend_context_manager():
     with ivy.dynamic_backend_as(True):
         a = ivy.array([0.0, 1.0])
@@ -179,9 +219,13 @@ def test_previous_backend(backend):
 
     previous_backend = ivy.previous_backend()
     stack_after_unset = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
+    # check that the function id has changed as inverse=True, unless the same
+    # backend is still set, in which case its cached namespace is swapped back in
     ivy.utils.assertions.check_equal(
-        func_address_before_unset, id(ivy.sum), inverse=True, as_array=False
+        func_address_before_unset,
+        id(ivy.sum),
+        inverse=ivy.current_backend_str() != backend,
+        as_array=False,
     )
     ivy.utils.assertions.check_equal(
         previous_backend,
@@ -229,6 +273,35 @@ def test_set_backend(backend, array_type):
     )
 
 
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_set_backend_reuses_cached_namespace(backend):
+    ivy.unset_backend()
+    ivy_sum = ivy.sum
+    ivy.set_backend(backend)
+    backend_sum = ivy.sum
+    ivy.set_backend("numpy")
+    ivy.previous_backend()
+    # switching back to a backend swaps in the namespace built the first time
+    assert ivy.sum is backend_sum
+    assert ivy.functional.sum is backend_sum
+    ivy.previous_backend()
+    assert ivy.sum is ivy_sum
+    assert ivy.functional.sum is ivy_sum
+    ivy.set_backend(backend)
+    assert ivy.sum is backend_sum
+    assert ivy.current_backend_str() == backend
+    x = ivy.array([1.0, 2.0])
+    assert ivy.to_scalar(ivy.sum(x)) == 3.0
+
+    # replacing a function of the unset namespace invalidates the cache
+    ivy.unset_backend()
+    ivy.sum = functools.wraps(ivy_sum)(lambda *args, **kwargs: ivy_sum(*args, **kwargs))
+    ivy.set_backend(backend)
+    assert ivy.sum is not backend_sum
+    ivy.previous_backend()
+    ivy.sum = ivy.functional.sum = ivy_sum
+
+
 @pytest.mark.parametrize("backend", ["torch", "numpy"])
 def test_set_backend_no_warning_when_inplace_update_supported(backend):
     with pytest.warns(None):
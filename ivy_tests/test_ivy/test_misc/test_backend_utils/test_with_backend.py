@@ -6,6 +6,7 @@ from hypothesis import strategies as st, given, settings, HealthCheck
 # Local
 import ivy
 import numpy as np
+from ivy.utils.backend import ast_helpers
 from ivy.utils.backend.handler import _backend_dict
 
 
@@ -14,6 +15,23 @@ def test_is_local(backend_fw):
     assert local_ivy.is_local()
 
 
+def test_with_backend_persistent_cache(backend_fw, tmp_path, monkeypatch):
+    monkeypatch.setattr(ast_helpers, "persistent_cache_dir", str(tmp_path))
+    monkeypatch.setattr(ast_helpers, "_compiled_modules_cache", {})
+    ivy.with_backend(backend_fw, cached=False)
+    assert any(tmp_path.iterdir())
+
+    # a fresh in-memory cache, as in a new process, is filled from disk only
+    monkeypatch.setattr(ast_helpers, "_compiled_modules_cache", {})
+
+    def parse(*_):
+        raise AssertionError("cached module was parsed again")
+
+    monkeypatch.setattr(ast_helpers, "parse", parse)
+    local_ivy = ivy.with_backend(backend_fw, cached=False)
+    assert np.allclose(local_ivy.to_numpy(local_ivy.array([1, 2]) + 1), [2, 3])
+
+
 @settings(
     # To be able to share traced_backends between examples
     suppress_health_check=[HealthCheck(9)]
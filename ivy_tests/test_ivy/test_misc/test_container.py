@@ -1812,6 +1812,84 @@ def test_container_multi_map(on_device):
     assert np.allclose(ivy.to_numpy(container_mapped["d"].f), 3)
 
 
+def test_container_map_cached_structure(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {
+                "c": ivy.array([2], device=on_device),
+                "d": ivy.array([3], device=on_device),
+            },
+        }
+    )
+    container_mapped = container.cont_map(lambda x, kc: kc)
+    assert container_mapped.cont_to_flat_list() == ["a", "b/c", "b/d"]
+
+    # the structure cached by the previous maps is updated once it changes
+    container.b.e = ivy.array([4], device=on_device)
+    container.b.c = Container({"f": ivy.array([5], device=on_device)})
+    container_mapped = container.cont_map(lambda x, kc: kc)
+    assert container_mapped.cont_to_flat_list() == ["a", "b/c/f", "b/d", "b/e"]
+    lengths = container_mapped.cont_map(lambda x, _: len(x))
+    container_mapped = ivy.Container.cont_multi_map(
+        lambda xs, _: xs[0] + xs[1], [container, lengths]
+    )
+    assert ivy.to_numpy(container_mapped.b.c.f).tolist() == [10]
+
+    # the mapped containers have the config of the mapped ones, and values which
+    # are dicts are nested
+    container = Container({"b": {"d": ivy.array([1], device=on_device)}}, print_limit=5)
+    container_mapped = container.cont_map(lambda x, _: {"y": x, "x": x})
+    assert container_mapped.cont_config["print_limit"] == 5
+    assert container_mapped.b.cont_config["print_limit"] == 5
+    assert isinstance(container_mapped.b.d, Container)
+    assert list(container_mapped.b.d.keys()) == ["x", "y"]
+
+
+def test_container_map_config_per_container(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {"c": ivy.array([2], device=on_device)},
+        }
+    )
+    container_mapped = container.cont_map(lambda x, _: x + 1)
+    assert container_mapped.b.cont_config is not container_mapped.cont_config
+
+    # changing the config of a sub-container leaves the others unchanged
+    container_mapped.b.cont_with_ivy_backend("numpy", inplace=True)
+    assert container_mapped.b.cont_config["ivyh"] == "numpy"
+    assert container_mapped.cont_config["ivyh"] is None
+    assert container.cont_config["ivyh"] is None
+
+
+def test_container_multi_map_empty_sub_containers(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0], device=on_device),
+            "b": {"c": {}, "d": ivy.array([2.0], device=on_device)},
+            "e": {},
+        }
+    )
+    # the empty sub-containers are kept when mapped with other values
+    for container_mapped in (
+        container * 2,
+        2 - container,
+        Container.cont_multi_map(lambda xs, _: xs[0] * xs[1], [container, 2]),
+    ):
+        assert container_mapped.cont_all_key_chains(include_empty=True) == [
+            "a",
+            "b/c",
+            "b/d",
+            "e",
+        ]
+        assert isinstance(container_mapped.e, Container)
+    # and dropped when all the inputs are containers
+    container_added = container + container
+    assert container_added.cont_all_key_chains(include_empty=True) == ["a", "b/d"]
+    assert np.allclose(ivy.to_numpy(container_added.b.d), [4.0])
+
+
 def test_container_num_arrays(on_device):
     dict_in = {
         "a": ivy.array([[0.0, 1.0, 2.0, 3.0]], device=on_device),
@@ -2971,6 +3049,116 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_disk_as_hdf5_chunked_and_streamed(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    import h5py
+
+    save_filepath = "container_on_disk_streamed.hdf5"
+    container = Container(
+        {
+            "a": ivy.arange(6, dtype="float32", device=on_device),
+            "b": {"c": ivy.reshape(ivy.arange(12, device=on_device), (6, 2))},
+        }
+    )
+
+    # chunked and compressed, with per-leaf options
+    container[:4].cont_to_disk_as_hdf5(
+        save_filepath,
+        mode="w",
+        chunks={"a": (2,), "b": {"c": (2, 2)}},
+        compression="gzip",
+        compression_opts=4,
+    )
+    with h5py.File(save_filepath, "r") as h5_obj:
+        assert h5_obj["a"].chunks == (2,)
+        assert h5_obj["b"]["c"].chunks == (2, 2)
+        assert h5_obj["b"]["c"].compression == "gzip"
+        assert h5_obj["a"].shape == (4,)
+
+    # streaming append, resizing the datasets
+    container[4:].cont_to_disk_as_hdf5(save_filepath, starting_index=None)
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath)
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)
+    )
+
+    # explicit resize when overwriting past the end
+    container.cont_to_disk_as_hdf5(save_filepath, starting_index=3, resize=True)
+    file_size, batch_size = Container.h5_file_size(save_filepath)
+    assert batch_size == 9
+
+    os.remove(save_filepath)
+
+
+def test_container_to_disk_as_hdf5_append_after_max_batch_size(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    import h5py
+
+    save_filepath = "container_on_disk_preallocated.hdf5"
+    container = Container({"a": ivy.arange(9, dtype="float32", device=on_device)})
+
+    # the datasets are preallocated with more rows than the first write
+    container[:3].cont_to_disk_as_hdf5(save_filepath, mode="w", max_batch_size=10)
+    # the appends follow the rows written so far, not the preallocated rows
+    container[3:6].cont_to_disk_as_hdf5(save_filepath, starting_index=None)
+    container[6:].cont_to_disk_as_hdf5(save_filepath, starting_index=None)
+    with h5py.File(save_filepath, "r") as h5_obj:
+        assert h5_obj["a"].shape == (10,)
+        assert h5_obj["a"].attrs["num_rows"] == 9
+        assert np.array_equal(h5_obj["a"][:9], np.arange(9, dtype="float32"))
+
+    os.remove(save_filepath)
+
+
+def test_container_from_disk_as_hdf5_lazy(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk_lazy.hdf5"
+    container = Container(
+        {
+            "a": ivy.arange(6, dtype="float32", device=on_device),
+            "b": {"c": ivy.reshape(ivy.arange(12, device=on_device), (6, 2))},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath, mode="w")
+
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(1, 5), lazy=True
+    )
+    assert not ivy.is_array(dict.__getitem__(loaded_container, "a"))
+
+    # slicing reads only the requested rows
+    sliced = loaded_container[1:3]
+    assert np.array_equal(ivy.to_numpy(sliced.a), ivy.to_numpy(container.a[2:4]))
+
+    # accessing a leaf materializes it
+    assert ivy.is_array(loaded_container.a)
+    assert ivy.is_array(dict.__getitem__(loaded_container, "a"))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a[1:5])
+    )
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container["b/c"]), ivy.to_numpy(container.b.c[1:5])
+    )
+
+    # container ops and flat lists materialize the leaves
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, lazy=True)
+    doubled = loaded_container * 2
+    assert np.array_equal(ivy.to_numpy(doubled.a), ivy.to_numpy(container.a * 2))
+    summed = loaded_container + loaded_container
+    assert np.array_equal(ivy.to_numpy(summed.b.c), ivy.to_numpy(container.b.c * 2))
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, lazy=True)
+    assert all(ivy.is_array(x) for x in loaded_container.cont_to_flat_list())
+
+    os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -1,4 +1,7 @@
+import concurrent.futures
+import json
 import numpy as np
+import threading
 
 import ivy
 import pytest
@@ -181,6 +184,22 @@ def test_to_native_arrays_and_back(backend_fw):
     ivy.previous_backend()
 
 
+def test_casting_modes_ops(backend_fw):
+    ivy.set_backend(backend_fw)
+    fn = ivy.func_wrapper.with_unsupported_dtypes(
+        {"99.9.9 and below": ("float16",)}, ivy.current_backend().backend_version
+    )(_fn1)
+    x = ivy.native_array([1.0])
+    assert fn(x) is x
+    assert "float16" in ivy.func_wrapper._casting_modes_intersect(_fn1)
+    # the unsupported dtypes are only looked up on the first call
+    with patch.object(ivy, "function_unsupported_dtypes") as mock:
+        assert fn(x) is x
+        assert "float16" in ivy.func_wrapper._casting_modes_intersect(_fn1)
+    assert not mock.called
+    ivy.previous_backend()
+
+
 @pytest.mark.parametrize(
     "array_to_update",
     [0, 1, 2, 3, 4],
@@ -209,3 +228,140 @@ def test_views(array_to_update, backend_fw):
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
     ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    ("fn", "args", "kwargs"),
+    [
+        ("add", ([1.0, 2.0], [3.0, 4.0]), {}),
+        ("add", ([1.0, 2.0], 3.0), {"alpha": 2}),
+        ("multiply", ([[1, 2], [3, 4]], [2, 3]), {}),
+        ("sum", ([[1.0, 2.0], [3.0, 4.0]],), {"axis": 0}),
+        ("matmul", ([[1.0, 2.0], [3.0, 4.0]], [[1.0], [2.0]]), {}),
+        ("split", ([1.0, 2.0, 3.0, 4.0],), {"num_or_size_splits": 2}),
+    ],
+)
+def test_fuse_wrappers(fn, args, kwargs, backend_fw):
+    ivy.set_backend(backend_fw)
+    fn = ivy.__dict__[fn]
+    args = [ivy.array(arg) if isinstance(arg, list) else arg for arg in args]
+    expected = fn(*args, **kwargs)
+    ivy.set_fused_dispatch_mode(True)
+    try:
+        ret = fn(*args, **kwargs)
+        # containers are not handled by the fast path and use the full chain
+        cont_ret = fn(ivy.Container(a=args[0]), *args[1:], **kwargs)
+    finally:
+        ivy.unset_fused_dispatch_mode()
+    assert type(ret) is type(expected)
+    if not isinstance(ret, (list, tuple)):
+        ret, expected = [ret], [expected]
+    for r, e in zip(ret, expected):
+        assert isinstance(r, ivy.Array)
+        assert np.allclose(ivy.to_numpy(r), ivy.to_numpy(e))
+    assert ivy.nested_any(cont_ret, ivy.is_ivy_container, check_nests=True)
+    ivy.previous_backend()
+
+
+def test_fuse_wrappers_raises(backend_fw):
+    ivy.set_backend(backend_fw)
+    ivy.set_fused_dispatch_mode(True)
+    try:
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            ivy.add(ivy.array([1.0, 2.0]), ivy.array([1.0, 2.0, 3.0]))
+    finally:
+        ivy.unset_fused_dispatch_mode()
+    ivy.previous_backend()
+
+
+def test_instrument_function(backend_fw, tmp_path):
+    ivy.set_backend(backend_fw)
+    instrumentation = ivy.utils.instrumentation
+    instrumentation.reset()
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    ivy.set_instrumentation_mode(True)
+    try:
+        assert getattr(ivy.add, "instrumented", False)
+        ret = ivy.sum(ivy.add(x, x), axis=0)
+    finally:
+        ivy.unset_instrumentation_mode()
+    assert np.allclose(ivy.to_numpy(ret), [8.0, 12.0])
+    # the hooks are removed with the mode
+    assert not hasattr(ivy.add, "instrumented")
+    ivy.add(x, x)
+
+    stats = {stats["name"]: stats for stats in instrumentation.report()}
+    assert stats["add"]["count"] == 1
+    assert stats["add"]["signatures"] == {"float32[2, 2], float32[2, 2]": 1}
+    assert stats["add"]["bytes_allocated"] == 16
+    assert 0 < stats["add"]["native_time"] <= stats["add"]["total_time"]
+    assert stats["sum"]["count"] == 1
+
+    path = tmp_path / "trace.json"
+    instrumentation.export_chrome_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert {"ivy", "backend"} <= {event["cat"] for event in events}
+    assert any(event["name"] == "add" and event["cat"] == "ivy" for event in events)
+    instrumentation.reset()
+    assert not instrumentation.report()
+    ivy.previous_backend()
+
+
+def test_instrumentation_memory_is_bounded():
+    instrumentation = ivy.utils.instrumentation
+    instrumentation.reset()
+    instrumentation.set_max_events(100)
+    try:
+        num_calls = 3 * instrumentation.RESERVOIR_SIZE
+        for i in range(num_calls):
+            instrumentation.record_call("f", 0, i + 1, None, (), {}, None)
+        stats = instrumentation._stats["f"]
+        assert len(stats.times) == instrumentation.RESERVOIR_SIZE
+        assert len(instrumentation._events) == 100
+        assert instrumentation._events[-1][3] == num_calls
+        (report,) = instrumentation.report()
+        assert report["count"] == num_calls
+        assert report["total_time"] == num_calls * (num_calls + 1) / 2 / 1e9
+        # the sampled percentiles are close to the exact ones
+        assert abs(report["p50_time"] * 1e9 - num_calls / 2) < num_calls / 10
+
+        # only the most common signatures are counted separately
+        size = instrumentation.SIGNATURES_SIZE
+        for i in range(10 * size):
+            stats.add_signature("float32[2]")
+            stats.add_signature(f"float32[{i}, 2]")
+        assert len(stats.signatures) <= 2 * size + 1
+        assert stats.signatures["float32[2]"] == 10 * size
+        assert stats.signatures[instrumentation.OTHER_SIGNATURES] > 0
+        assert sum(stats.signatures.values()) == 20 * size + num_calls
+    finally:
+        instrumentation.set_max_events(100_000)
+        instrumentation.reset()
+
+
+def test_instrumentation_threads(backend_fw):
+    ivy.set_backend(backend_fw)
+    instrumentation = ivy.utils.instrumentation
+    instrumentation.reset()
+    x = ivy.array([1.0, 2.0])
+    # each thread keeps track of its own calls in progress
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        call_stacks = list(executor.map(lambda _: instrumentation._call_stack(), [0]))
+    assert call_stacks[0] is not instrumentation._call_stack()
+
+    def _add(_):
+        ivy.add(x, x)
+        return threading.get_ident()
+
+    ivy.set_instrumentation_mode(True)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            thread_ids = set(executor.map(_add, range(8)))
+    finally:
+        ivy.unset_instrumentation_mode()
+    assert not instrumentation._call_stack()
+    # the calls of each thread are traced in its own track
+    traced_ids = {event[5] for event in instrumentation._events if event[0] == "add"}
+    assert traced_ids == thread_ids
+    instrumentation.reset()
+    ivy.previous_backend()
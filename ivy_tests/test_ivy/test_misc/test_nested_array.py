@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+import ivy
+
+
+def _rows(x):
+    return [ivy.to_numpy(row).tolist() for row in x.unbind()]
+
+
+def test_nested_array_packing(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.NestedArray.nested_array([[1.0, 2.0, 3.0], [], [4.0, 5.0]])
+    assert x.shape == [3, None]
+    assert ivy.to_numpy(x.values).tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert ivy.to_numpy(x.row_splits).tolist() == [0, 3, 3, 5]
+    assert ivy.to_numpy(x.row_lengths()).tolist() == [3, 0, 2]
+    assert _rows(x) == [[1.0, 2.0, 3.0], [], [4.0, 5.0]]
+    assert ivy.to_numpy(x[-1]).tolist() == [4.0, 5.0]
+    assert _rows(x[1:]) == [[], [4.0, 5.0]]
+
+    y = ivy.NestedArray.from_row_lengths(ivy.arange(5.0), [3, 0, 2])
+    assert _rows(y) == [[0.0, 1.0, 2.0], [], [3.0, 4.0]]
+    y = ivy.NestedArray.from_row_splits(ivy.arange(5.0), [0, 3, 3, 5])
+    assert _rows(y) == [[0.0, 1.0, 2.0], [], [3.0, 4.0]]
+    ivy.previous_backend()
+
+
+def test_nested_array_elementwise(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.NestedArray.from_row_lengths(ivy.arange(5.0), [3, 0, 2])
+    assert _rows(x + 1) == [[1.0, 2.0, 3.0], [], [4.0, 5.0]]
+    assert _rows(2 * x - x) == _rows(x)
+    assert _rows(x.add(x, alpha=2)) == [[0.0, 3.0, 6.0], [], [9.0, 12.0]]
+    assert _rows(x.map_values(ivy.negative)) == [[0.0, -1.0, -2.0], [], [-3.0, -4.0]]
+
+    # rows which are partitioned differently are broadcast against each other
+    y = ivy.NestedArray.from_row_lengths(ivy.array([1.0, 2.0, 3.0]), [1, 0, 2])
+    assert _rows(x + y) == [[1.0, 2.0, 3.0], [], [5.0, 7.0]]
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    ("fn", "expected"),
+    [(ivy.cumsum, [[1, 3, 6], [10, 30]]), (ivy.flip, [[3, 2, 1], [20, 10]])],
+)
+def test_nested_array_multi_map_in_function(fn, expected, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.NestedArray.from_row_lengths(ivy.array([1, 2, 3, 10, 20]), [3, 2])
+    # functions which aren't elementwise are still applied to each row alone
+    ret = ivy.NestedArray.ragged_multi_map_in_function(fn, x)
+    assert _rows(ret) == expected
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    ("reduction", "expected"),
+    [
+        ("row_sum", [3.0, 0.0, 7.0]),
+        ("row_mean", [1.0, np.nan, 3.5]),
+        ("row_max", [2.0, -np.inf, 4.0]),
+        ("row_min", [0.0, np.inf, 3.0]),
+    ],
+)
+def test_nested_array_reductions(reduction, expected, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.NestedArray.from_row_lengths(ivy.arange(5.0), [3, 0, 2])
+    ret = getattr(x, reduction)()
+    assert np.allclose(ivy.to_numpy(ret), expected, equal_nan=True)
+
+    # the innermost ragged dimension is reduced
+    nested = ivy.NestedArray.from_row_lengths(x, [1, 2])
+    ret = getattr(nested, reduction)()
+    assert np.allclose(ivy.to_numpy(ret.values), expected, equal_nan=True)
+    assert ivy.to_numpy(ret.row_splits).tolist() == [0, 1, 3]
+    ivy.previous_backend()
+
+
+def test_nested_array_to_padded(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.NestedArray.nested_array([[[1, 2], [3]], [], [[4, 5, 6]]])
+    assert x.shape == [3, None, None]
+    assert ivy.to_numpy(x.to_padded(-1)).tolist() == [
+        [[1, 2, -1], [3, -1, -1]],
+        [[-1, -1, -1], [-1, -1, -1]],
+        [[4, 5, 6], [-1, -1, -1]],
+    ]
+    assert ivy.to_numpy(x.padding_mask()).tolist() == [
+        [[True, True, False], [True, False, False]],
+        [[False, False, False], [False, False, False]],
+        [[True, True, True], [False, False, False]],
+    ]
+
+    # the inner shape is kept
+    y = ivy.NestedArray.nested_array([[[1, 2], [3, 4]], [[5, 6]]], nested_rank=1)
+    assert y.inner_shape == [2]
+    assert ivy.to_numpy(y.to_padded()).tolist() == [
+        [[1, 2], [3, 4]],
+        [[5, 6], [0, 0]],
+    ]
+    ivy.previous_backend()
@@ -0,0 +1,54 @@
+import numpy as np
+
+import ivy
+
+
+def _fn(x, y):
+    z = ivy.sum(ivy.sin(x) * y, axis=0) + 1
+    a, b = ivy.split(ivy.concat([x, x], axis=0), num_or_size_splits=2)
+    return {"z": z, "m": ivy.matmul(a, b)}
+
+
+def test_trace_replay(backend_fw):
+    ivy.set_backend(backend_fw)
+    x, y = ivy.array([[1.0, 2.0], [3.0, 4.0]]), ivy.array([1.0, -1.0])
+    graph = ivy.trace_replay(_fn, args=(x, y))
+    assert graph.num_traces == 1
+    # only the backend calls the outputs depend on are replayed
+    assert graph.num_ops(x, y) == 7
+
+    x = ivy.array([[0.5, -1.0], [2.0, 0.0]])
+    ret, expected = graph(x, y), _fn(x, y)
+    assert graph.num_traces == 1
+    for k in expected:
+        assert isinstance(ret[k], ivy.Array)
+        assert np.allclose(ivy.to_numpy(ret[k]), ivy.to_numpy(expected[k]))
+
+    # new shapes are traced again
+    graph(ivy.ones((3, 3)), ivy.ones((3,)))
+    assert graph.num_traces == 2
+    ivy.previous_backend()
+
+
+def test_trace_replay_in_place(backend_fw):
+    ivy.set_backend(backend_fw)
+
+    def fn(x, out):
+        ivy.add(x, 1.0, out=out)
+        return ivy.multiply(out, 2.0)
+
+    graph = ivy.trace_replay(fn, args=(ivy.ones((3,)), ivy.zeros((3,))))
+    out = ivy.zeros((3,))
+    ret = graph(ivy.full((3,), 2.0), out)
+    assert ivy.to_numpy(out).tolist() == [3.0, 3.0, 3.0]
+    assert ivy.to_numpy(ret).tolist() == [6.0, 6.0, 6.0]
+    ivy.previous_backend()
+
+
+def test_trace_replay_nested(backend_fw):
+    ivy.set_backend(backend_fw)
+    inner = ivy.trace_replay(ivy.exp, args=(ivy.ones((3,)),))
+    # the inner function is traced as part of the outer one
+    outer = ivy.trace_replay(lambda x: inner(x) + 1, args=(ivy.ones((3,)),))
+    assert np.allclose(ivy.to_numpy(outer(ivy.zeros((3,)))), 2.0)
+    ivy.previous_backend()
@@ -1,9 +1,12 @@
 """Collection of tests for Ivy optimizers."""
 
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -318,3 +321,54 @@ def test_sgd_optimizer(
         xs_grad_idxs=xs_grad_idxs,
         on_device=on_device,
     )
+
+
+# foreach
+@pytest.mark.parametrize(
+    ("optimizer", "kwargs"),
+    [
+        ("SGD", {}),
+        ("LARS", {"decay_lambda": 0.1}),
+        ("Adam", {}),
+        ("AdamW", {"weight_decay": 0.01}),
+        ("LAMB", {"decay_lambda": 0.1}),
+    ],
+)
+@pytest.mark.parametrize("mixed_dtypes", [False, True])
+def test_foreach_optimizer(optimizer, kwargs, mixed_dtypes, backend_fw):
+    ivy.set_backend(backend_fw)
+
+    def _variables(seed):
+        rng = np.random.default_rng(seed)
+        # the variables of each dtype are packed into a separate buffer
+        return ivy.Container(
+            a={
+                "w": ivy.array(rng.normal(size=(3, 4)).astype("float32")),
+                "b": ivy.array(rng.normal(size=(4,)).astype("float32")),
+            },
+            c=ivy.array(rng.normal(size=()).astype("float32")),
+            d=ivy.array(
+                rng.normal(size=(2, 2)).astype("float64" if mixed_dtypes else "float32")
+            ),
+        )
+
+    rets = []
+    for foreach in (False, True):
+        opt = getattr(ivy, optimizer)(lr=0.1, foreach=foreach, **kwargs)
+        v = _variables(0)
+        for step in range(3):
+            v = opt.step(v, _variables(step + 1))
+        rets.append((v, opt.state))
+    (v, state), (foreach_v, foreach_state) = rets
+    assert foreach_v.cont_all_key_chains() == v.cont_all_key_chains()
+    # the variables keep their dtypes
+    assert [x.dtype for x in foreach_v.cont_to_flat_list()] == [
+        x.dtype for x in _variables(0).cont_to_flat_list()
+    ]
+    for x, y in zip(
+        v.cont_to_flat_list() + state.cont_to_flat_list(),
+        foreach_v.cont_to_flat_list() + foreach_state.cont_to_flat_list(),
+    ):
+        assert x.shape == y.shape
+        assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y), atol=1e-5)
+    ivy.previous_backend()
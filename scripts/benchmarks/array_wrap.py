@@ -0,0 +1,64 @@
+"""Benchmark of the cost of wrapping native arrays in `ivy.Array`.
+
+Creates `--arrays` ivy arrays from a native array of each backend, reporting
+the time per wrap and the memory held per ivy.Array object (measured with
+tracemalloc in a second pass, excluding the shared native array). Arrays are
+created with `dynamic_backend=False`, so the weak references registered for
+dynamic backend conversion aren't counted.
+
+Usage:
+    python scripts/benchmarks/array_wrap.py --arrays 1000000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def benchmark(backend, num_arrays):
+    ivy.set_backend(backend)
+    x = ivy.native_array([1.0])
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        arrays = [ivy.Array(x, dynamic_backend=False) for _ in range(num_arrays)]
+        wrap_time = (time.perf_counter() - start) / num_arrays * 1e6
+        del arrays
+        gc.collect()
+        tracemalloc.start()
+        arrays = [ivy.Array(x, dynamic_backend=False) for _ in range(num_arrays)]
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # exclude the list holding the arrays
+        memory -= sys.getsizeof(arrays)
+        del arrays
+    finally:
+        gc.enable()
+    ivy.previous_backend()
+    return wrap_time, memory / num_arrays
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--arrays", type=int, default=1_000_000)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+    print(f"{'backend':<12}{'wrap (us)':>12}{'memory (B/array)':>20}")
+    for backend in args.backends:
+        wrap_time, memory = benchmark(backend, args.arrays)
+        print(f"{backend:<12}{wrap_time:>12.2f}{memory:>20.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark of the latency of switching between ivy backends.
+
+Times `ivy.set_backend` and `ivy.previous_backend` for each installed backend,
+the first time a backend is set (when its wrapped namespace is built) and on
+later switches (when the cached namespace is swapped in), as well as
+alternating between two backends stacked on top of each other, as code with
+e.g. a numpy pre-processing stage and a torch model does.
+
+Usage:
+    python scripts/benchmarks/backend_switch.py --number 100
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def _timed(fn, number=1):
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    parser.add_argument("--number", type=int, default=100)
+    args = parser.parse_args()
+    ivy.unset_backend()
+
+    print(
+        f"{'backend':<12}{'first set (ms)':>16}{'set (ms)':>12}"
+        f"{'previous (ms)':>16}"
+    )
+    for backend in args.backends:
+        first = _timed(lambda: ivy.set_backend(backend))
+        ivy.previous_backend()
+        set_time = 0.0
+        previous_time = 0.0
+        for _ in range(args.number):
+            set_time += _timed(lambda: ivy.set_backend(backend))
+            previous_time += _timed(ivy.previous_backend)
+        print(
+            f"{backend:<12}{first:>16.3f}{set_time / args.number:>12.3f}"
+            f"{previous_time / args.number:>16.3f}"
+        )
+
+    for i, outer in enumerate(args.backends):
+        for inner in args.backends[i + 1 :]:
+            ivy.set_backend(outer)
+
+            def _alternate():
+                ivy.set_backend(inner)
+                ivy.previous_backend()
+
+            t = _timed(_alternate, args.number)
+            ivy.previous_backend()
+            print(f"{inner} on top of {outer}, set + previous: {t:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark of calling backend functions with unsupported dtypes.
+
+Backend functions decorated with `with_unsupported_dtypes` and friends are
+wrapped by `casting_modes_ops`, which looks up the dtypes the function doesn't
+support on every call. This times calls of such functions of each backend on
+small arrays, both through the backend module directly, where the casting modes
+wrapper is the only one, and through the ivy API.
+
+Usage:
+    python scripts/benchmarks/casting_modes_ops.py --calls 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+# functions of the numpy and torch backends with unsupported dtypes
+_OPS = {
+    "atan2": 2,
+    "bitwise_and": 2,
+    "cosh": 1,
+    "floor_divide": 2,
+    "remainder": 2,
+}
+
+
+def _time(fn, args, calls):
+    fn(*args)
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn(*args)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+    print(f"{'backend':<12}{'function':<16}{'backend (us)':>14}{'ivy (us)':>12}")
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        x = ivy.array([[3, 5, 7], [2, 4, 6]], dtype="int32")
+        for name, n_args in _OPS.items():
+            backend_fn = getattr(ivy.current_backend(), name)
+            if not hasattr(backend_fn, "unsupported_dtypes") and not hasattr(
+                backend_fn, "supported_dtypes"
+            ):
+                continue
+            fn_args = [x] * n_args
+            native = _time(backend_fn, [a.data for a in fn_args], args.calls)
+            wrapped = _time(getattr(ivy, name), fn_args, args.calls)
+            print(f"{backend:<12}{name:<16}{native:>14.1f}{wrapped:>12.1f}")
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark of `cdist` and `pdist` of the scipy frontend.
+
+Times the distances between all the pairs of rows of two random matrices,
+computed by blocks sized to a memory budget with a matmul for the euclidean
+distances, against the same distances computed at once from the differences of
+all the pairs of rows broadcast against each other, the intermediate array of
+which takes `--rows`**2 * `--features` * 8 bytes.
+
+Usage:
+    python scripts/benchmarks/cdist.py --rows 2000 --features 64
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+import ivy.functional.frontends.scipy as sc_frontend  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def _broadcast_distances(a, b, metric):
+    diff = ivy.expand_dims(a, axis=1) - ivy.expand_dims(b, axis=0)
+    if metric == "euclidean":
+        return ivy.sqrt(ivy.sum(diff**2, axis=-1))
+    return ivy.sum(ivy.abs(diff), axis=-1)
+
+
+def _condensed(square):
+    return square[np.triu_indices(square.shape[0], k=1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--features", type=int, default=64)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    a_np = rng.normal(size=(args.rows, args.features))
+    b_np = rng.normal(size=(args.rows, args.features))
+    distance = sc_frontend.spatial.distance
+
+    print(
+        f"{'backend':<10}{'fn':<7}{'metric':<11}{'blocked (s)':>13}"
+        f"{'broadcast (s)':>15}{'same':>6}"
+    )
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        a, b = ivy.array(a_np), ivy.array(b_np)
+        for metric in ("euclidean", "cityblock"):
+            for fn in ("cdist", "pdist"):
+                if fn == "cdist":
+                    blocked, ret = _time(lambda: distance.cdist(a, b, metric))
+                    broadcast, expected = _time(
+                        lambda: _broadcast_distances(a, b, metric)
+                    )
+                    expected = ivy.to_numpy(expected)
+                else:
+                    blocked, ret = _time(lambda: distance.pdist(a, metric))
+                    broadcast, expected = _time(
+                        lambda: _broadcast_distances(a, a, metric)
+                    )
+                    expected = _condensed(ivy.to_numpy(expected))
+                same = np.allclose(np.asarray(ret), expected, atol=1e-6)
+                print(
+                    f"{backend:<10}{fn:<7}{metric:<11}{blocked:>13.3f}"
+                    f"{broadcast:>15.3f}{same!s:>6}"
+                )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark of writing and reading a multi-leaf container as hdf5.
+
+Writes a container with 1M rows spread over a few leaves, comparing the old
+row-by-row write loop against the bulk slab write of
+`Container.cont_to_disk_as_hdf5`, with and without chunking/compression, and
+streaming the rows to disk in batches with `starting_index=None`.
+
+Then reads it back, comparing the old per-dataset list materialisation against
+`Container.cont_from_disk_as_hdf5`, eagerly and lazily.
+
+The row-by-row and list-based loops are only timed on the first
+`--legacy-rows` rows, and their times are extrapolated to the full container.
+
+Usage:
+    python scripts/benchmarks/container_hdf5_io.py --rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import h5py
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+
+
+def _make_container(rows):
+    rng = np.random.default_rng(0)
+    return ivy.Container(
+        {
+            "obs": ivy.array(rng.random((rows, 8), dtype=np.float32)),
+            "action": ivy.array(rng.integers(0, 16, (rows,))),
+            "reward": ivy.array(rng.random((rows,), dtype=np.float32)),
+            "info": {"done": ivy.array(rng.random((rows,)) > 0.99)},
+        }
+    )
+
+
+def _row_by_row(cont, h5_obj):
+    for key, value in cont.items():
+        if isinstance(value, ivy.Container):
+            _row_by_row(value, h5_obj.require_group(key))
+            continue
+        value_as_np = ivy.to_numpy(value)
+        h5_obj.create_dataset(
+            key,
+            value_as_np.shape,
+            dtype=value_as_np.dtype,
+            maxshape=[None] * value_as_np.ndim,
+        )
+        for i in range(value_as_np.shape[0]):
+            h5_obj[key][i : i + 1] = value_as_np[i : i + 1]
+
+
+def _list_load(h5_obj, slice_obj):
+    ret = {}
+    for key, value in h5_obj.items():
+        if isinstance(value, h5py.Group):
+            ret[key] = _list_load(value, slice_obj)
+        else:
+            ret[key] = ivy.array(
+                list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
+            )
+    return ivy.Container(ret)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--legacy-rows", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    parser.add_argument("--backend", default="numpy")
+    args = parser.parse_args()
+    ivy.set_backend(args.backend)
+
+    cont = _make_container(args.rows)
+    tmp_dir = tempfile.mkdtemp()
+    path = os.path.join(tmp_dir, "cont.hdf5")
+    results = {}
+
+    legacy_rows = min(args.legacy_rows, args.rows)
+    with h5py.File(path, "w") as h5_obj:
+        t = _timed(lambda: _row_by_row(cont[:legacy_rows], h5_obj))
+    results["row by row (extrapolated)"] = t * args.rows / legacy_rows
+
+    results["bulk"] = _timed(lambda: cont.cont_to_disk_as_hdf5(path, mode="w"))
+    results["bulk, chunked + gzip"] = _timed(
+        lambda: cont.cont_to_disk_as_hdf5(
+            path, mode="w", chunks=True, compression="gzip", compression_opts=1
+        )
+    )
+
+    def _streamed():
+        with h5py.File(path, "w") as h5_obj:
+            for i in range(0, args.rows, args.batch_size):
+                cont[i : i + args.batch_size].cont_to_disk_as_hdf5(
+                    h5_obj, starting_index=None
+                )
+
+    results[f"streamed, batches of {args.batch_size}"] = _timed(_streamed)
+    assert ivy.Container.h5_file_size(path)[1] == args.rows
+
+    read_results = {}
+    with h5py.File(path, "r") as h5_obj:
+        t = _timed(lambda: _list_load(h5_obj, slice(legacy_rows)))
+    read_results["list per dataset (extrapolated)"] = t * args.rows / legacy_rows
+    read_results["eager"] = _timed(lambda: ivy.Container.cont_from_disk_as_hdf5(path))
+
+    def _lazy():
+        cont = ivy.Container.cont_from_disk_as_hdf5(path, lazy=True)
+        return cont.reward
+
+    read_results["lazy, one leaf"] = _timed(_lazy)
+    os.remove(path)
+    os.rmdir(tmp_dir)
+
+    print(f"writing {args.rows} rows with backend {args.backend}")
+    baseline = results["row by row (extrapolated)"]
+    for name, t in results.items():
+        print(f"{name:<36}{t:>10.3f} s{baseline / t:>10.1f}x")
+    print(f"reading {args.rows} rows with backend {args.backend}")
+    baseline = read_results["list per dataset (extrapolated)"]
+    for name, t in read_results.items():
+        print(f"{name:<36}{t:>10.3f} s{baseline / t:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark of `ivy.Container.cont_map` and `cont_multi_map` on deep containers.
+
+Builds a container of `--leaves` scalar arrays nested `--depth` levels deep,
+and times mapping a function over its leaves, adding two containers leaf by
+leaf and a chain of container arithmetic, which map over containers of the
+same structure. The leaves are native arrays, so that the arithmetic times the
+containers rather than the wrappers of ivy's functions at each leaf.
+
+Usage:
+    python scripts/benchmarks/container_map.py --leaves 10000 --depth 4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def _deep_dict(leaves, depth, fanout, make_leaf):
+    if depth == 0:
+        return {f"leaf_{i}": make_leaf(i) for i in range(leaves)}
+    per_child = -(-leaves // fanout)
+    ret = {}
+    for i in range(fanout):
+        n = min(per_child, leaves - i * per_child)
+        if n > 0:
+            ret[f"node_{i}"] = _deep_dict(n, depth - 1, fanout, make_leaf)
+    return ret
+
+
+def _time(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        ret = fn()
+    return (time.perf_counter() - start) / repeats, ret
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--leaves", type=int, default=10_000)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+
+    fanout = max(2, round(args.leaves ** (1 / (args.depth + 1))))
+    values = np.random.default_rng(0).normal(size=args.leaves).astype("float32")
+
+    print(f"{'backend':<10}{'op':<24}{'time (ms)':>11}")
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        x = ivy.Container(
+            _deep_dict(
+                args.leaves,
+                args.depth,
+                fanout,
+                lambda i: ivy.native_array(values[i]),
+            )
+        )
+        y = x.cont_map(lambda v, _: v * 2)
+        ops = {
+            "cont_map identity": lambda: x.cont_map(lambda v, _: v),
+            "cont_map key chains": lambda: x.cont_map(lambda v, kc: kc),
+            "cont_multi_map": lambda: ivy.Container.cont_multi_map(
+                lambda vs, _: vs[0], [x, y]
+            ),
+            "x + y": lambda: x + y,
+            "(x + y) * x - y": lambda: (x + y) * x - y,
+        }
+        for name, fn in ops.items():
+            elapsed, _ = _time(fn, args.repeats)
+            print(f"{backend:<10}{name:<24}{elapsed * 1e3:>11.1f}")
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark of the `KFold` splits of the sklearn frontend.
+
+Times the train and test indices of all the folds of `--samples` samples, taken
+as ranges or slices of a single permutation of the samples, against the same
+indices gathered with a boolean mask over all the samples for each fold, and
+times `cross_val_predict` of a least-squares model on `--features` features
+with the folds fitted one after the other and with `--n-jobs` threads.
+
+Usage:
+    python scripts/benchmarks/cv_split.py --samples 1000000 --n-splits 10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy.functional.frontends.sklearn import model_selection  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+class _LeastSquares:
+    def fit(self, X, y):
+        gram = ivy.matmul(X, X, transpose_a=True)
+        self.coef_ = ivy.matmul(ivy.inv(gram), ivy.matmul(y, X))
+        return self
+
+    def predict(self, X):
+        return ivy.matmul(X, self.coef_)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def _to_numpy(splits):
+    return [(np.asarray(train), np.asarray(test)) for train, test in splits]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    parser.add_argument("--features", type=int, default=32)
+    parser.add_argument("--n-splits", type=int, default=10)
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X_np = rng.normal(size=(args.samples, args.features))
+    y_np = X_np @ rng.normal(size=args.features) + rng.normal(size=args.samples)
+    masked_split = model_selection._split.BaseCrossValidator.split
+
+    print(f"{'backend':<10}{'op':<18}{'new (s)':>10}{'old (s)':>10}{'same':>6}")
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        X, y = ivy.array(X_np), ivy.array(y_np)
+        kf = model_selection.KFold(args.n_splits)
+        streamed, ret = _time(lambda: _to_numpy(kf.split(X)))
+        masked, expected = _time(lambda: _to_numpy(masked_split(kf, X)))
+        same = all(
+            np.array_equal(a, c) and np.array_equal(b, d)
+            for (a, b), (c, d) in zip(ret, expected)
+        )
+        print(f"{backend:<10}{'split':<18}{streamed:>10.3f}{masked:>10.3f}{same!s:>6}")
+        threaded, ret = _time(
+            lambda: model_selection.cross_val_predict(
+                _LeastSquares(), X, y, cv=kf, n_jobs=args.n_jobs
+            )
+        )
+        serial, expected = _time(
+            lambda: model_selection.cross_val_predict(_LeastSquares(), X, y, cv=kf)
+        )
+        same = np.allclose(np.asarray(ret), np.asarray(expected))
+        print(
+            f"{backend:<10}{'cross_val_predict':<18}{threaded:>10.3f}{serial:>10.3f}"
+            f"{same!s:>6}"
+        )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
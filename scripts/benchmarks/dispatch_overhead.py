@@ -0,0 +1,76 @@
+"""Micro-benchmark of the per-call overhead of ivy's function wrappers.
+
+Times a few elementwise and reduction ops on 1-element arrays, with the full
+chain of function wrappers and with the fused fast path
+(`ivy.set_fused_dispatch_mode(True)`), next to the bare backend function.
+
+Usage:
+    python scripts/benchmarks/dispatch_overhead.py --backends numpy torch
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+
+
+FNS = {
+    "add": lambda x, y: ivy.add(x, y),
+    "multiply": lambda x, y: ivy.multiply(x, y),
+    "sum": lambda x, y: ivy.sum(x),
+    "matmul": lambda x, y: ivy.matmul(x, y),
+}
+
+
+def _unwrapped(fn):
+    while hasattr(fn, "__wrapped__"):
+        fn = fn.__wrapped__
+    return fn
+
+
+def _time(fn, number):
+    fn()
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def benchmark(backend, number):
+    ivy.set_backend(backend)
+    x = ivy.array([1.0])
+    y = ivy.array([2.0])
+    rows = []
+    for name, call in FNS.items():
+        raw = _unwrapped(ivy.__dict__[name])
+        raw_args = (x.data, y.data) if name != "sum" else (x.data,)
+        raw_time = _time(lambda: raw(*raw_args), number)
+        chain_time = _time(lambda: call(x, y), number)
+        ivy.set_fused_dispatch_mode(True)
+        fused_time = _time(lambda: call(x, y), number)
+        ivy.unset_fused_dispatch_mode()
+        rows.append((name, raw_time, chain_time, fused_time))
+    ivy.previous_backend()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+    print(
+        f"{'backend':<12}{'fn':<10}{'backend fn (us)':>18}"
+        f"{'full chain (us)':>18}{'fused (us)':>14}{'speed-up':>10}"
+    )
+    for backend in args.backends:
+        for name, raw_time, chain_time, fused_time in benchmark(backend, args.number):
+            print(
+                f"{backend:<12}{name:<10}{raw_time:>18.1f}{chain_time:>18.1f}"
+                f"{fused_time:>14.1f}{chain_time / fused_time:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
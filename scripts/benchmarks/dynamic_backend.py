@@ -0,0 +1,51 @@
+"""Benchmark of converting live arrays on `ivy.set_backend(..., dynamic=True)`.
+
+Creates many small dynamic-backend arrays (and a heap of unrelated python
+objects, as held by a typical long-running process), then times switching to
+another backend with `dynamic=True`, which converts all of the arrays.
+
+Usage:
+    python scripts/benchmarks/dynamic_backend.py --arrays 100000 --objects 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--arrays", type=int, default=100_000)
+    parser.add_argument("--objects", type=int, default=1_000_000)
+    parser.add_argument("--backends", nargs=2, default=["numpy", "torch"])
+    args = parser.parse_args()
+    src, dst = args.backends
+
+    # import both backends up front, so only the conversion is timed
+    ivy.set_backend(dst)
+    ivy.previous_backend()
+    ivy.with_backend(src, cached=True)
+
+    ballast = [{"i": i} for i in range(args.objects)]
+    ivy.set_backend(src)
+    arrays = [ivy.array(np.full((4,), i, dtype=np.float32)) for i in range(args.arrays)]
+    start = time.perf_counter()
+    ivy.set_backend(dst, dynamic=True)
+    switch_time = time.perf_counter() - start
+
+    assert all(a.backend == dst for a in arrays)
+    print(
+        f"{args.arrays} arrays, {len(ballast)} other objects: "
+        f"{src} -> {dst} dynamic switch {switch_time:.3f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
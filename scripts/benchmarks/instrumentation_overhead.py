@@ -0,0 +1,71 @@
+"""Benchmark of the per-function instrumentation of ivy.
+
+Times a small sequence of ivy functions with `ivy.instrumentation_mode` unset,
+where no hooks are installed, and set, and prints the time spent in the backend
+implementations and in ivy's wrappers as recorded by the hooks.
+
+Usage:
+    python scripts/benchmarks/instrumentation_overhead.py --calls 100
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+_OPS = ("add", "matmul", "mean", "softmax")
+
+
+def _step(x):
+    y = ivy.add(ivy.matmul(x, x), 1.0)
+    return ivy.mean(ivy.softmax(y))
+
+
+def _time(x, calls):
+    _step(x)
+    start = time.perf_counter()
+    for _ in range(calls):
+        _step(x)
+    return (time.perf_counter() - start) / calls * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+    instrumentation = ivy.utils.instrumentation
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        x = ivy.random_normal(shape=(args.size, args.size))
+        disabled = _time(x, args.calls)
+        instrumentation.reset()
+        ivy.set_instrumentation_mode(True)
+        enabled = _time(x, args.calls)
+        ivy.unset_instrumentation_mode()
+        print(
+            f"{backend}: {disabled:.3f} ms per step uninstrumented, "
+            f"{enabled:.3f} ms instrumented"
+        )
+        print(f"  {'function':<12}{'calls':>8}{'native (ms)':>14}{'wrappers (ms)':>16}")
+        for stats in instrumentation.report():
+            if stats["name"] in _OPS:
+                print(
+                    f"  {stats['name']:<12}{stats['count']:>8}"
+                    f"{stats['native_time'] / stats['count'] * 1e3:>14.3f}"
+                    f"{stats['wrapper_time'] / stats['count'] * 1e3:>16.3f}"
+                )
+        instrumentation.reset()
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
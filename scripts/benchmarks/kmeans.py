@@ -0,0 +1,89 @@
+"""Benchmark of `vq` and `kmeans2` of the scipy frontend against scipy.
+
+Clusters `--points` random float32 points of `--features` dimensions around
+`--clusters` centres with `vq` and `kmeans2`, from the same initial code book
+for the frontend and scipy, and with mini-batch `kmeans2` on batches of
+`--batch-size` points. The labels are compared with those of scipy as the
+fraction of points with the same label, as the points almost equally near two
+codes may be assigned to either of them.
+
+Usage:
+    python scripts/benchmarks/kmeans.py --points 1000000 --features 128
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import scipy.cluster.vq
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+import ivy.functional.frontends.scipy as sc_frontend  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--features", type=int, default=128)
+    parser.add_argument("--clusters", type=int, default=16)
+    parser.add_argument("--iter", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=4096)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centres = rng.normal(scale=4, size=(args.clusters, args.features))
+    labels = rng.integers(0, args.clusters, size=args.points)
+    data = (centres[labels] + rng.normal(size=(args.points, args.features))).astype(
+        "float32"
+    )
+    init = data[rng.choice(args.points, size=args.clusters, replace=False)]
+
+    scipy_vq, (expected_code, _) = _time(lambda: scipy.cluster.vq.vq(data, init))
+    scipy_kmeans2, (_, expected_label) = _time(
+        lambda: scipy.cluster.vq.kmeans2(data, init, iter=args.iter, minit="matrix")
+    )
+    print(f"{'backend':<10}{'fn':<18}{'time (s)':>10}{'scipy (s)':>11}{'same':>8}")
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        vq = sc_frontend.cluster.vq
+        x, code_book = ivy.array(data), ivy.array(init)
+        duration, (code, _) = _time(lambda: vq.vq(x, code_book))
+        same = np.mean(np.asarray(code) == expected_code)
+        print(f"{backend:<10}{'vq':<18}{duration:>10.3f}{scipy_vq:>11.3f}{same:>8.4f}")
+        duration, (_, label) = _time(
+            lambda: vq.kmeans2(x, code_book, iter=args.iter, minit="matrix")
+        )
+        same = np.mean(np.asarray(label) == expected_label)
+        print(
+            f"{backend:<10}{'kmeans2':<18}{duration:>10.3f}{scipy_kmeans2:>11.3f}"
+            f"{same:>8.4f}"
+        )
+        duration, (_, label) = _time(
+            lambda: vq.kmeans2(
+                x, code_book, iter=args.iter, minit="matrix", batch_size=args.batch_size
+            )
+        )
+        same = np.mean(np.asarray(label) == expected_label)
+        print(
+            f"{backend:<10}{'kmeans2 minibatch':<18}{duration:>10.3f}{'-':>11}"
+            f"{same:>8.4f}"
+        )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark of the forward pass of `ivy.lstm_update` and `ivy.lstm`.
+
+Times an lstm over `--seq-len` timesteps of a batch of sequences, padded and
+packed with lengths of between half and all of the timesteps, against the
+previous implementation of `ivy.lstm_update`, which runs every gate of every
+timestep through ivy's functions.
+
+Usage:
+    python scripts/benchmarks/lstm.py --seq-len 512 --batch 64 --hidden 256
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy.functional.ivy.layers import _pack_padded_sequence  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def _per_timestep_lstm_update(x, init_h, init_c, kernel, recurrent_kernel, bias):
+    # the time major `ivy.lstm_update` before the recurrence was vectorised
+    timesteps, batch_size, input_channels = x.shape
+    Wi_x = ivy.reshape(
+        ivy.matmul(ivy.reshape(x, (-1, input_channels)), kernel) + bias,
+        (timesteps, batch_size, -1),
+    )
+    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
+    ht, ct = init_h, init_c
+    hts_list = []
+    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
+        ivy.unstack(Wii_x, axis=0),
+        ivy.unstack(Wif_x, axis=0),
+        ivy.unstack(Wig_x, axis=0),
+        ivy.unstack(Wio_x, axis=0),
+    ):
+        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
+            ivy.matmul(ht, recurrent_kernel), num_or_size_splits=4, axis=-1
+        )
+        it = ivy.sigmoid(Wii_xt + Whi_htm1)
+        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
+        gt = ivy.tanh(Wig_xt + Whg_htm1)
+        ot = ivy.sigmoid(Wio_xt + Who_htm1)
+        ct = ft * ct + it * gt
+        ht = ot * ivy.tanh(ct)
+        hts_list.append(ivy.expand_dims(ht, axis=0))
+    return ivy.concat(hts_list, axis=0), (ht, ct)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--seq-len", type=int, default=512)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--hidden", type=int, default=256)
+    parser.add_argument("--input", type=int, default=128)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    T, B, H = args.seq_len, args.batch, args.hidden
+    x = rng.normal(size=(T, B, args.input)).astype("float32")
+    kernel = rng.normal(scale=0.1, size=(args.input, 4 * H)).astype("float32")
+    recurrent_kernel = rng.normal(scale=0.1, size=(H, 4 * H)).astype("float32")
+    bias = rng.normal(scale=0.1, size=(4 * H,)).astype("float32")
+    state = np.zeros((B, H), dtype="float32")
+    lengths = np.sort(rng.integers(T // 2, T + 1, size=B))[::-1].copy()
+    lengths[0] = T
+
+    print(f"{'backend':<10}{'lstm':<28}{'time (s)':>10}{'same':>6}")
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        weights = [ivy.array(w) for w in (kernel, recurrent_kernel, bias)]
+        x_, h0, c0 = ivy.array(x), ivy.array(state), ivy.array(state)
+        per_timestep, expected = _time(
+            lambda: _per_timestep_lstm_update(x_, h0, c0, *weights)
+        )
+        vectorised, ret = _time(
+            lambda: ivy.lstm_update(
+                x_, h0, c0, *weights[:2], bias=weights[2], time_major=True
+            )
+        )
+        same = np.allclose(ivy.to_numpy(ret[0]), ivy.to_numpy(expected[0]), atol=1e-4)
+        print(f"{backend:<10}{'lstm_update per timestep':<28}{per_timestep:>10.3f}")
+        print(f"{backend:<10}{'lstm_update':<28}{vectorised:>10.3f}{same!s:>6}")
+
+        # ivy.lstm takes the torch layout of the weights
+        all_weights = [
+            ivy.array(kernel.T),
+            ivy.array(recurrent_kernel.T),
+            weights[2],
+            ivy.zeros((4 * H,)),
+        ]
+        initial_states = (ivy.expand_dims(h0, axis=0), ivy.expand_dims(c0, axis=0))
+        padded, _ = _time(
+            lambda: ivy.lstm(x_, initial_states, all_weights, 1, 0.0, False, False)
+        )
+        data, batch_sizes = _pack_padded_sequence(x_, lengths)
+        packed, _ = _time(
+            lambda: ivy.lstm(
+                data,
+                initial_states,
+                all_weights,
+                1,
+                0.0,
+                False,
+                False,
+                batch_sizes=batch_sizes,
+            )
+        )
+        print(f"{backend:<10}{'lstm padded':<28}{padded:>10.3f}")
+        print(f"{backend:<10}{'lstm packed':<28}{packed:>10.3f}")
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
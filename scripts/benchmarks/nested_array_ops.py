@@ -0,0 +1,82 @@
+"""Benchmark of ops on `ivy.NestedArray` batches of variable length sequences.
+
+Builds a nested array of `--rows` rows of random lengths from a flat buffer and
+times an elementwise op, a per row reduction and the conversion to a padded
+dense array, which work on the packed values of all rows at once, against the
+same ops applied to each row in turn.
+
+Usage:
+    python scripts/benchmarks/nested_array_ops.py --rows 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def _per_row_padded(rows, max_length):
+    return ivy.stack(
+        [
+            ivy.concat([row, ivy.zeros((max_length - row.shape[0],), dtype=row.dtype)])
+            for row in rows
+        ]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--max-length", type=int, default=64)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    lengths = rng.integers(1, args.max_length + 1, size=args.rows)
+    values = rng.normal(size=int(lengths.sum())).astype("float32")
+
+    print(f"{'backend':<10}{'op':<12}{'packed (s)':>12}{'per row (s)':>13}{'same':>6}")
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        x = ivy.NestedArray.from_row_lengths(ivy.array(values), lengths.tolist())
+        rows = list(x.unbind())
+        max_length = int(lengths.max())
+        ops = {
+            "multiply": (
+                lambda: (x * 2.0).flat_values,
+                lambda: ivy.concat([row * 2.0 for row in rows]),
+            ),
+            "row_sum": (
+                lambda: x.row_sum(),
+                lambda: ivy.stack([ivy.sum(row) for row in rows]),
+            ),
+            "to_padded": (
+                lambda: x.to_padded(),
+                lambda: _per_row_padded(rows, max_length),
+            ),
+        }
+        for name, (packed_fn, per_row_fn) in ops.items():
+            packed, ret = _time(packed_fn)
+            per_row, expected = _time(per_row_fn)
+            same = np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected), atol=1e-4)
+            print(f"{backend:<10}{name:<12}{packed:>12.3f}{per_row:>13.3f}{same!s:>6}")
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark of the step time of the stateful optimizers in foreach mode.
+
+Times steps of each optimizer on `--leaves` variables of various shapes, one
+variable at a time through the `ivy.Container` of variables, and in foreach
+mode, where the variables are packed into one flat buffer per dtype and device
+and updated at once.
+
+Usage:
+    python scripts/benchmarks/optimizer_step.py --leaves 500 --steps 10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+_OPTIMIZERS = ("SGD", "LARS", "Adam", "AdamW", "LAMB")
+
+
+def _variables(shapes, rng):
+    return ivy.Container(
+        {
+            f"layer_{i}": ivy.array(rng.normal(size=shape).astype("float32"))
+            for i, shape in enumerate(shapes)
+        }
+    )
+
+
+def _time_steps(optimizer, v, grads, steps):
+    # the first step builds the state of the optimizer, and the flat layout in
+    # foreach mode
+    v = optimizer.step(v, grads)
+    start = time.perf_counter()
+    for _ in range(steps):
+        v = optimizer.step(v, grads)
+    return (time.perf_counter() - start) / steps, v
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--leaves", type=int, default=500)
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # alternating weights and biases of layers of various widths
+    widths = rng.integers(16, 128, size=args.leaves // 2 + 1)
+    shapes = []
+    for i in range(args.leaves):
+        width = int(widths[i // 2])
+        shapes.append((width, int(widths[i // 2 + 1])) if i % 2 == 0 else (width,))
+
+    print(
+        f"{'backend':<10}{'optimizer':<10}{'per leaf (ms)':>15}{'foreach (ms)':>14}"
+        f"{'speedup':>9}{'same':>6}"
+    )
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        v = _variables(shapes, np.random.default_rng(1))
+        grads = _variables(shapes, np.random.default_rng(2)) * 1e-2
+        for name in _OPTIMIZERS:
+            per_leaf, expected = _time_steps(
+                getattr(ivy, name)(lr=1e-3), v, grads, args.steps
+            )
+            foreach, ret = _time_steps(
+                getattr(ivy, name)(lr=1e-3, foreach=True), v, grads, args.steps
+            )
+            same = all(
+                np.allclose(ivy.to_numpy(x), ivy.to_numpy(y), atol=1e-5)
+                for x, y in zip(ret.cont_to_flat_list(), expected.cont_to_flat_list())
+            )
+            print(
+                f"{backend:<10}{name:<10}{per_leaf * 1e3:>15.2f}{foreach * 1e3:>14.2f}"
+                f"{per_leaf / foreach:>9.1f}{same!s:>6}"
+            )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark of the sparse matrices of the scipy frontend against dense arrays.
+
+Builds a random `--n` x `--n` `csr_matrix` with a fraction `--density` of
+entries, and times its product with a dense matrix of `--k` columns, its row
+sums, the selection of `--k` of its rows and `cg` on a diagonally dominant
+system made from it, against the same operations on the densified matrix, which
+takes `--n`**2 * 8 bytes. `connected_components` and `shortest_path` from
+`--k` nodes of the graph of the matrix are timed against scipy.sparse.csgraph.
+
+Usage:
+    python scripts/benchmarks/scipy_sparse.py --n 10000 --density 1e-3
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import scipy.sparse
+import scipy.sparse.csgraph
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+import ivy.functional.frontends.scipy as sc_frontend  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--n", type=int, default=10_000)
+    parser.add_argument("--density", type=float, default=1e-3)
+    parser.add_argument("--k", type=int, default=8)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+    # the numpy backend warns about the missing native sparse array on creation
+    logging.disable(logging.WARNING)
+
+    rng = np.random.default_rng(0)
+    csgraph = scipy.sparse.csgraph
+    a_sp = scipy.sparse.random(
+        args.n, args.n, density=args.density, format="csr", random_state=0
+    )
+    # diagonally dominant, so that cg converges
+    diagonal = 2 * args.n * args.density * scipy.sparse.eye(args.n)
+    spd_sp = (a_sp + a_sp.T + diagonal).tocsr()
+    X_np = rng.normal(size=(args.n, args.k))
+    b_np = rng.normal(size=args.n)
+    rows_np = rng.integers(0, args.n, size=args.k)
+    print(
+        f"{a_sp.nnz} entries, dense {args.n**2 * 8 / 2**20:.0f} MiB,"
+        f" sparse {a_sp.nnz * 16 / 2**20:.1f} MiB"
+    )
+
+    print(f"{'backend':<10}{'op':<22}{'sparse (s)':>12}{'other (s)':>11}{'same':>6}")
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        sparse = sc_frontend.sparse
+        a = sparse.csr_matrix((a_sp.data, a_sp.indices, a_sp.indptr), shape=a_sp.shape)
+        spd = sparse.csr_matrix(
+            (spd_sp.data, spd_sp.indices, spd_sp.indptr), shape=spd_sp.shape
+        )
+        dense, dense_spd = ivy.array(a_sp.toarray()), ivy.array(spd_sp.toarray())
+        X, b = ivy.array(X_np), ivy.array(b_np)
+        rows = ivy.array(rows_np)
+
+        results = {
+            "matmul": (lambda: a @ X, lambda: ivy.matmul(dense, X)),
+            "row sums": (lambda: a.sum(axis=1), lambda: ivy.sum(dense, axis=1)),
+            "row selection": (
+                lambda: a[rows_np].toarray(),
+                lambda: ivy.gather(dense, rows, axis=0),
+            ),
+            "cg": (
+                lambda: sparse.linalg.cg(spd, b)[0],
+                lambda: sparse.linalg.cg(dense_spd, b)[0],
+            ),
+            "connected_components": (
+                lambda: sparse.csgraph.connected_components(a, directed=False)[1],
+                lambda: csgraph.connected_components(a_sp, directed=False)[1],
+            ),
+            "shortest_path": (
+                lambda: sparse.csgraph.shortest_path(a, indices=rows_np),
+                lambda: csgraph.shortest_path(a_sp, indices=rows_np),
+            ),
+        }
+        for name, (sparse_fn, other_fn) in results.items():
+            sparse_time, ret = _time(sparse_fn)
+            other_time, expected = _time(other_fn)
+            same = np.allclose(
+                np.asarray(ret).reshape(-1), np.asarray(expected).reshape(-1), atol=1e-4
+            )
+            print(
+                f"{backend:<10}{name:<22}{sparse_time:>12.3f}{other_time:>11.3f}"
+                f"{same!s:>6}"
+            )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
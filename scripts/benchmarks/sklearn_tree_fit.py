@@ -0,0 +1,98 @@
+"""Benchmark of fitting the sklearn frontend's `DecisionTreeClassifier`.
+
+Fits a tree on synthetic data with the default best splitter, which evaluates
+every candidate split of a node with array ops, and with the per-sample split
+search (`node_split_best`), checking that both grow the same tree. The
+per-sample search takes minutes on a few hundred samples, so keep `--samples`
+small or pass `--skip-per-sample`.
+
+Usage:
+    python scripts/benchmarks/sklearn_tree_fit.py --samples 200 --features 4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy.functional.frontends.sklearn.tree import DecisionTreeClassifier  # noqa: E402
+from ivy.functional.frontends.sklearn.tree._criterion import Gini  # noqa: E402
+from ivy.functional.frontends.sklearn.tree._splitter import (  # noqa: E402
+    BestSplitter,
+    node_split_best,
+)
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+class _PerSampleSplitter(BestSplitter):
+    def node_split(self, impurity, split, n_constant_features):
+        return node_split_best(
+            self,
+            self.partitioner,
+            self.criterion,
+            impurity,
+            split,
+            n_constant_features,
+        )
+
+
+def _fit(X, y, max_depth, splitter):
+    start = time.perf_counter()
+    clf = DecisionTreeClassifier(
+        max_depth=max_depth, random_state=0, splitter=splitter
+    ).fit(X, y)
+    return time.perf_counter() - start, clf.tree_
+
+
+def _same_tree(tree, other):
+    return tree.node_count == other.node_count and all(
+        node.left_child == expected.left_child
+        and int(node.feature) == int(expected.feature)
+        and float(node.threshold) == float(expected.threshold)
+        for node, expected in zip(tree.nodes, other.nodes)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--features", type=int, default=4)
+    parser.add_argument("--classes", type=int, default=3)
+    parser.add_argument("--max-depth", type=int, default=4)
+    parser.add_argument("--skip-per-sample", action="store_true")
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(args.samples, args.features)).astype("float32")
+    w = rng.normal(size=(args.features, args.classes))
+    y = np.argmax(X @ w + rng.normal(scale=0.5, size=(args.samples, args.classes)), 1)
+
+    print(
+        f"{'backend':<12}{'vectorized (s)':>16}{'per-sample (s)':>16}"
+        f"{'same tree':>11}"
+    )
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        X_, y_ = ivy.array(X), ivy.array(y)
+        vectorized, tree = _fit(X_, y_, args.max_depth, "best")
+        per_sample, same = float("nan"), "-"
+        if not args.skip_per_sample:
+            splitter = _PerSampleSplitter(
+                Gini(1, ivy.array([args.classes])), args.features, 1, 0.0, 0
+            )
+            per_sample, other = _fit(X_, y_, args.max_depth, splitter)
+            same = str(_same_tree(tree, other))
+        print(f"{backend:<12}{vectorized:>16.2f}{per_sample:>16.2f}{same:>11}")
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark of the sparse kernels of `ivy.SparseArray` against scipy.sparse.
+
+Builds a random `--rows` x `--cols` matrix with a fraction `--density` of
+entries in the COO format, and times its conversions to CSR and CSC, which sort
+the entries rather than densify them, the products of the CSR matrix with a
+dense vector and with a dense matrix of `--k` columns, its row sums and the
+scaling of its values, against the same operations of scipy.sparse. The dense
+matrix would take `--rows` * `--cols` * 8 bytes, the sparse one about 24 bytes
+per entry.
+
+Usage:
+    python scripts/benchmarks/sparse_array.py --rows 1000000 --density 1e-4
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import scipy.sparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--cols", type=int, default=1_000_000)
+    parser.add_argument("--density", type=float, default=1e-4)
+    parser.add_argument("--k", type=int, default=8)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+    # the numpy backend warns about the missing native sparse array on creation
+    logging.disable(logging.WARNING)
+
+    rng = np.random.default_rng(0)
+    nnz = int(args.rows * args.cols * args.density)
+    rows = rng.integers(0, args.rows, size=nnz)
+    cols = rng.integers(0, args.cols, size=nnz)
+    values = rng.normal(size=nnz)
+    x_np = rng.normal(size=args.cols)
+    X_np = rng.normal(size=(args.cols, args.k))
+    print(
+        f"{nnz} entries, dense {args.rows * args.cols * 8 / 2**30:.1f} GiB,"
+        f" sparse {nnz * 24 / 2**30:.3f} GiB"
+    )
+
+    coo_sp = scipy.sparse.coo_matrix((values, (rows, cols)), (args.rows, args.cols))
+    csr_sp = coo_sp.tocsr()
+    reference = {
+        "coo to csr": (lambda: coo_sp.tocsr(), None),
+        "csr to csc": (lambda: csr_sp.tocsc(), None),
+        "spmv": (lambda: csr_sp @ x_np, csr_sp @ x_np),
+        "spmm": (lambda: csr_sp @ X_np, csr_sp @ X_np),
+        "row sums": (lambda: csr_sp.sum(axis=1), np.asarray(csr_sp.sum(axis=1))[:, 0]),
+        "scale": (lambda: csr_sp * 2.0, None),
+    }
+
+    print(f"{'backend':<10}{'op':<12}{'ivy (s)':>10}{'scipy (s)':>11}{'same':>6}")
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        coo = ivy.SparseArray(
+            coo_indices=np.stack((rows, cols)),
+            values=values,
+            dense_shape=(args.rows, args.cols),
+            format="coo",
+        )
+        csr = coo.to_csr()
+        x, X = ivy.array(x_np), ivy.array(X_np)
+        ops = {
+            "coo to csr": lambda: coo.to_csr(),
+            "csr to csc": lambda: csr.to_csc(),
+            "spmv": lambda: csr @ x,
+            "spmm": lambda: csr @ X,
+            "row sums": lambda: csr.sum(axis=1),
+            "scale": lambda: csr * 2.0,
+        }
+        for name, fn in ops.items():
+            duration, ret = _time(fn)
+            reference_fn, expected = reference[name]
+            scipy_duration, _ = _time(reference_fn)
+            same = "-" if expected is None else np.allclose(np.asarray(ret), expected)
+            print(
+                f"{backend:<10}{name:<12}{duration:>10.3f}{scipy_duration:>11.3f}"
+                f"{same!s:>6}"
+            )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
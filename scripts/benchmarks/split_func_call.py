@@ -0,0 +1,72 @@
+"""Benchmark of ivy.split_func_call, serially and with a process pool.
+
+Runs a compute-heavy function over a large batch in chunks, once calling the
+function on each chunk in turn, and once dispatching the chunks to a pool of
+worker processes with `executor="process"`.
+
+Usage:
+    python scripts/benchmarks/split_func_call.py --backends numpy torch
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+
+
+def _mlp(x, w):
+    for _ in range(8):
+        x = ivy.tanh(ivy.matmul(x, w))
+    return x
+
+
+class _MLP:
+    # picklable callable, so it can be sent to the worker processes
+    def __init__(self, w):
+        self.w = ivy.to_native(w)
+
+    def __call__(self, x):
+        return _mlp(x, self.w)
+
+
+def _timed(fn):
+    fn()
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--rows", type=int, default=65536)
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    args = parser.parse_args()
+    print(f"{os.cpu_count()} cpus, {args.rows} rows, chunks of {args.chunk_size}")
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        x = ivy.array(np.random.rand(args.rows, 512).astype(np.float32))
+        w = ivy.array(np.random.rand(512, 512).astype(np.float32) / 512)
+        fn = _MLP(w)
+        times = {}
+        for executor in (None, "process"):
+            times[executor] = _timed(
+                lambda: ivy.split_func_call(
+                    fn, [x], "concat", chunk_size=args.chunk_size, executor=executor
+                )
+            )
+        print(
+            f"{backend:<10}serial {times[None]:.3f} s, process pool"
+            f" {times['process']:.3f} s, {times[None] / times['process']:.1f}x"
+        )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
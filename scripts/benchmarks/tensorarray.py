@@ -0,0 +1,81 @@
+"""Benchmark of the tensorflow frontend `TensorArray` in an RNN-style loop.
+
+Writes one element per step into a dynamically sized `TensorArray` and stacks
+them at the end, with the shape of the elements known, in which case they are
+written into a preallocated dense buffer, and unknown, in which case they are
+kept as a list of tensors which is stacked at the end.
+
+Usage:
+    python scripts/benchmarks/tensorarray.py --steps 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+import ivy.functional.frontends.tensorflow as tf_frontend  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def _write_and_stack(steps, values, element_shape):
+    ta = tf_frontend.TensorArray(
+        tf_frontend.float32,
+        size=0,
+        dynamic_size=True,
+        infer_shape=element_shape is not None,
+        element_shape=element_shape,
+    )
+    start = time.perf_counter()
+    for step in range(steps):
+        ta = ta.write(step, values[step % len(values)])
+    write = time.perf_counter() - start
+    stack, ret = _time(ta.stack)
+    return write, stack, ret
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--steps", type=int, default=10_000)
+    parser.add_argument("--units", type=int, default=64)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    values_np = rng.normal(size=(16, args.units)).astype("float32")
+
+    print(
+        f"{'backend':<10}{'storage':<8}{'write (s)':>11}{'stack (s)':>11}"
+        f"{'total (s)':>11}{'same':>6}"
+    )
+    for backend in args.backends:
+        ivy.set_backend(backend)
+        values = [tf_frontend.constant(value) for value in values_np]
+        expected = None
+        for storage, element_shape in (("list", None), ("dense", (args.units,))):
+            write, stack, ret = _write_and_stack(args.steps, values, element_shape)
+            ret = ivy.to_numpy(ret.ivy_array)
+            expected = ret if expected is None else expected
+            same = np.array_equal(ret, expected)
+            print(
+                f"{backend:<10}{storage:<8}{write:>11.3f}{stack:>11.3f}"
+                f"{write + stack:>11.3f}{same!s:>6}"
+            )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark of `Tensor.backward` of the torch frontend on a residual MLP.
+
+Every residual block feeds its input both to its layers and to the skip
+connection, so the number of paths from the loss to the inputs doubles with each
+block. Times the backward pass, which runs each function of the graph once with
+the sum of the gradients flowing into it, against the previous recursive one,
+which ran the functions once per path.
+
+Usage:
+    python scripts/benchmarks/torch_frontend_backward.py --blocks 2 4 6
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+import ivy.functional.frontends.torch as torch_frontend  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+
+def _time(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def _recursive_backward(tensor, gradient):
+    # the backward pass as implemented before, following every path of the graph
+    grads = tensor.grad_fn(gradient)
+    for next_fn, grad in zip(tensor.grad_fn.next_functions, grads):
+        if next_fn.__self__.grad_fn is not None:
+            _recursive_backward(next_fn.__self__, grad)
+        else:
+            next_fn(grad)
+
+
+def _residual_mlp(x, weights):
+    h = x
+    for w in weights:
+        h = h + torch_frontend.tanh(torch_frontend.matmul(h, w))
+    return h.sum()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--blocks", type=int, nargs="+", default=[2, 4, 6])
+    parser.add_argument("--batch", type=int, default=4)
+    parser.add_argument("--hidden", type=int, default=8)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x_np = rng.normal(size=(args.batch, args.hidden)).astype("float32")
+    weights_np = [
+        rng.normal(scale=0.3, size=(args.hidden, args.hidden)).astype("float32")
+        for _ in range(max(args.blocks))
+    ]
+
+    print(
+        f"{'backend':<10}{'blocks':>7}{'sorted (s)':>12}{'recursive (s)':>15}"
+        f"{'same':>6}"
+    )
+    for backend in args.backends:
+        if backend in ("numpy", "paddle"):
+            # no gradients for numpy, and no backward pass for paddle
+            continue
+        ivy.set_backend(backend)
+        # warm up the backend before timing
+        weight = torch_frontend.tensor(weights_np[0], requires_grad=True)
+        _residual_mlp(torch_frontend.tensor(x_np), [weight]).backward()
+        for blocks in args.blocks:
+            grads = []
+            for backward in (
+                lambda loss: loss.backward(),
+                lambda loss: _recursive_backward(loss, torch_frontend.tensor(1.0)),
+            ):
+                weights = [
+                    torch_frontend.tensor(w, requires_grad=True)
+                    for w in weights_np[:blocks]
+                ]
+                loss = _residual_mlp(torch_frontend.tensor(x_np), weights)
+                duration, _ = _time(lambda: backward(loss))
+                grads.append((duration, [w.grad.ivy_array.to_numpy() for w in weights]))
+            (sorted_time, sorted_grads), (recursive_time, recursive_grads) = grads
+            same = all(
+                np.allclose(a, b, atol=1e-4)
+                for a, b in zip(sorted_grads, recursive_grads)
+            )
+            print(
+                f"{backend:<10}{blocks:>7}{sorted_time:>12.3f}{recursive_time:>15.3f}"
+                f"{same!s:>6}"
+            )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark of the startup latency of `ivy.with_backend`.
+
+Times `ivy.with_backend` in fresh processes, first with an empty on-disk cache
+of rewritten modules (cold), in which every module of ivy is parsed, rewritten
+and compiled, then with the cache the cold run filled (warm), in which the
+compiled modules are loaded from disk.
+
+Usage:
+    python scripts/benchmarks/with_backend_startup.py --repeats 3
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_SCRIPT = """
+import time
+import ivy
+
+start = time.perf_counter()
+ivy.with_backend({backend!r})
+print(time.perf_counter() - start)
+"""
+
+
+def _time_with_backend(backend, cache_dir):
+    env = {
+        **os.environ,
+        "IVY_AST_CACHE_DIR": cache_dir,
+        "PYTHONPATH": os.pathsep.join(filter(None, [_ROOT, os.getenv("PYTHONPATH")])),
+    }
+    out = subprocess.run(
+        [sys.executable, "-c", _SCRIPT.format(backend=backend)],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+        text=True,
+    ).stdout
+    return float(out.split()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+    print(f"{'backend':<12}{'cold (s)':>10}{'warm (s)':>10}{'speedup':>10}")
+    for backend in args.backends:
+        cold, warm = [], []
+        for _ in range(args.repeats):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                cold.append(_time_with_backend(backend, cache_dir))
+                warm.append(_time_with_backend(backend, cache_dir))
+        cold, warm = min(cold), min(warm)
+        print(f"{backend:<12}{cold:>10.2f}{warm:>10.2f}{cold / warm:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark of training boosters with the xgboost frontend.
+
+Trains the gblinear booster and the gbtree booster (hist tree method) on a
+synthetic non-linear binary classification task, the latter both for all
+`--rounds` rounds and with early stopping on a validation set, reporting the
+training time, the number of rounds trained and the validation error.
+
+Usage:
+    python scripts/benchmarks/xgboost_hist.py --samples 100000 --rounds 100
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import ivy  # noqa: E402
+from ivy.functional.frontends import xgboost  # noqa: E402
+from ivy_tests.test_ivy.helpers.available_frameworks import (  # noqa: E402
+    _available_frameworks,
+)
+
+_PARAMS = {
+    "base_score": None,
+    "base_margin": None,
+    "scale_pos_weight": None,
+    "learning_rate": 0.3,
+    "reg_alpha": 0.0,
+    "reg_lambda": 1.0,
+    "eval_metric": "error",
+}
+
+
+def _data(n_samples, n_features):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n_samples, n_features)).astype("float32")
+    logits = X[:, 0] * X[:, 1] + np.sin(2 * X[:, 2]) + X[:, 3]
+    noise = rng.logistic(scale=0.3, size=n_samples)
+    y = (logits + noise > 0).astype("float32").reshape(-1, 1)
+    return X, y
+
+
+def benchmark(backend, args):
+    ivy.set_backend(backend)
+    X, y = _data(args.samples + args.samples // 4, args.features)
+    X_train, y_train = ivy.array(X[: args.samples]), ivy.array(y[: args.samples])
+    X_val, y_val = ivy.array(X[args.samples :]), ivy.array(y[args.samples :])
+    evals = [(X_val, y_val, "val")]
+    runs = {
+        "gblinear": ({}, None),
+        "gbtree": ({"booster": "gbtree", "max_depth": args.max_depth}, None),
+        "gbtree + early stopping": (
+            {"booster": "gbtree", "max_depth": args.max_depth},
+            args.early_stopping_rounds,
+        ),
+    }
+    for name, (params, early_stopping_rounds) in runs.items():
+        evals_result = {}
+        start = time.perf_counter()
+        bst = xgboost.train(
+            {**_PARAMS, **params},
+            X_train,
+            y_train,
+            args.rounds,
+            evals=evals,
+            early_stopping_rounds=early_stopping_rounds,
+            evals_result=evals_result,
+            verbose_eval=False,
+        )
+        elapsed = time.perf_counter() - start
+        rounds = len(evals_result["val"]["error"])
+        error = evals_result["val"]["error"][-1]
+        print(f"{backend:<10}{name:<26}{elapsed:>10.2f}{rounds:>8}{error:>12.4f}")
+        del bst
+    ivy.previous_backend()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--samples", type=int, default=100_000)
+    parser.add_argument("--features", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--max-depth", type=int, default=6)
+    parser.add_argument("--early-stopping-rounds", type=int, default=5)
+    parser.add_argument("--backends", nargs="+", default=_available_frameworks())
+    args = parser.parse_args()
+    print(
+        f"{'backend':<10}{'booster':<26}{'time (s)':>10}{'rounds':>8}"
+        f"{'val error':>12}"
+    )
+    for backend in args.backends:
+        benchmark(backend, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -103,6 +103,7 @@ def eager_benchmark(
     args: Optional[Tuple[Any]] = None,
     kwargs: Optional[Dict[str, Any]] = None,
     output_path="./report.csv",
+    tracer: str = "replay",
 ):
     """Benchmark the function or module passed in input on the required
     backends and devices.
@@ -138,6 +139,11 @@ def eager_benchmark(
         The path to the csv file to write to. By default results are written to
         reports.csv in the folder from where the script it run
         (Default value = ``None``).
+    tracer
+        How the traced obj is created, either ``"replay"`` for
+        :func:`ivy.trace_replay`, which replays the backend calls recorded eagerly
+        and doesn't need the compiler binaries, or ``"graph"`` for
+        :func:`ivy.trace_graph` (Default value = ``"replay"``).
 
     Examples
     --------
@@ -234,12 +240,14 @@ def eager_benchmark(
                     args, kwargs = _move_to_device(
                         args=args, kwargs=kwargs, device=device
                     )
-                    if isinstance(obj_call, ivy.Module):
+                    if tracer == "replay":
+                        traced_fn = ivy.trace_replay(obj_call, args=args, kwargs=kwargs)
+                    elif isinstance(obj_call, ivy.Module):
                         obj_call_copy = copy.deepcopy(obj_call)
                         obj_call_copy.trace(args=args, kwargs=kwargs)
                         traced_fn = obj_call_copy
                     else:
-                        traced_fn = ivy.trace(obj_call, args=args, kwargs=kwargs)
+                        traced_fn = ivy.trace_graph(obj_call, args=args, kwargs=kwargs)
                     kwargs = ivy.default(kwargs, {})
                     args = ivy.default(args, ())
                     untraced_time = _compute_time(obj_call)(*args, **kwargs)